@@ -8,8 +8,16 @@ import json
 import sys
 import os
 import argparse
+import contextlib
+import queue
+import threading
+import time
+import uuid
+import zlib
+from collections import Counter, OrderedDict
 from pathlib import Path
 from difflib import SequenceMatcher
+from functools import lru_cache
 import re
 
 try:
@@ -17,13 +25,23 @@ try:
 except ImportError:
     Llama = None
 
+try:
+    from llama_cpp import LlamaGrammar
+except ImportError:
+    LlamaGrammar = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 try:
     from huggingface_hub import hf_hub_download
 except ImportError:
     hf_hub_download = None
 
 try:
-    from flask import Flask, request, jsonify
+    from flask import Flask, Response, request, jsonify
 except ImportError:
     Flask = None
 
@@ -46,6 +64,234 @@ def load_canonical_lists():
     return universities, programs
 
 
+def load_aliases(alias_file=None):
+    """Load ``alias => canonical name`` pairs from the alias file."""
+    path = Path(alias_file or os.getenv('CANON_ALIASES') or Path(__file__).parent / "canon_aliases.txt")
+    aliases = {}
+    if not path.exists():
+        return aliases
+    
+    for line in path.read_text(encoding='utf-8').split('\n'):
+        line = line.strip()
+        if not line or line.startswith('#') or '=>' not in line:
+            continue
+        alias, canonical = (part.strip() for part in line.split('=>', 1))
+        if alias and canonical:
+            aliases[alias] = canonical
+    
+    return aliases
+
+
+def fold_name(text):
+    """Case-fold and collapse whitespace/punctuation so lookups ignore formatting."""
+    return ' '.join(re.sub(r'[.,]', ' ', text.casefold()).split())
+
+
+EMBED_THRESHOLD = float(os.getenv('EMBED_THRESHOLD', 0.4))
+# Lead the best name needs over the next different one ("Computer Engineering"
+# scores about the same against two EECS names, so neither is taken)
+EMBED_MARGIN = float(os.getenv('EMBED_MARGIN', 0.1))
+
+
+class EmbeddingIndex:
+    """Cosine nearest-neighbour index over canonical names (requires NumPy).
+    
+    Names are embedded with a hashed vectorizer: character trigrams, whole
+    words, and for canonical names their initials ("Electrical Engineering
+    and Computer Science" -> "eecs"), IDF-weighted so boilerplate such as
+    "University of" carries little signal.  A whole batch of queries is
+    scored against every name with a single matrix multiply.
+    """
+    
+    STOPWORDS = frozenset({'of', 'and', 'the', 'in', 'at', 'for'})
+    DEGREES = frozenset({'phd', 'ms', 'ma', 'msc', 'mba', 'meng', 'mph'})
+    
+    def __init__(self, names, dim=4096):
+        self.names = list(names)
+        self.dim = dim
+        vectors = self._vectorize(self.names, canonical=True)
+        df = (vectors > 0).sum(axis=0)
+        self.idf = (np.log((1 + len(self.names)) / (1 + df)) + 1).astype(np.float32)
+        self.matrix = self._normalize(vectors * self.idf)
+    
+    def _features(self, text, canonical):
+        folded = fold_name(text)
+        padded = f' {folded} '
+        features = [(padded[i:i + 3], 1.0) for i in range(len(padded) - 2)]
+        words = folded.split()
+        features += [('w:' + w, 2.0) for w in words]
+        if canonical:
+            initials = self._initials(words)
+            if initials:
+                features.append(('w:' + initials, 4.0))
+        return features
+    
+    def _initials(self, words):
+        """Acronym of the meaningful words ("eecs"), or None for a single word."""
+        core = [w for w in words if w not in self.STOPWORDS and w not in self.DEGREES]
+        return ''.join(w[0] for w in core) if len(core) > 1 else None
+    
+    def _core(self, name):
+        """Name without degree words, so "Statistics MS" and "Statistics" compare equal."""
+        return [w for w in fold_name(name).split() if w not in self.DEGREES]
+    
+    def _vectorize(self, texts, canonical=False):
+        vectors = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for feature, weight in self._features(text, canonical):
+                vectors[row, zlib.crc32(feature.encode('utf-8')) % self.dim] += weight
+        return vectors
+    
+    @staticmethod
+    def _normalize(vectors):
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.maximum(norms, 1e-9)
+    
+    def search(self, texts, k=1):
+        """Return ``(indices, scores)`` arrays of the top-``k`` names for each text."""
+        queries = self._normalize(self._vectorize(texts) * self.idf)
+        scores = queries @ self.matrix.T
+        k = min(k, len(self.names))
+        top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        order = np.argsort(-np.take_along_axis(scores, top, axis=1), axis=1)
+        top = np.take_along_axis(top, order, axis=1)
+        return top, np.take_along_axis(scores, top, axis=1)
+    
+    def best(self, texts, k=8):
+        """Return ``(name, score, margin)`` of the nearest canonical name for each text.
+        
+        ``margin`` is the score lead over the nearest name that is not a degree
+        variant of the winner (0 when there is none among the top ``k``).
+        """
+        indices, scores = self.search(texts, k=k)
+        results = []
+        for row, row_scores in zip(indices, scores):
+            name, score = self.names[row[0]], float(row_scores[0])
+            core = self._core(name)
+            runner_up = next((float(s) for i, s in zip(row[1:], row_scores[1:])
+                              if self._core(self.names[i]) != core), 0.0)
+            results.append((name, score, score - runner_up))
+        return results
+    
+    def covers(self, text, name):
+        """Check that every word of ``text`` is accounted for by ``name``.
+        
+        A word counts if it begins a word of the name ("Univ"), is a near
+        spelling of one with the same first letter ("Jonhs"), or is its
+        initials ("EECS").  Cosine similarity alone scores "Boston College"
+        close to "Boston University" because most of their trigrams agree.
+        """
+        words = fold_name(name).split()
+        initials = self._initials(words)
+        for word in fold_name(text).split():
+            if word in self.STOPWORDS or word == initials:
+                continue
+            if not any(w.startswith(word) or (w[0] == word[0] and
+                                              SequenceMatcher(None, word, w).ratio() >= 0.8)
+                       for w in words):
+                return False
+        return True
+
+
+class CanonicalLookup:
+    """Precomputed exact / case-folded / alias table in front of fuzzy matching.
+    
+    Hits resolve with a dictionary lookup; only misses pay for the
+    ``SequenceMatcher`` scan (or the LLM).  Every resolution is tallied by
+    tier so callers can report how much traffic each tier absorbs.
+    """
+    
+    TIERS = ('exact', 'casefold', 'alias', 'embedding', 'fuzzy', 'llm', 'unresolved')
+    
+    def __init__(self, names, aliases=None):
+        self.names = list(dict.fromkeys(names))
+        self.exact = set(self.names)
+        self.folded = {}
+        for name in self.names:
+            self.folded.setdefault(fold_name(name), name)
+        # Only keep aliases that point into this list (universities vs programs)
+        self.aliases = {}
+        for alias, canonical in (aliases or {}).items():
+            if canonical in self.exact:
+                self.aliases.setdefault(fold_name(alias), canonical)
+        self.index = EmbeddingIndex(self.names) if np is not None and self.names else None
+        self.stats = Counter()
+        self._lock = threading.Lock()
+    
+    def __len__(self):
+        return len(self.names)
+    
+    def record(self, tier):
+        with self._lock:
+            self.stats[tier] += 1
+    
+    def lookup(self, text):
+        """Resolve via the O(1) tiers only; returns None (and records nothing) on a miss."""
+        if not text:
+            return None
+        text = text.strip()
+        if text in self.exact:
+            self.record('exact')
+            return text
+        key = fold_name(text)
+        if key in self.folded:
+            self.record('casefold')
+            return self.folded[key]
+        if key in self.aliases:
+            self.record('alias')
+            return self.aliases[key]
+        return None
+    
+    def resolve_batch(self, texts, threshold=None):
+        """Resolve many values: O(1) tiers first, then one embedding search for the misses.
+        
+        An embedding match is taken only when it scores at least ``threshold``,
+        leads the next different name by ``EMBED_MARGIN`` and covers every
+        word of the text.  Returns a canonical name per text, or None where
+        no tier is confident (those rows go on to the LLM or fuzzy matching).
+        """
+        names = [self.lookup(text) for text in texts]
+        misses = [i for i, name in enumerate(names) if name is None and (texts[i] or '').strip()]
+        if misses and self.index is not None:
+            threshold = EMBED_THRESHOLD if threshold is None else threshold
+            for i, (name, score, margin) in zip(misses, self.index.best([texts[i] for i in misses])):
+                # Near misses ("... at Dallas" -> "... at Austin") go on to the LLM
+                if score >= threshold and margin >= EMBED_MARGIN and self.index.covers(texts[i], name):
+                    names[i] = name
+                    self.record('embedding')
+        return names
+    
+    def fuzzy(self, text, threshold=0.6):
+        """Full similarity scan; the slow path for values no other tier resolved."""
+        name = fuzzy_match(text, self.names, threshold)
+        self.record('fuzzy' if name else 'unresolved')
+        return name
+    
+    def match(self, text, threshold=0.6):
+        """Resolve via the O(1) tiers, falling through to fuzzy matching on a miss."""
+        return self.lookup(text) or self.fuzzy(text, threshold)
+    
+    def report(self):
+        """Return ``{tier: fraction}`` over all resolutions recorded so far."""
+        with self._lock:
+            total = sum(self.stats.values())
+            return {tier: round(self.stats[tier] / total, 4) if total else 0.0 for tier in self.TIERS}
+
+
+def load_lookups(alias_file=None):
+    """Build the university and program lookup tables from the canonical lists + aliases."""
+    universities, programs = load_canonical_lists()
+    aliases = load_aliases(alias_file)
+    return CanonicalLookup(universities, aliases), CanonicalLookup(programs, aliases)
+
+
+def print_tier_report(universities, programs):
+    """Print what fraction of values each resolution tier handled."""
+    for label, lookup in (('University', universities), ('Program', programs)):
+        shares = ', '.join(f"{tier} {frac:.1%}" for tier, frac in lookup.report().items() if frac)
+        print(f"  {label} tiers: {shares or 'n/a'}", file=sys.stderr)
+
+
 def fuzzy_match(text, candidates, threshold=0.6):
     """Find best matching canonical name using fuzzy matching."""
     if not text or not candidates:
@@ -64,13 +310,101 @@ def fuzzy_match(text, candidates, threshold=0.6):
     return best_match
 
 
-def parse_with_llm(model, entry):
-    """Use LLM to standardize program and university names."""
+# GBNF grammar for the two-key answer object: with it llama.cpp can only emit
+# well-formed JSON, so no repair or retry is needed after generation.  Strings
+# are capped at ``max_chars`` characters (filled in with ``str.format``) so the
+# object always closes within ``grammar_token_budget`` tokens; an unbounded
+# string could be cut off by the token cap and leave invalid JSON.
+JSON_GRAMMAR = r'''
+root   ::= "{{" ws "\"program\":" ws string "," ws "\"university\":" ws string ws "}}"
+string ::= "\"" char{{0,{max_chars}}} "\""
+char   ::= [^"\\\n] | "\\" ["\\/bfnrt]
+ws     ::= " "?
+'''
+
+LLM_MAX_FIELD_CHARS = int(os.getenv('LLM_MAX_FIELD_CHARS', 96))
+
+# The JSON grammar's output with every optional space present and empty values
+_JSON_FRAME = '{ "program": "", "university": "" }'
+# One grammar ``char`` is at most 4 UTF-8 bytes, and a token is at least one
+# byte, so a character never costs more than 4 tokens
+_MAX_CHAR_BYTES = 4
+
+
+def grammar_token_budget(max_chars):
+    """Tokens that always suffice for ``JSON_GRAMMAR`` with ``max_chars``-long strings."""
+    return len(_JSON_FRAME) + 2 * max_chars * _MAX_CHAR_BYTES
+
+
+def gbnf_alternatives(names):
+    """GBNF alternation matching any of ``names`` as a JSON string literal."""
+    literals = []
+    for name in names:
+        quoted = json.dumps(name, ensure_ascii=False)
+        literals.append('"' + quoted.replace('\\', '\\\\').replace('"', '\\"') + '"')
+    return ' | '.join(literals)
+
+
+def top_candidates(text, names, k=8):
+    """The ``k`` canonical names most similar to ``text``."""
+    text = (text or '').lower().strip()
+    scored = sorted(names, key=lambda name: SequenceMatcher(None, text, name.lower()).ratio(), reverse=True)
+    return scored[:k]
+
+
+@lru_cache(maxsize=256)
+def _compile_grammar(text):
+    return LlamaGrammar.from_string(text, verbose=False)
+
+
+def build_grammar(mode, entry=None, universities=None, programs=None):
+    """Return ``(compiled grammar, max_tokens)`` for ``mode`` (``json`` or ``vocab``).
+    
+    ``max_tokens`` is always enough for the grammar to close the object.
+    ``vocab`` restricts each field to the closest canonical names plus the
+    raw input (so unknown schools pass through unchanged); it needs the
+    lookup tables and otherwise degrades to ``json``.  Free decoding
+    returns ``(None, None)``.
+    """
+    if mode == 'free' or LlamaGrammar is None:
+        return None, None
+    if mode == 'vocab' and universities is not None and programs is not None:
+        fields = []
+        budget = len('{"program": , "university": }')
+        for key, lookup in (('program', programs), ('university', universities)):
+            raw = (entry.get(key, '') or '').strip()
+            if lookup.index is not None:
+                indices, _ = lookup.index.search([raw], k=8)
+                names = [lookup.names[i] for i in indices[0]]
+            else:
+                names = top_candidates(raw, lookup.names)
+            if raw and raw not in names:
+                names.append(raw)
+            fields.append(gbnf_alternatives(names))
+            budget += max((len(json.dumps(name, ensure_ascii=False).encode('utf-8')) for name in names), default=0)
+        text = (
+            'root ::= "{\\"program\\": " program ", \\"university\\": " university "}"\n'
+            f'program ::= {fields[0]}\n'
+            f'university ::= {fields[1]}\n'
+        )
+        return _compile_grammar(text), budget
+    text = JSON_GRAMMAR.format(max_chars=LLM_MAX_FIELD_CHARS)
+    return _compile_grammar(text), grammar_token_budget(LLM_MAX_FIELD_CHARS)
+
+
+def parse_with_llm(model, entry, universities=None, programs=None, decoding=None):
+    """Use LLM to standardize program and university names.
+    
+    ``decoding`` (default ``$LLM_DECODING`` or ``json``) selects free-form
+    generation (``free``), JSON-schema grammar (``json``), or grammar
+    restricted to canonical candidates (``vocab``).
+    """
     if not model:
         return entry
     
     program_text = entry.get('program', '') or ''
     university_text = entry.get('university', '') or ''
+    decoding = decoding or os.getenv('LLM_DECODING', 'json')
     
     prompt = f"""You are a data standardizer. Given program and university names from a grad school database, output standardized names.
 
@@ -85,6 +419,21 @@ Input:
 JSON output:"""
     
     try:
+        grammar, max_tokens = build_grammar(decoding, entry, universities, programs)
+        if grammar is not None:
+            # The grammar terminates the object itself, normally long before the cap
+            response = model(
+                prompt,
+                max_tokens=max_tokens,
+                temperature=0.1,
+                top_p=0.9,
+                grammar=grammar,
+            )
+            result = json.loads(response['choices'][0]['text'])
+            entry['llm_generated_program'] = result.get('program', program_text)
+            entry['llm_generated_university'] = result.get('university', university_text)
+            return entry
+        
         response = model(
             prompt,
             max_tokens=200,
@@ -115,52 +464,196 @@ JSON output:"""
 
 
 def standardize_with_fallback(entry, universities, programs):
-    """Standardize using fuzzy matching as fallback."""
+    """Standardize using the alias table, with fuzzy matching as fallback."""
     program_text = entry.get('program', '') or ''
     university_text = entry.get('university', '') or ''
     
-    # Try fuzzy matching
-    entry['llm_generated_program'] = fuzzy_match(program_text, programs) or program_text
-    entry['llm_generated_university'] = fuzzy_match(university_text, universities) or university_text
+    # Exact/alias hits first, fuzzy matching only on a miss
+    entry['llm_generated_program'] = programs.match(program_text) or program_text
+    entry['llm_generated_university'] = universities.match(university_text) or university_text
     
     return entry
 
 
-def process_file(input_file, output_mode='stdout', use_llm=True):
+def standardize_batch(entries, model, universities, programs):
+    """Standardize a batch of entries, cheapest tier first.
+    
+    Alias-table and embedding hits are resolved for the whole batch at once;
+    only rows with a field still unresolved reach the LLM (or, without a
+    model, fuzzy matching).
+    """
+    program_hits = programs.resolve_batch([e.get('program', '') or '' for e in entries])
+    university_hits = universities.resolve_batch([e.get('university', '') or '' for e in entries])
+    
+    for i, (program, university) in enumerate(zip(program_hits, university_hits)):
+        entry = entries[i]
+        program_text = entry.get('program', '') or ''
+        university_text = entry.get('university', '') or ''
+        
+        if program and university:
+            entry['llm_generated_program'] = program
+            entry['llm_generated_university'] = university
+        elif model:
+            entry = entries[i] = parse_with_llm(model, entry, universities, programs)
+            # Keep whichever field a cheaper tier already resolved
+            for key, hit, lookup in (('llm_generated_program', program, programs),
+                                     ('llm_generated_university', university, universities)):
+                if hit:
+                    entry[key] = hit
+                else:
+                    lookup.record('llm')
+        else:
+            entry['llm_generated_program'] = program or programs.fuzzy(program_text) or program_text
+            entry['llm_generated_university'] = university or universities.fuzzy(university_text) or university_text
+    
+    return entries
+
+
+def standardize_entry(entry, model, universities, programs):
+    """Standardize one entry (see ``standardize_batch``)."""
+    return standardize_batch([entry], model, universities, programs)[0]
+
+
+def load_model(use_llm=True):
+    """Download (if needed) and load the GGUF model; return None when unavailable."""
+    if not use_llm:
+        print(f"Using fuzzy matching (LLM disabled)...", file=sys.stderr)
+        return None
+    if not (Llama and hf_hub_download):
+        print(f"LLM dependencies not available, using fuzzy matching...", file=sys.stderr)
+        return None
+    
+    print(f"Initializing LLM model (first run may take a minute to download)...", file=sys.stderr)
+    try:
+        model_repo = os.getenv('MODEL_REPO', 'TheBloke/TinyLlama-1.1B-Chat-v1.0-GGUF')
+        model_file = os.getenv('MODEL_FILE', 'tinyllama-1.1b-chat-v1.0.Q4_K_M.gguf')
+        n_gpu_layers = int(os.getenv('N_GPU_LAYERS', 0))
+        n_ctx = int(os.getenv('N_CTX', 2048))
+        
+        # Download model if needed
+        model_path = hf_hub_download(repo_id=model_repo, filename=model_file)
+        
+        # Load model
+        model = Llama(
+            model_path=model_path,
+            n_ctx=n_ctx,
+            n_gpu_layers=n_gpu_layers,
+            verbose=False
+        )
+        print(f"LLM loaded successfully", file=sys.stderr)
+        return model
+    except Exception as e:
+        print(f"Failed to load LLM: {e}", file=sys.stderr)
+        print(f"Falling back to fuzzy matching...", file=sys.stderr)
+        return None
+
+
+def iter_json_records(input_file, chunk_size=1 << 16):
+    """Yield records one at a time from a JSON array, a single object, or JSONL.
+    
+    The file is read in ``chunk_size`` pieces and decoded incrementally with
+    ``JSONDecoder.raw_decode``, so memory stays bounded by the largest single
+    record instead of the whole file.
+    """
+    decoder = json.JSONDecoder()
+    with open(input_file, 'r', encoding='utf-8') as f:
+        buf = ''
+        pos = 0
+        eof = False
+        in_array = None
+        
+        while True:
+            # Skip whitespace between values (and commas inside an array)
+            while pos < len(buf) and (buf[pos].isspace() or (in_array and buf[pos] == ',')):
+                pos += 1
+            
+            if pos == len(buf):
+                if eof:
+                    break
+                buf = f.read(chunk_size)
+                pos = 0
+                eof = not buf
+                continue
+            
+            # First significant character decides between array and JSONL input
+            if in_array is None:
+                in_array = buf[pos] == '['
+                if in_array:
+                    pos += 1
+                continue
+            
+            if in_array and buf[pos] == ']':
+                break
+            
+            try:
+                record, end = decoder.raw_decode(buf, pos)
+                # A number or literal is only final once a delimiter follows it:
+                # "12" + "34" and "-6." + "5" may continue in the next chunk
+                complete = (eof or buf[end - 1] in '}]"'
+                            or (end < len(buf) and (buf[end].isspace() or buf[end] in ',]}')))
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                complete = False
+            
+            if not complete:
+                # Record is split across chunks: keep the tail and read more
+                chunk = f.read(chunk_size)
+                eof = not chunk
+                buf = buf[pos:] + chunk
+                pos = 0
+                continue
+            
+            pos = end
+            yield record
+
+
+def stream_file(input_file, out, use_llm=True, batch_size=100, alias_file=None):
+    """Standardize records one by one and write JSONL to ``out`` in flushed batches.
+    
+    ``out`` is a binary stream (e.g. ``sys.stdout.buffer`` or a file opened
+    with ``'wb'``).  Nothing is accumulated in memory, so downstream readers
+    can start consuming output as soon as the first batch is flushed.
+    """
+    print(f"Loading canonical lists...", file=sys.stderr)
+    universities, programs = load_lookups(alias_file)
+    model = load_model(use_llm)
+    
+    print(f"Streaming records from {input_file}...", file=sys.stderr)
+    count = 0
+    pending = []
+    
+    def flush(batch):
+        batch = standardize_batch(batch, model, universities, programs)
+        out.write(b''.join((json.dumps(e, ensure_ascii=False) + '\n').encode('utf-8') for e in batch))
+        out.flush()
+    
+    for entry in iter_json_records(input_file):
+        pending.append(entry)
+        count += 1
+        
+        if len(pending) >= batch_size:
+            flush(pending)
+            pending = []
+        if count % 100 == 0:
+            print(f"  Progress: {count}", file=sys.stderr)
+    
+    if pending:
+        flush(pending)
+    
+    print(f"Done! Streamed {count} entries.", file=sys.stderr)
+    print_tier_report(universities, programs)
+    return count
+
+
+def process_file(input_file, output_mode='stdout', use_llm=True, alias_file=None):
     """Process JSON file and standardize names."""
     print(f"Loading canonical lists...", file=sys.stderr)
-    universities, programs = load_canonical_lists()
+    universities, programs = load_lookups(alias_file)
     print(f"  Universities: {len(universities)}", file=sys.stderr)
     print(f"  Programs: {len(programs)}", file=sys.stderr)
     
-    model = None
-    if use_llm and Llama and hf_hub_download:
-        print(f"Initializing LLM model (first run may take a minute to download)...", file=sys.stderr)
-        try:
-            model_repo = os.getenv('MODEL_REPO', 'TheBloke/TinyLlama-1.1B-Chat-v1.0-GGUF')
-            model_file = os.getenv('MODEL_FILE', 'tinyllama-1.1b-chat-v1.0.Q4_K_M.gguf')
-            n_gpu_layers = int(os.getenv('N_GPU_LAYERS', 0))
-            n_ctx = int(os.getenv('N_CTX', 2048))
-            
-            # Download model if needed
-            model_path = hf_hub_download(repo_id=model_repo, filename=model_file)
-            
-            # Load model
-            model = Llama(
-                model_path=model_path,
-                n_ctx=n_ctx,
-                n_gpu_layers=n_gpu_layers,
-                verbose=False
-            )
-            print(f"LLM loaded successfully", file=sys.stderr)
-        except Exception as e:
-            print(f"Failed to load LLM: {e}", file=sys.stderr)
-            print(f"Falling back to fuzzy matching...", file=sys.stderr)
-            model = None
-    elif not use_llm:
-        print(f"Using fuzzy matching (LLM disabled)...", file=sys.stderr)
-    else:
-        print(f"LLM dependencies not available, using fuzzy matching...", file=sys.stderr)
+    model = load_model(use_llm)
     
     # Load and process data
     print(f"Loading data from {input_file}...", file=sys.stderr)
@@ -173,16 +666,9 @@ def process_file(input_file, output_mode='stdout', use_llm=True):
     print(f"Processing {len(data)} entries...", file=sys.stderr)
     
     processed = []
-    for i, entry in enumerate(data):
-        if i % 100 == 0:
-            print(f"  Progress: {i}/{len(data)}", file=sys.stderr)
-        
-        if model:
-            entry = parse_with_llm(model, entry)
-        else:
-            entry = standardize_with_fallback(entry, universities, programs)
-        
-        processed.append(entry)
+    for i in range(0, len(data), 100):
+        print(f"  Progress: {i}/{len(data)}", file=sys.stderr)
+        processed.extend(standardize_batch(data[i:i + 100], model, universities, programs))
     
     # Output results
     if output_mode == 'stdout':
@@ -202,9 +688,192 @@ def process_file(input_file, output_mode='stdout', use_llm=True):
         sys.stdout.buffer.write(output.encode('utf-8'))
     
     print(f"Done! Processed {len(processed)} entries.", file=sys.stderr)
+    print_tier_report(universities, programs)
     return processed
 
 
+class JobQueue:
+    """Bounded queue of standardization jobs drained by background worker threads.
+    
+    Each submitted batch becomes a job with its own progress counters.  When
+    the queue already holds ``max_pending`` jobs, ``submit`` raises
+    ``queue.Full`` so the HTTP layer can answer 429 instead of piling up work.
+    """
+    
+    def __init__(self, model, universities, programs, workers=1, max_pending=16, max_finished=100,
+                 chunk_size=32):
+        self.model = model
+        self.chunk_size = chunk_size
+        self.universities = universities
+        self.programs = programs
+        self.max_finished = max_finished
+        self.jobs = OrderedDict()
+        self.pending = queue.Queue(maxsize=max_pending)
+        self.lock = threading.Lock()
+        # llama.cpp contexts are not thread-safe, so model calls are serialized
+        self.model_lock = threading.Lock()
+        
+        for _ in range(max(1, workers)):
+            threading.Thread(target=self._worker, daemon=True).start()
+    
+    def submit(self, entries):
+        """Queue a batch and return its job ID (raises queue.Full when saturated)."""
+        job_id = uuid.uuid4().hex
+        job = {
+            'id': job_id,
+            'status': 'queued',
+            'total': len(entries),
+            'processed': 0,
+            'errors': 0,
+            'submitted_at': time.time(),
+            'started_at': None,
+            'finished_at': None,
+            'results': [],
+            'entries': entries,
+            'cond': threading.Condition(),
+        }
+        with self.lock:
+            self.pending.put_nowait(job_id)
+            self.jobs[job_id] = job
+            self._evict_finished()
+        return job_id
+    
+    def get(self, job_id):
+        with self.lock:
+            return self.jobs.get(job_id)
+    
+    def snapshot(self, job_id, include_results=False):
+        """Return a JSON-safe view of a job's progress (None if unknown)."""
+        job = self.get(job_id)
+        if job is None:
+            return None
+        with job['cond']:
+            view = {k: job[k] for k in ('id', 'status', 'total', 'processed', 'errors',
+                                        'submitted_at', 'started_at', 'finished_at')}
+            view['queue_depth'] = self.pending.qsize()
+            if include_results:
+                view['results'] = list(job['results'])
+        return view
+    
+    def iter_results(self, job_id, timeout=30.0):
+        """Yield results of a job as they are produced, until it finishes."""
+        job = self.get(job_id)
+        sent = 0
+        while True:
+            with job['cond']:
+                while sent == len(job['results']) and job['status'] != 'done':
+                    if not job['cond'].wait(timeout):
+                        break
+                batch = job['results'][sent:]
+                done = job['status'] == 'done'
+            for entry in batch:
+                yield entry
+            sent += len(batch)
+            if done and sent == len(job['results']):
+                return
+    
+    def _evict_finished(self):
+        # Keep memory bounded: forget the oldest finished jobs first
+        finished = [jid for jid, j in self.jobs.items() if j['status'] == 'done']
+        for jid in finished[:max(0, len(finished) - self.max_finished)]:
+            del self.jobs[jid]
+    
+    def _worker(self):
+        while True:
+            job = self.get(self.pending.get())
+            if job is None:
+                continue
+            with job['cond']:
+                job['status'] = 'running'
+                job['started_at'] = time.time()
+            
+            entries, job['entries'] = job['entries'], None
+            for i in range(0, len(entries), self.chunk_size):
+                chunk = entries[i:i + self.chunk_size]
+                try:
+                    # Only the model needs serialising; table lookups run unlocked
+                    with (self.model_lock if self.model else contextlib.nullcontext()):
+                        chunk = standardize_batch(chunk, self.model, self.universities, self.programs)
+                    failed = 0
+                except Exception as e:
+                    print(f"Job {job['id']} batch error: {e}", file=sys.stderr)
+                    failed = len(chunk)
+                with job['cond']:
+                    job['results'].extend(chunk)
+                    job['processed'] += len(chunk)
+                    job['errors'] += failed
+                    job['cond'].notify_all()
+            
+            with job['cond']:
+                job['status'] = 'done'
+                job['finished_at'] = time.time()
+                job['cond'].notify_all()
+
+
+def create_app(model, universities, programs, jobs):
+    """Flask app serving the standardizer; ``jobs`` owns the background queue."""
+    app = Flask(__name__)
+    
+    @app.route('/standardize', methods=['POST'])
+    def standardize():
+        try:
+            data = request.get_json()
+            if not isinstance(data, list):
+                data = [data]
+            
+            # Shares the model with the job workers, so it takes their lock
+            with (jobs.model_lock if model else contextlib.nullcontext()):
+                results = standardize_batch(data, model, universities, programs)
+            return jsonify(results)
+        except Exception as e:
+            return jsonify({'error': str(e)}), 400
+    
+    @app.route('/jobs', methods=['POST'])
+    def submit_job():
+        """Queue a batch for background standardization; returns 202 + job ID."""
+        data = request.get_json(silent=True)
+        if data is None:
+            return jsonify({'error': 'expected a JSON object or array'}), 400
+        if not isinstance(data, list):
+            data = [data]
+        try:
+            job_id = jobs.submit(data)
+        except queue.Full:
+            resp = jsonify({'error': 'job queue is full, retry later'})
+            resp.headers['Retry-After'] = '5'
+            return resp, 429
+        return jsonify({'job_id': job_id, 'status_url': f'/jobs/{job_id}'}), 202
+    
+    @app.route('/jobs/<job_id>', methods=['GET'])
+    def job_status(job_id):
+        """Progress counters; results are included once the job is done (or with ?results=1)."""
+        job = jobs.snapshot(job_id)
+        if job is None:
+            return jsonify({'error': 'unknown job'}), 404
+        if job['status'] == 'done' or request.args.get('results'):
+            job = jobs.snapshot(job_id, include_results=True)
+        return jsonify(job)
+    
+    @app.route('/jobs/<job_id>/stream', methods=['GET'])
+    def job_stream(job_id):
+        """Stream a job's results as JSONL while workers produce them."""
+        if jobs.get(job_id) is None:
+            return jsonify({'error': 'unknown job'}), 404
+        lines = (json.dumps(entry, ensure_ascii=False) + '\n' for entry in jobs.iter_results(job_id))
+        return Response(lines, mimetype='application/x-ndjson')
+    
+    @app.route('/stats', methods=['GET'])
+    def stats():
+        """Fraction of values resolved by each tier since startup."""
+        return jsonify({'university': universities.report(), 'program': programs.report()})
+    
+    @app.route('/health', methods=['GET'])
+    def health():
+        return jsonify({'status': 'ok'})
+    
+    return app
+
+
 def main():
     parser = argparse.ArgumentParser(description='LLM-based name standardizer for Grad Cafe data')
     
@@ -218,14 +887,32 @@ def main():
     parser.add_argument('--output', type=str, help='Output file path')
     parser.add_argument('--format', choices=['json', 'jsonl'], default='jsonl', help='Output format')
     parser.add_argument('--no-llm', action='store_true', help='Use fuzzy matching only (skip LLM)')
+    parser.add_argument('--stream', action='store_true',
+                        help='Process records one at a time and write JSONL incrementally (constant memory)')
+    parser.add_argument('--batch-size', type=int, default=100, help='Records per flushed batch in --stream mode')
+    parser.add_argument('--aliases', type=str, help='Alias file (default: canon_aliases.txt or $CANON_ALIASES)')
     
     args = parser.parse_args()
     
-    if args.file:
+    if args.file and args.stream:
+        # Streaming mode: JSON array or JSONL in, JSONL out
+        if args.format == 'json':
+            parser.error('--stream writes JSONL; drop --format json')
+        if args.output:
+            with open(args.output, 'wb') as f:
+                stream_file(args.file, f, use_llm=not args.no_llm, batch_size=args.batch_size,
+                            alias_file=args.aliases)
+            print(f"Saved to {args.output}", file=sys.stderr)
+        else:
+            stream_file(args.file, sys.stdout.buffer, use_llm=not args.no_llm, batch_size=args.batch_size,
+                        alias_file=args.aliases)
+    
+    elif args.file:
         # CLI mode
         if args.output:
             # Write directly to file
-            processed = process_file(args.file, output_mode='file', use_llm=not args.no_llm)
+            processed = process_file(args.file, output_mode='file', use_llm=not args.no_llm,
+                                     alias_file=args.aliases)
             with open(args.output, 'w', encoding='utf-8') as f:
                 if args.format == 'json':
                     json.dump(processed, f, ensure_ascii=False, indent=2)
@@ -235,7 +922,8 @@ def main():
             print(f"Saved to {args.output}", file=sys.stderr)
         else:
             output_mode = 'stdout' if args.stdout else 'jsonl'
-            process_file(args.file, output_mode=output_mode, use_llm=not args.no_llm)
+            process_file(args.file, output_mode=output_mode, use_llm=not args.no_llm,
+                         alias_file=args.aliases)
     
     elif args.serve:
         # Flask server mode
@@ -243,47 +931,18 @@ def main():
             print("Flask not installed. Run: pip install flask")
             sys.exit(1)
         
-        app = Flask(__name__)
-        
         # Load LLM and canonical lists at startup
         print("Initializing server...", file=sys.stderr)
-        universities, programs = load_canonical_lists()
-        
-        model = None
-        if Llama and hf_hub_download and not args.no_llm:
-            try:
-                model_repo = os.getenv('MODEL_REPO', 'TheBloke/TinyLlama-1.1B-Chat-v1.0-GGUF')
-                model_file = os.getenv('MODEL_FILE', 'tinyllama-1.1b-chat-v1.0.Q4_K_M.gguf')
-                n_gpu_layers = int(os.getenv('N_GPU_LAYERS', 0))
-                n_ctx = int(os.getenv('N_CTX', 2048))
-                
-                model_path = hf_hub_download(repo_id=model_repo, filename=model_file)
-                model = Llama(model_path=model_path, n_ctx=n_ctx, n_gpu_layers=n_gpu_layers, verbose=False)
-            except Exception as e:
-                print(f"Warning: Could not load LLM: {e}", file=sys.stderr)
+        universities, programs = load_lookups(args.aliases)
         
-        @app.route('/standardize', methods=['POST'])
-        def standardize():
-            try:
-                data = request.get_json()
-                if not isinstance(data, list):
-                    data = [data]
-                
-                result = []
-                for entry in data:
-                    if model:
-                        entry = parse_with_llm(model, entry)
-                    else:
-                        entry = standardize_with_fallback(entry, universities, programs)
-                    result.append(entry)
-                
-                return jsonify(result)
-            except Exception as e:
-                return jsonify({'error': str(e)}), 400
+        model = load_model(not args.no_llm)
+        jobs = JobQueue(
+            model, universities, programs,
+            workers=int(os.getenv('JOB_WORKERS', 1)),
+            max_pending=int(os.getenv('JOB_QUEUE_SIZE', 16)),
+        )
         
-        @app.route('/health', methods=['GET'])
-        def health():
-            return jsonify({'status': 'ok'})
+        app = create_app(model, universities, programs, jobs)
         
         print("Starting Flask server on http://0.0.0.0:8000", file=sys.stderr)
         app.run(host='0.0.0.0', port=8000, debug=False)
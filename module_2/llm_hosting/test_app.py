@@ -0,0 +1,296 @@
+"""
+test_app.py - Tests for the llm_hosting standardizer helpers.
+
+Run with ``pytest`` from this directory; no model download is needed.
+
+Author: Jie Xu
+"""
+
+import json
+import threading
+
+import pytest
+
+import app
+
+
+# --- iter_json_records ---
+
+@pytest.mark.parametrize('text, expected', [
+    ('12345 678\n{"a": 1}\n9', [12345, 678, {'a': 1}, 9]),
+    ('[12345, -6.5e3, true, null, "x", {"b": [10, 20]}]',
+     [12345, -6.5e3, True, None, 'x', {'b': [10, 20]}]),
+])
+def test_iter_json_records_chunk_boundaries(tmp_path, text, expected):
+    """Values split across chunks decode whole, at every chunk size."""
+    path = tmp_path / 'records.json'
+    path.write_text(text, encoding='utf-8')
+    for chunk_size in range(1, len(text) + 1):
+        assert list(app.iter_json_records(path, chunk_size)) == expected, chunk_size
+
+
+# --- grammar-constrained decoding ---
+
+class _Grammar:
+    """Stands in for ``LlamaGrammar``: keeps the grammar text."""
+
+    @staticmethod
+    def from_string(text, verbose=False):
+        return text
+
+
+class _WorstCaseModel:
+    """Emits the longest answer the JSON grammar allows, cut at ``max_tokens`` bytes.
+
+    Counting one token per byte is the most a tokenizer can ever need.
+    """
+
+    def __init__(self, max_chars):
+        value = '\U0001F600' * max_chars  # 4 UTF-8 bytes per character
+        self.text = json.dumps({'program': value, 'university': value}, ensure_ascii=False)
+        self.text = self.text.replace('{', '{ ').replace('}', ' }')
+        self.calls = []
+
+    def __call__(self, prompt, max_tokens, grammar=None, **kwargs):
+        self.calls.append((max_tokens, grammar))
+        cut = self.text.encode('utf-8')[:max_tokens].decode('utf-8', 'ignore')
+        return {'choices': [{'text': cut}]}
+
+
+@pytest.fixture()
+def grammars(monkeypatch):
+    """Compile grammars to their text, without llama.cpp."""
+    monkeypatch.setattr(app, 'LlamaGrammar', _Grammar)
+    app._compile_grammar.cache_clear()
+    yield
+    app._compile_grammar.cache_clear()
+
+
+def test_json_grammar_output_always_closes(grammars, monkeypatch):
+    """The longest grammar-legal answer fits the token cap and parses."""
+    monkeypatch.setattr(app, 'LLM_MAX_FIELD_CHARS', 12)
+    model = _WorstCaseModel(12)
+    entry = app.parse_with_llm(model, {'program': 'cs', 'university': 'mit'}, decoding='json')
+    max_tokens, grammar = model.calls[0]
+    assert 'char{0,12}' in grammar
+    assert max_tokens == app.grammar_token_budget(12) >= len(model.text.encode('utf-8'))
+    assert entry['llm_generated_program'] == '\U0001F600' * 12
+
+
+def test_unbounded_answer_would_be_truncated(grammars, monkeypatch):
+    """Longer than the grammar allows, the cut-off output falls back to the raw input."""
+    monkeypatch.setattr(app, 'LLM_MAX_FIELD_CHARS', 12)
+    entry = app.parse_with_llm(_WorstCaseModel(13), {'program': 'cs', 'university': 'mit'},
+                               decoding='json')
+    assert entry['llm_generated_program'] == 'cs'
+
+
+def test_vocab_grammar_budget_covers_longest_name(grammars):
+    """The vocab cap fits the longest candidate in each field."""
+    programs = app.CanonicalLookup(['Computer Science', 'Électrical Engineering'])
+    universities = app.CanonicalLookup(['Stanford University'])
+    entry = {'program': 'EE', 'university': 'Stanford'}
+    grammar, max_tokens = app.build_grammar('vocab', entry, universities, programs)
+    longest = '{"program": "Électrical Engineering", "university": "Stanford University"}'
+    assert '\\"Stanford University\\"' in grammar
+    assert max_tokens >= len(longest.encode('utf-8'))
+
+
+# --- job queue ---
+
+@pytest.mark.parametrize('with_model', [False, True])
+def test_job_queue_locks_only_model_calls(with_model):
+    """Jobs complete with or without a model; model calls hold the lock."""
+    held = []
+
+    def model(prompt, **kwargs):
+        held.append(jobs.model_lock.locked())
+        return {'choices': [{'text': '{"program": "Physics", "university": "Yale"}'}]}
+
+    lookup = app.CanonicalLookup([])
+    jobs = app.JobQueue(model if with_model else None, lookup, lookup)
+    job_id = jobs.submit([{'program': 'physics', 'university': 'yale'}])
+    results = list(jobs.iter_results(job_id, timeout=5))
+    assert len(results) == 1 and jobs.snapshot(job_id)['errors'] == 0
+    assert held == ([True] if with_model else [])
+
+
+# --- HTTP routes ---
+
+def _answer(prompt, **kwargs):
+    return {'choices': [{'text': '{"program": "Physics", "university": "Yale"}'}]}
+
+
+def _client(model, **queue_options):
+    lookup = app.CanonicalLookup([])
+    jobs = app.JobQueue(model, lookup, lookup, **queue_options)
+    return app.create_app(model, lookup, lookup, jobs).test_client(), jobs
+
+
+def test_standardize_route_holds_model_lock():
+    """Synchronous requests share the model, so they take the workers' lock."""
+    held = []
+
+    def model(prompt, **kwargs):
+        held.append(jobs.model_lock.locked())
+        return _answer(prompt)
+
+    client, jobs = _client(model)
+    resp = client.post('/standardize', json={'program': 'physics', 'university': 'yale'})
+    assert resp.status_code == 200
+    assert resp.get_json()[0]['llm_generated_university'] == 'Yale'
+    assert held == [True]
+
+
+def test_job_routes_submit_and_report():
+    """POST /jobs answers 202 with a status URL; GET reports the results."""
+    client, jobs = _client(None)
+    resp = client.post('/jobs', json=[{'program': 'physics', 'university': 'yale'}])
+    assert resp.status_code == 202
+    body = resp.get_json()
+    assert body['status_url'] == f"/jobs/{body['job_id']}"
+    list(jobs.iter_results(body['job_id'], timeout=5))
+
+    job = client.get(body['status_url']).get_json()
+    assert (job['status'], job['total'], job['processed']) == ('done', 1, 1)
+    assert len(job['results']) == 1
+    assert client.get('/jobs/unknown').status_code == 404
+    assert client.post('/jobs', data='not json').status_code == 400
+
+
+def test_job_route_full_queue_is_429():
+    """With the worker busy and the queue full, submissions are refused."""
+    release = threading.Event()
+
+    def model(prompt, **kwargs):
+        release.wait(5)
+        return _answer(prompt)
+
+    client, jobs = _client(model, max_pending=1)
+    try:
+        statuses = [client.post('/jobs', json={'program': 'physics'}) for _ in range(3)]
+        assert statuses[0].status_code == 202
+        assert statuses[-1].status_code == 429
+        assert statuses[-1].headers['Retry-After'] == '5'
+    finally:
+        release.set()
+
+
+
+# --- lookup tiers ---
+
+def test_load_aliases_skips_comments_and_malformed_lines(tmp_path):
+    """Only ``alias => name`` lines with both sides set are kept."""
+    path = tmp_path / 'aliases.txt'
+    path.write_text('# comment\n\nMIT => Massachusetts Institute of Technology\n'
+                    'no arrow here\n => Missing Alias\nEmpty =>\n'
+                    '  CS  =>  Computer Science  \n', encoding='utf-8')
+    assert app.load_aliases(path) == {'MIT': 'Massachusetts Institute of Technology',
+                                      'CS': 'Computer Science'}
+    assert app.load_aliases(tmp_path / 'missing.txt') == {}
+
+
+def test_lookup_tiers():
+    """Exact, case/punctuation-folded and alias hits are counted by tier."""
+    lookup = app.CanonicalLookup(
+        ['University of California, Berkeley', 'Stanford University'],
+        aliases={'UCB': 'University of California, Berkeley',
+                 'CS': 'Computer Science'},
+    )
+    assert lookup.lookup('Stanford University') == 'Stanford University'
+    assert lookup.lookup('  university of california berkeley ') == \
+        'University of California, Berkeley'
+    assert lookup.lookup('ucb') == 'University of California, Berkeley'
+    assert lookup.lookup('CS') is None  # alias points into the other list
+    assert lookup.lookup('') is None
+    assert lookup.stats == {'exact': 1, 'casefold': 1, 'alias': 1}
+
+
+def test_lookup_match_falls_back_to_fuzzy():
+    """match() uses the table first and scans only on a miss."""
+    lookup = app.CanonicalLookup(['Stanford University'])
+    assert lookup.match('Stanford University') == 'Stanford University'
+    assert lookup.match('Stanford Universty') == 'Stanford University'
+    assert lookup.match('Nowhere') is None
+    assert lookup.stats == {'exact': 1, 'fuzzy': 1, 'unresolved': 1}
+
+
+def test_report_fractions():
+    """report() gives every tier's share of all recorded resolutions."""
+    lookup = app.CanonicalLookup([])
+    assert set(lookup.report()) == set(app.CanonicalLookup.TIERS)
+    assert not any(lookup.report().values())
+    for tier in ('exact', 'exact', 'alias', 'llm'):
+        lookup.record(tier)
+    report = lookup.report()
+    assert report['exact'] == 0.5
+    assert report['alias'] == report['llm'] == 0.25
+    assert sum(report.values()) == 1.0
+
+
+# --- embedding tier ---
+
+needs_numpy = pytest.mark.skipif(app.np is None, reason='embedding tier needs NumPy')
+
+
+@pytest.fixture(scope='module')
+def lookups():
+    """University and program tables built from the shipped lists, no aliases."""
+    universities, programs = app.load_canonical_lists()
+    return app.CanonicalLookup(universities), app.CanonicalLookup(programs)
+
+
+@needs_numpy
+def test_embedding_search_ranks_nearest_first(lookups):
+    """search() returns the top-k names best first; best() adds the margin."""
+    universities, _ = lookups
+    indices, scores = universities.index.search(['Carnegie Mellon'], k=3)
+    assert universities.names[indices[0][0]] == 'Carnegie Mellon University'
+    assert list(scores[0]) == sorted(scores[0], reverse=True)
+    name, score, margin = universities.index.best(['Carnegie Mellon'])[0]
+    assert name == 'Carnegie Mellon University'
+    assert margin == pytest.approx(score - scores[0][1])
+
+
+@needs_numpy
+def test_embedding_margin_skips_degree_variants(lookups):
+    """'Statistics MS' is not a competitor of 'Statistics' for the margin."""
+    _, programs = lookups
+    name, score, margin = programs.index.best(['Statistics'])[0]
+    assert name == 'Statistics'
+    assert margin > 0.5
+
+
+@needs_numpy
+@pytest.mark.parametrize('text, expected', [
+    ('Univ of Michigan', 'University of Michigan'),
+    ('Jonhs Hopkins Univ', 'Johns Hopkins University'),
+    ('Northwestern Univ', 'Northwestern University'),
+])
+def test_embedding_tier_resolves_variants(lookups, text, expected):
+    """Abbreviations and typos of a canonical name resolve without the LLM."""
+    universities, _ = lookups
+    assert universities.resolve_batch([text]) == [expected]
+    assert universities.stats['embedding'] >= 1
+
+
+@needs_numpy
+@pytest.mark.parametrize('table, text', [
+    (0, 'University of Texas at Dallas'),
+    (0, 'Boston College'),
+    (0, 'Penn State'),
+    (1, 'Biostatistics'),
+    (1, 'Computer Engineering'),
+])
+def test_embedding_tier_rejects_near_misses(lookups, table, text):
+    """Similar-looking but different names are left for the LLM."""
+    lookup = lookups[table]
+    assert lookup.index.best([text])[0][0] != text
+    assert lookup.resolve_batch([text]) == [None]
+
+
+@needs_numpy
+def test_embedding_threshold_applies(lookups):
+    """A correct but weak match is dropped when the threshold is raised."""
+    universities, _ = lookups
+    assert universities.resolve_batch(['Univ of Michigan'], threshold=0.99) == [None]
@@ -295,7 +295,10 @@ def status():
 # Run the app
 # ============================================================
 if __name__ == '__main__':
+    # Debugger only when asked for: FLASK_DEBUG=1 python app.py
+    port = int(os.environ.get('PORT', '5000'))
+    debug = os.environ.get('FLASK_DEBUG', '').lower() in ('1', 'true', 'yes')
     print("Starting Flask server...")
-    print("Open http://localhost:5000 in your browser")
+    print(f"Open http://localhost:{port} in your browser")
     print("Press Ctrl+C to stop")
-    app.run(debug=True, port=5000)
+    app.run(host=os.environ.get('HOST', '127.0.0.1'), port=port, debug=debug)
@@ -0,0 +1,284 @@
+"""Benchmark: per-statistic queries vs. the consolidated analysis query.
+
+Fills a scratch database with synthetic applicants and times four
+ways of computing the dashboard numbers:
+
+* ``per_statistic`` — one ``COUNT``/``AVG`` statement per number,
+  each scanning ``applicants`` (how the dashboard used to work).
+* ``per_question`` — the individual ``query_data.query_*`` functions,
+  one pooled round trip each.
+* ``consolidated`` — ``query_data.run_all_queries`` on one
+  connection: ``SCALARS_SQL`` plus the two custom row-set queries,
+  three round trips in total.
+* ``concurrent`` — ``run_all_queries`` with ``QUERY_WORKERS`` threads,
+  each independent query on its own pooled connection.
+
+For each mode it reports the number of round trips (``execute``
+calls) and the median wall-clock latency.
+
+Usage::
+
+    BENCH_DATABASE_URL=postgresql://user@localhost/gradcafe_bench \\
+        python benchmarks/bench_analysis.py --rows 100000 1000000
+
+The target database is dropped and refilled, so never point it at
+real data.
+
+Author: Jie Xu
+Course: JHU Modern Software Concepts
+Date: February 2026
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator
+
+import psycopg2
+import psycopg2.extensions
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src import db  # noqa: E402
+from src import query_data as qd  # noqa: E402
+from src.load_data import migrate  # noqa: E402
+
+
+DEFAULT_URL = 'postgresql://postgres@localhost:5432/gradcafe_bench'
+
+# Synthetic rows: cycles through a few terms, statuses, schools and
+# programs so every dashboard filter matches a realistic fraction.
+FILL_SQL = """
+INSERT INTO applicants (
+    url, program, university, status, term, us_or_international,
+    gpa, gre, gre_v, gre_aw, degree,
+    llm_generated_program, llm_generated_university,
+    status_category, term_season, term_year
+)
+SELECT
+    'bench-' || g,
+    (ARRAY['Computer Science', 'Physics', 'Economics', 'Biology'])[1 + g %% 4],
+    (ARRAY['Johns Hopkins University', 'Stanford University', 'MIT',
+           'Carnegie Mellon University', 'Georgetown University',
+           'University of Somewhere'])[1 + g %% 6],
+    (ARRAY['Accepted', 'Rejected', 'Wait listed', 'Interview'])[1 + g %% 4],
+    (ARRAY['Fall 2026', 'Fall 2025', 'Spring 2026'])[1 + g %% 3],
+    (ARRAY['American', 'International', 'Other'])[1 + g %% 3],
+    CASE WHEN g %% 5 = 0 THEN NULL ELSE 3.0 + (g %% 100) / 100.0 END,
+    CASE WHEN g %% 3 = 0 THEN NULL ELSE 150 + g %% 21 END,
+    CASE WHEN g %% 3 = 0 THEN NULL ELSE 150 + g %% 19 END,
+    CASE WHEN g %% 3 = 0 THEN NULL ELSE 3.0 + (g %% 7) / 2.0 END,
+    (ARRAY['Masters', 'PhD'])[1 + g %% 2],
+    (ARRAY['Computer Science', 'Physics', 'Economics', 'Biology'])[1 + g %% 4],
+    (ARRAY['Johns Hopkins University', 'Stanford University',
+           'Massachusetts Institute of Technology',
+           'Carnegie Mellon University', 'Georgetown University',
+           'University of Somewhere'])[1 + g %% 6],
+    (ARRAY['Accepted', 'Rejected', 'Waitlisted', 'Interview'])[1 + g %% 4]
+        ::admission_status,
+    (ARRAY[4, 4, 2])[1 + g %% 3],
+    (ARRAY[2026, 2025, 2026])[1 + g %% 3]
+FROM generate_series(1, %s) AS g
+"""
+
+# One statement per dashboard number, each aggregating ``applicants``
+_FALL_2026 = "term_year = 2026 AND term_season = 4"
+_FALL_2025 = "term_year = 2025 AND term_season = 4"
+PER_STATISTIC_SQL = [
+    f"SELECT COUNT(*) FROM applicants WHERE {_FALL_2026}",
+    "SELECT COUNT(*) FROM applicants",
+    "SELECT COUNT(*) FROM applicants "
+    "WHERE us_or_international = 'International'",
+    "SELECT COUNT(*) FROM applicants WHERE us_or_international = 'American'",
+    "SELECT AVG(gpa) FROM applicants",
+    "SELECT AVG(gre) FROM applicants",
+    "SELECT AVG(gre_v) FROM applicants",
+    "SELECT AVG(gre_aw) FROM applicants",
+    "SELECT AVG(gpa) FROM applicants "
+    f"WHERE us_or_international = 'American' AND {_FALL_2026}",
+    f"SELECT COUNT(*) FROM applicants WHERE {_FALL_2025}",
+    f"SELECT COUNT(*) FROM applicants WHERE {_FALL_2025} "
+    "AND status_category = 'Accepted'",
+    f"SELECT AVG(gpa) FROM applicants WHERE {_FALL_2026} "
+    "AND status_category = 'Accepted'",
+    "SELECT COUNT(*) FROM applicants WHERE " + qd.Q7_WHERE,
+    "SELECT COUNT(*) FROM applicants WHERE " + qd.Q8_WHERE,
+    "SELECT COUNT(*) FROM applicants WHERE " + qd.Q9_WHERE,
+    qd.TOP_PROGRAMS_SQL,
+    "SELECT degree, COUNT(*), "
+    "COUNT(*) FILTER (WHERE status_category = 'Accepted') "
+    "FROM applicants GROUP BY degree",
+]
+
+
+# ---------------------------------------------------------------------------
+# Round-trip counting
+# ---------------------------------------------------------------------------
+
+class _CountingCursor(psycopg2.extensions.cursor):
+    """Cursor that counts every ``execute`` call."""
+
+    calls = 0
+
+    def execute(self, query, vars=None):  # pylint: disable=redefined-builtin
+        _CountingCursor.calls += 1
+        return super().execute(query, vars)
+
+
+@contextmanager
+def _counting(url: str) -> Iterator[None]:
+    """Make pooled connections for *url* hand out counting cursors."""
+    real = db.connection
+
+    @contextmanager
+    def counted(database_url=None):
+        with real(database_url) as conn:
+            conn.cursor_factory = _CountingCursor
+            try:
+                yield conn
+            finally:
+                conn.cursor_factory = psycopg2.extensions.cursor
+
+    db.connection = counted
+    try:
+        yield
+    finally:
+        db.connection = real
+
+
+# ---------------------------------------------------------------------------
+# Modes
+# ---------------------------------------------------------------------------
+
+def per_statistic(url: str) -> None:
+    """Run one statement per dashboard number on a pooled connection."""
+    with db.connection(url) as conn, conn.cursor() as cur:
+        for sql in PER_STATISTIC_SQL:
+            cur.execute(sql)
+            cur.fetchall()
+
+
+def per_question(url: str) -> None:
+    """Call every ``query_data.query_*`` function in turn."""
+    qd.query_fall_2026_count(url)
+    qd.query_international_percentage(url)
+    qd.query_average_scores(url)
+    qd.query_american_fall_2026_gpa(url)
+    qd.query_fall_2025_acceptance_rate(url)
+    qd.query_fall_2026_acceptance_gpa(url)
+    qd.query_jhu_masters_cs(url)
+    qd.query_top_schools_phd_cs(url)
+    qd.query_top_schools_phd_cs_llm(url)
+    qd.query_top_programs(url)
+    qd.query_acceptance_by_degree(url)
+
+
+def consolidated(url: str) -> None:
+    """Run ``query_data.run_all_queries`` on a single connection."""
+    qd.run_all_queries(url, max_workers=1)
+
+
+def concurrent(url: str) -> None:
+    """Run ``query_data.run_all_queries`` across a thread pool."""
+    qd.run_all_queries(url, max_workers=qd.QUERY_WORKERS)
+
+
+MODES: dict[str, Callable[[str], None]] = {
+    'per_statistic': per_statistic,
+    'per_question': per_question,
+    'consolidated': consolidated,
+    'concurrent': concurrent,
+}
+
+
+# ---------------------------------------------------------------------------
+# Driver
+# ---------------------------------------------------------------------------
+
+def fill(url: str, rows: int) -> None:
+    """Recreate the schema in *url* and insert *rows* synthetic rows.
+
+    Args:
+        url: Scratch database connection string.
+        rows: Number of applicants to generate.
+    """
+    db.close_all()
+    conn = psycopg2.connect(url)
+    conn.autocommit = True
+    with conn.cursor() as cur:
+        cur.execute(
+            "DROP TABLE IF EXISTS applicants, schema_migrations, "
+            "applicant_summary"
+        )
+    conn.close()
+    migrate(url)
+
+    conn = psycopg2.connect(url)
+    with conn.cursor() as cur:
+        cur.execute(FILL_SQL, (rows,))
+    conn.commit()
+    conn.autocommit = True
+    with conn.cursor() as cur:
+        cur.execute("VACUUM ANALYZE applicants")
+        cur.execute("VACUUM ANALYZE applicant_summary")
+    conn.close()
+
+
+def measure(url: str, repeat: int) -> dict[str, tuple[int, float]]:
+    """Time every mode in ``MODES`` against *url*.
+
+    Modes are run round-robin so that cache warm-up and background
+    activity affect them all alike.
+
+    Args:
+        url: Database connection string.
+        repeat: Number of timed runs per mode (after one warm-up run).
+
+    Returns:
+        ``{mode_name: (round_trips_per_run, median_milliseconds)}``.
+    """
+    trips = {}
+    for name, mode in MODES.items():
+        mode(url)  # warm the pool and the buffer cache
+        with _counting(url):
+            _CountingCursor.calls = 0
+            mode(url)
+            trips[name] = _CountingCursor.calls
+
+    timings: dict[str, list[float]] = {name: [] for name in MODES}
+    for _ in range(repeat):
+        for name, mode in MODES.items():
+            started = time.perf_counter()
+            mode(url)
+            timings[name].append((time.perf_counter() - started) * 1000)
+    return {
+        name: (trips[name], statistics.median(timings[name]))
+        for name in MODES
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Fill the scratch database at each size and print a results table."""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--rows', type=int, nargs='+',
+                        default=[100_000, 1_000_000])
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--url', default=os.environ.get(
+        'BENCH_DATABASE_URL', DEFAULT_URL))
+    args = parser.parse_args(argv)
+
+    print(f"{'rows':>10}  {'mode':<14} {'trips':>5}  {'median ms':>10}")
+    for rows in args.rows:
+        fill(args.url, rows)
+        for name, (trips, median) in measure(args.url, args.repeat).items():
+            print(f"{rows:>10}  {name:<14} {trips:>5}  {median:>10.1f}")
+    db.close_all()
+
+
+if __name__ == '__main__':
+    main()
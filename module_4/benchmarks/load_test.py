@@ -0,0 +1,218 @@
+"""Load test: dashboard throughput under gunicorn with 1, 2, 4 workers.
+
+For each worker count this starts ``gunicorn src.wsgi:app`` on a local
+port, hammers it with concurrent keep-alive clients for a fixed time,
+and reports requests per second and latency percentiles.  It then
+checks that the shared state holds across processes: after one
+``POST /update_analysis``, every worker must report the new
+``data_version`` in ``/status``.
+
+Usage::
+
+    BENCH_DATABASE_URL=postgresql://user@localhost/gradcafe_bench \\
+        python benchmarks/load_test.py --workers 1 2 4 --clients 16
+
+The database is only read (and its dataset version bumped), so it can
+be the one ``bench_analysis.py`` filled.  Throughput can only grow
+with workers up to the number of CPU cores the machine has.
+
+Author: Jie Xu
+Course: JHU Modern Software Concepts
+Date: February 2026
+"""
+
+from __future__ import annotations
+
+import argparse
+import http.client
+import json
+import os
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from typing import Optional
+
+ROOT = os.path.join(os.path.dirname(__file__), '..')
+DEFAULT_URL = 'postgresql://postgres@localhost:5432/gradcafe_bench'
+
+
+# ---------------------------------------------------------------------------
+# Server management
+# ---------------------------------------------------------------------------
+
+def start_server(workers: int, threads: int, port: int,
+                 database_url: str) -> subprocess.Popen:
+    """Start gunicorn serving ``src.wsgi:app`` and wait until it answers.
+
+    Args:
+        workers: Number of worker processes.
+        threads: Threads per worker.
+        port: Local port to bind.
+        database_url: Passed to the app as ``DATABASE_URL``.
+
+    Returns:
+        The running server process.
+
+    Raises:
+        RuntimeError: If the server does not come up within 30 seconds.
+    """
+    server = subprocess.Popen(
+        [sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py',
+         '--workers', str(workers), '--threads', str(threads),
+         '--bind', f'127.0.0.1:{port}', '--access-logfile', '/dev/null',
+         'src.wsgi:app'],
+        cwd=ROOT, env={**os.environ, 'DATABASE_URL': database_url},
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            if request(port, 'GET', '/status')[0] == 200:
+                return server
+        except OSError:
+            pass
+        time.sleep(0.2)
+    stop_server(server)
+    raise RuntimeError(f'gunicorn with {workers} workers did not start')
+
+
+def stop_server(server: subprocess.Popen) -> None:
+    """Shut gunicorn down gracefully."""
+    server.terminate()
+    server.wait(timeout=30)
+
+
+# ---------------------------------------------------------------------------
+# Clients
+# ---------------------------------------------------------------------------
+
+def request(port: int, method: str, path: str,
+            headers: Optional[dict[str, str]] = None,
+            conn: Optional[http.client.HTTPConnection] = None,
+            ) -> tuple[int, bytes]:
+    """Send one request and return ``(status, body)``."""
+    own = conn is None
+    conn = conn or http.client.HTTPConnection('127.0.0.1', port, timeout=30)
+    try:
+        conn.request(method, path, headers=headers or {})
+        resp = conn.getresponse()
+        return resp.status, resp.read()
+    finally:
+        if own:
+            conn.close()
+
+
+def run_load(port: int, clients: int, seconds: float,
+             path: str) -> dict[str, float]:
+    """Issue GETs for *path* from *clients* threads for *seconds*.
+
+    Args:
+        port: Server port.
+        clients: Number of concurrent keep-alive connections.
+        seconds: How long to keep sending.
+        path: Request path.
+
+    Returns:
+        ``requests``, ``errors``, ``rps`` and the ``p50`` / ``p95`` /
+        ``p99`` latencies in milliseconds.
+    """
+    latencies: list[list[float]] = [[] for _ in range(clients)]
+    errors = [0] * clients
+    stop_at = time.monotonic() + seconds
+
+    def client(index: int) -> None:
+        conn = http.client.HTTPConnection('127.0.0.1', port, timeout=30)
+        while time.monotonic() < stop_at:
+            started = time.perf_counter()
+            try:
+                status, _ = request(port, 'GET', path, conn=conn)
+            except (OSError, http.client.HTTPException):
+                status = 0
+                conn.close()
+                conn = http.client.HTTPConnection('127.0.0.1', port,
+                                                  timeout=30)
+            if status == 200:
+                latencies[index].append(
+                    (time.perf_counter() - started) * 1000)
+            else:
+                errors[index] += 1
+        conn.close()
+
+    threads = [threading.Thread(target=client, args=(i,))
+               for i in range(clients)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    samples = sorted(ms for per_client in latencies for ms in per_client)
+    if len(samples) > 1:
+        cuts = statistics.quantiles(samples, n=100)
+    else:
+        cuts = [samples[0] if samples else 0.0] * 99
+    return {
+        'requests': len(samples),
+        'errors': sum(errors),
+        'rps': len(samples) / elapsed,
+        'p50': cuts[49], 'p95': cuts[94], 'p99': cuts[98],
+    }
+
+
+def check_shared_invalidation(port: int, probes: int = 50) -> bool:
+    """Bump the dataset version in one worker and ask every worker for it.
+
+    Args:
+        port: Server port.
+        probes: Fresh connections to open (spread across workers).
+
+    Returns:
+        ``True`` if every worker reports the bumped version.
+    """
+    def version() -> int:
+        return json.loads(request(port, 'GET', '/status')[1])['data_version']
+
+    before = version()
+    if request(port, 'POST', '/update_analysis')[0] != 200:
+        return False
+    return all(version() > before for _ in range(probes))
+
+
+# ---------------------------------------------------------------------------
+# Driver
+# ---------------------------------------------------------------------------
+
+def main(argv: list[str] | None = None) -> None:
+    """Run the load test at each worker count and print a results table."""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4])
+    parser.add_argument('--threads', type=int, default=4)
+    parser.add_argument('--clients', type=int, default=16)
+    parser.add_argument('--seconds', type=float, default=10.0)
+    parser.add_argument('--path', default='/')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--url', default=os.environ.get(
+        'BENCH_DATABASE_URL', DEFAULT_URL))
+    args = parser.parse_args(argv)
+
+    print(f"{'workers':>7} {'req/s':>9} {'p50 ms':>8} {'p95 ms':>8} "
+          f"{'p99 ms':>8} {'errors':>6}  shared-invalidation")
+    for workers in args.workers:
+        server = start_server(workers, args.threads, args.port, args.url)
+        try:
+            run_load(args.port, args.clients, 1.0, args.path)  # warm up
+            result = run_load(args.port, args.clients, args.seconds,
+                              args.path)
+            shared = check_shared_invalidation(args.port)
+        finally:
+            stop_server(server)
+        print(f"{workers:>7} {result['rps']:>9.1f} {result['p50']:>8.1f} "
+              f"{result['p95']:>8.1f} {result['p99']:>8.1f} "
+              f"{result['errors']:>6}  {'ok' if shared else 'FAILED'}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+"""Gunicorn settings for serving ``src.wsgi:app``.
+
+Every value can be overridden from the environment (``WEB_WORKERS``,
+``WEB_THREADS``, ``WEB_EVENT_STREAMS``, ``DB_POOL_MAX``, ``PORT``) or
+on the command line.
+
+Author: Jie Xu
+Course: JHU Modern Software Concepts
+Date: February 2026
+"""
+
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+
+# Processes scale the CPU-bound work (rendering, JSON); threads let a
+# worker keep serving while others wait on Postgres.  Workers are
+# capped by default because each one holds its own connections (see
+# the budget below); raise WEB_WORKERS only with max_connections.
+workers = int(os.environ.get(
+    'WEB_WORKERS', min(multiprocessing.cpu_count() * 2 + 1, 4)))
+worker_class = 'gthread'
+
+# An open /pull_data/events stream holds its thread for up to
+# EVENTS_MAX_SECONDS.  src.wsgi caps streams per worker at
+# WEB_EVENT_STREAMS, and each worker gets that many threads on top of
+# WEB_THREADS, so streams can never starve ordinary requests.
+request_threads = int(os.environ.get('WEB_THREADS', '8'))
+event_streams = int(os.environ.get('WEB_EVENT_STREAMS', '4'))
+threads = request_threads + event_streams
+
+# Connection budget: a request thread holds at most one pooled
+# connection at a time (src.db makes extra borrowers wait), and event
+# streams share one LISTEN connection per worker.  Unless DB_POOL_MAX
+# is set explicitly, the pool is sized to the request threads, so the
+# server opens at most workers * (DB_POOL_MAX + 1) connections:
+# 4 * (8 + 1) = 36 by default, within Postgres's max_connections=100.
+os.environ.setdefault('DB_POOL_MAX', str(request_threads))
+connection_budget = workers * (int(os.environ['DB_POOL_MAX']) + 1)
+
+
+def on_starting(server):
+    """Log the Postgres connection budget implied by these settings."""
+    server.log.info('Postgres connections: up to %d (%d workers x '
+                    '(DB_POOL_MAX=%s + 1 LISTEN))', connection_budget,
+                    workers, os.environ['DB_POOL_MAX'])
+
+
+graceful_timeout = 30
+accesslog = '-'
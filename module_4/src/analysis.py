@@ -0,0 +1,276 @@
+"""Parameterized analysis queries backed by server-side prepared statements.
+
+The dashboard questions in ``query_data`` hardcode their terms and
+schools.  This module answers the same kind of question for any
+combination of filters::
+
+    acceptance_rate(term='Fall 2026', university='Stanford', degree='PhD')
+
+Each distinct *shape* of question (which filters are set, not their
+values) is turned into SQL once and cached in ``PreparedStatements``.
+On each pooled connection it is ``PREPARE``-d the first time it is
+used and ``EXECUTE``-d with new values afterwards, so repeated
+questions skip parsing and planning.  Values always travel as
+parameters, never as SQL text.
+
+Questions that do not filter on university or program are answered
+from ``applicant_summary``; the others read ``applicants`` through
+its ``university`` / trigram indexes.
+
+Author: Jie Xu
+Course: JHU Modern Software Concepts
+Date: February 2026
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import weakref
+from typing import Any, Callable, Optional
+
+import psycopg2.extensions
+
+from src import db, metrics
+from src.clean import parse_term
+from src.query_data import percentage
+
+
+# ---------------------------------------------------------------------------
+# Filters
+# ---------------------------------------------------------------------------
+# filter -> (predicate on applicants, predicate on applicant_summary or
+# None if the summary table cannot answer it, parameter type).  ``{}``
+# is replaced by the parameter's ``$n`` placeholder.
+
+FILTERS: dict[str, tuple[str, Optional[str], str]] = {
+    'term_season': ('term_season = {}', 'term_season = {}', 'smallint'),
+    'term_year': ('term_year = {}', 'term_year = {}', 'smallint'),
+    'degree': ('degree ILIKE {}', 'degree ILIKE {}', 'text'),
+    'nationality': ('us_or_international = {}', 'us_or_international = {}',
+                    'text'),
+    'university': ('lower(university) LIKE {}', None, 'text'),
+    'program': ('program ILIKE {}', None, 'text'),
+}
+
+_STATS_SQL = {
+    'applicants': (
+        "SELECT COUNT(*), "
+        "COUNT(*) FILTER (WHERE status_category = 'Accepted'), "
+        "AVG(gpa) FROM applicants WHERE {where}"
+    ),
+    'applicant_summary': (
+        "SELECT coalesce(SUM(applicants), 0)::bigint, "
+        "coalesce(SUM(applicants) FILTER "
+        "(WHERE status_category = 'Accepted'), 0)::bigint, "
+        "SUM(gpa_sum) / NULLIF(SUM(gpa_n), 0) "
+        "FROM applicant_summary WHERE {where}"
+    ),
+}
+
+
+def _like_escape(text: str) -> str:
+    """Escape ``LIKE`` wildcards so user text matches literally."""
+    return text.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+
+def build_filters(term: Optional[str] = None,
+                  university: Optional[str] = None,
+                  degree: Optional[str] = None,
+                  nationality: Optional[str] = None,
+                  program: Optional[str] = None) -> dict[str, Any]:
+    """Turn user-facing arguments into ``FILTERS`` values.
+
+    Args:
+        term: E.g. ``'Fall 2026'`` or just ``'2026'``.
+        university: Start of the school name (``'Stanford'``);
+            case-insensitive.
+        degree: Text the degree contains (``'PhD'``).
+        nationality: ``'American'``, ``'International'`` or ``'Other'``.
+        program: Text the program contains (``'computer science'``).
+
+    Returns:
+        ``{filter_name: parameter_value}`` for the filters that are set.
+
+    Raises:
+        ValueError: If *term* has neither a season nor a year.
+    """
+    filters: dict[str, Any] = {}
+    if term:
+        season, year = parse_term(term)
+        if season is None and year is None:
+            raise ValueError(f'unrecognised term: {term!r}')
+        if season is not None:
+            filters['term_season'] = season
+        if year is not None:
+            filters['term_year'] = year
+    if degree:
+        filters['degree'] = f'%{_like_escape(degree)}%'
+    if nationality:
+        filters['nationality'] = nationality
+    if university:
+        filters['university'] = f'{_like_escape(university.lower())}%'
+    if program:
+        filters['program'] = f'%{_like_escape(program)}%'
+    return filters
+
+
+# ---------------------------------------------------------------------------
+# Prepared statement cache
+# ---------------------------------------------------------------------------
+
+class PreparedStatements:
+    """SQL built once per question shape, prepared once per connection.
+
+    A shape is any hashable key; the SQL for it comes from a builder
+    that is only called the first time the shape is seen.  Statement
+    names are derived from the SQL text, so the same shape always maps
+    to the same name on every connection.
+
+    Attributes:
+        prepares: ``PREPARE`` statements sent so far.
+        executions: ``EXECUTE`` statements sent so far.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        # shape -> (statement name, PREPARE statement, parameter count)
+        self._statements: dict[Any, tuple[str, str, int]] = {}
+        # connection -> names prepared on it (gone when it is closed)
+        self._prepared: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self.prepares = 0
+        self.executions = 0
+
+    def _statement(self, shape: Any,
+                   build: Callable[[], tuple[str, list[str]]],
+                   ) -> tuple[str, str, int]:
+        """Return the cached ``(name, prepare_sql, nparams)`` for *shape*."""
+        with self._lock:
+            if shape in self._statements:
+                return self._statements[shape]
+        sql, types = build()
+        name = 'gc_' + hashlib.sha1(sql.encode()).hexdigest()[:16]
+        args = f" ({', '.join(types)})" if types else ''
+        prepare = f"PREPARE {name}{args} AS {sql}"
+        with self._lock:
+            return self._statements.setdefault(
+                shape, (name, prepare, len(types)))
+
+    def execute(self, cur: psycopg2.extensions.cursor, metric: str,
+                shape: Any, build: Callable[[], tuple[str, list[str]]],
+                params: list[Any]) -> None:
+        """Run the statement for *shape* with *params* on *cur*.
+
+        Args:
+            cur: An open cursor; its connection is where the statement
+                is prepared.
+            metric: Name to record the execution under (see
+                ``src.metrics``).
+            shape: Cache key for the statement.
+            build: Returns ``(sql, parameter_types)`` with ``$1``…
+                placeholders; called only on a cache miss.
+            params: Values for the placeholders, in order.
+        """
+        name, prepare, nparams = self._statement(shape, build)
+        conn = cur.connection
+        with self._lock:
+            prepared = self._prepared.setdefault(conn, set())
+            needed = name not in prepared
+        if needed:
+            cur.execute(prepare)
+            with self._lock:
+                prepared.add(name)
+                self.prepares += 1
+        args = f" ({', '.join(['%s'] * nparams)})" if nparams else ''
+        metrics.execute(cur, metric, f'EXECUTE {name}{args}', params)
+        with self._lock:
+            self.executions += 1
+
+    def __len__(self) -> int:
+        """Number of distinct statements built so far."""
+        with self._lock:
+            return len(self._statements)
+
+
+# Process-wide cache used by the functions below
+STATEMENTS = PreparedStatements()
+
+
+# ---------------------------------------------------------------------------
+# Questions
+# ---------------------------------------------------------------------------
+
+def _build_stats(shape: tuple[str, ...]) -> Callable[[], tuple[str, list[str]]]:
+    """Builder for the cohort statistics statement of *shape*."""
+    def build() -> tuple[str, list[str]]:
+        use_summary = all(FILTERS[name][1] for name in shape)
+        table = 'applicant_summary' if use_summary else 'applicants'
+        predicates = [
+            FILTERS[name][1 if use_summary else 0].format(f'${i}')
+            for i, name in enumerate(shape, start=1)
+        ]
+        sql = _STATS_SQL[table].format(
+            where=' AND '.join(predicates) or 'TRUE')
+        return sql, [FILTERS[name][2] for name in shape]
+    return build
+
+
+def cohort_stats(term: Optional[str] = None,
+                 university: Optional[str] = None,
+                 degree: Optional[str] = None,
+                 nationality: Optional[str] = None,
+                 program: Optional[str] = None,
+                 database_url: Optional[str] = None) -> dict[str, Any]:
+    """Applicant count, acceptances and average GPA for a cohort.
+
+    Args:
+        term: Term filter, see ``build_filters``.
+        university: School-name prefix filter.
+        degree: Degree substring filter.
+        nationality: Nationality filter.
+        program: Program substring filter.
+        database_url: Optional Postgres connection string.
+
+    Returns:
+        A dict with ``applicants``, ``accepted``, ``acceptance_rate``
+        (percentage, 2 places) and ``avg_gpa`` (``None`` without GPAs).
+
+    Raises:
+        ValueError: If *term* cannot be parsed.
+    """
+    filters = build_filters(term, university, degree, nationality, program)
+    shape = tuple(filters)
+    with db.connection(database_url) as conn, conn.cursor() as cur:
+        STATEMENTS.execute(cur, 'cohort_stats', ('cohort_stats', shape),
+                           _build_stats(shape), list(filters.values()))
+        applicants, accepted, avg_gpa = cur.fetchone()
+    return {
+        'applicants': applicants,
+        'accepted': accepted,
+        'acceptance_rate': percentage(accepted, applicants),
+        'avg_gpa': round(float(avg_gpa), 2) if avg_gpa is not None else None,
+    }
+
+
+def acceptance_rate(term: Optional[str] = None,
+                    university: Optional[str] = None,
+                    degree: Optional[str] = None,
+                    nationality: Optional[str] = None,
+                    program: Optional[str] = None,
+                    database_url: Optional[str] = None) -> float:
+    """Percentage of a cohort that was accepted.
+
+    Args:
+        term: Term filter, see ``build_filters``.
+        university: School-name prefix filter.
+        degree: Degree substring filter.
+        nationality: Nationality filter.
+        program: Program substring filter.
+        database_url: Optional Postgres connection string.
+
+    Returns:
+        The acceptance rate rounded to 2 places (``0.0`` for an empty
+        cohort).
+    """
+    return cohort_stats(term, university, degree, nationality, program,
+                        database_url)['acceptance_rate']
@@ -6,10 +6,25 @@ the ``create_app`` factory pattern so that tests can inject fake
 scraper/loader functions without hitting the network.
 
 Routes:
-    GET  /                 - analysis dashboard
-    POST /pull_data        - kick off a background scrape + load
-    POST /update_analysis  - refresh results (blocked when busy)
-    GET  /status           - JSON busy-flag for frontend polling
+    GET  /                 - analysis dashboard (rendered once per
+                             dataset version, ETag/304 and gzip:
+                             see ``src.cache``)
+    POST /pull_data        - start a background pull job (pipelined:
+                             see ``src.pipeline``; one at a time
+                             across processes: see ``src.jobs``)
+    POST /pull_data/cancel - ask the running pull job to stop
+    GET  /pull_data/events - Server-Sent Events stream of pull progress
+    POST /update_analysis  - drop cached results (blocked when busy)
+    GET  /status           - running job with live progress/throughput
+    GET  /api/analysis     - analysis results as JSON (``?fields=``
+                             runs only the queries those fields need)
+    GET  /api/cohort       - applicants / acceptance rate / GPA for any
+                             term, school, degree, nationality, program
+                             (prepared statements: see ``src.analysis``)
+    GET  /api/cube         - any slice / breakdown of the precomputed
+                             cohort cube (see ``src.cube``)
+    GET  /metrics          - per-query timings (JSON, or Prometheus
+                             text: see ``src.metrics``)
 
 Author: Jie Xu
 Course: JHU Modern Software Concepts
@@ -18,19 +33,50 @@ Date: February 2026
 
 from __future__ import annotations
 
+import contextlib
+import decimal
+import json
 import os
 import threading
-from typing import Any, Callable, Optional
+import time
+from typing import Any, Callable, Hashable, Iterable, Iterator, Optional
 
 import psycopg2
-from flask import Flask, render_template, jsonify
+from flask import Flask, Response, render_template, jsonify, request
+
+from src import db, metrics
+from src.analysis import cohort_stats
+from src.cache import CachedPage, SharedVersionedCache, VersionedCache
+from src.cube import DIMENSIONS as CUBE_DIMENSIONS, load_cube
+from src.jobs import JobManager
+from src.load_data import refresh_cube
+from src.pipeline import parse_item, run_pipeline
+from src.query_data import (
+    ACCEPTANCE_BY_DEGREE_SQL, CONCURRENT_QUERIES, QUERY_WORKERS,
+    TOP_PROGRAMS_SQL, fetch_scalars, percentage, run_queries,
+)
+
+# How long an EventSource waits before reconnecting to /pull_data/events
+SSE_RETRY_MS = 3000
+
+
+# Query parameters /api/cohort passes on to ``analysis.cohort_stats``
+COHORT_FILTERS = ('term', 'university', 'degree', 'nationality', 'program')
+
+
+def _json_default(value: Any) -> Any:
+    """``json.dumps`` fallback: ``NUMERIC`` columns become numbers."""
+    if isinstance(value, decimal.Decimal):
+        return float(value)
+    raise TypeError(f'{type(value).__name__} is not JSON serializable')
 
 
 # ---------------------------------------------------------------------------
 # Database helpers
 # ---------------------------------------------------------------------------
 # NOTE: ``get_database_url`` is duplicated in load_data.py and query_data.py.
-# A shared config module would be cleaner, but keeping it simple for now.
+# Connections themselves come from the shared pool in ``src.db``;
+# ``get_db_connection`` remains for callers that want a dedicated one.
 
 def get_database_url() -> str:
     """Return the PostgreSQL connection string.
@@ -65,11 +111,53 @@ def get_db_connection(database_url: Optional[str] = None) -> psycopg2.extensions
 # Analysis queries (all nine required + two custom)
 # ---------------------------------------------------------------------------
 
+# Every result field: the query it comes from (a name in
+# ``query_data.CONCURRENT_QUERIES``) and how its value is derived from
+# that query's columns.  Row-set queries appear under their own name.
+# ``/api/analysis`` uses the sources to run only what was asked for.
+ANALYSIS_FIELDS: dict[str, tuple[str, Callable[[dict[str, Any]], Any]]] = {
+    'q1_fall_2026_count': ('summary', lambda s: s['fall_2026_count']),
+
+    # Q2 — International share (percentage guards against an empty table)
+    'total_count': ('summary', lambda s: s['total']),
+    'international_count': ('summary', lambda s: s['international']),
+    'american_count': ('summary', lambda s: s['american']),
+    'international_percentage': ('summary', lambda s: percentage(
+        s['international'], s['total'])),
+
+    # Q3/Q4/Q6 averages are NULL with no scores; show 0 instead
+    'avg_gpa': ('summary', lambda s: s['avg_gpa'] or 0),
+    'avg_gre': ('summary', lambda s: s['avg_gre'] or 0),
+    'avg_gre_v': ('summary', lambda s: s['avg_gre_v'] or 0),
+    'avg_gre_aw': ('summary', lambda s: s['avg_gre_aw'] or 0),
+    'american_fall_2026_gpa': ('summary',
+                               lambda s: s['american_fall_2026_gpa'] or 0),
+
+    # Q5 — Fall 2025 acceptance rate
+    'fall_2025_total': ('summary', lambda s: s['fall_2025_total']),
+    'fall_2025_accepted': ('summary', lambda s: s['fall_2025_accepted']),
+    'fall_2025_acceptance_rate': ('summary', lambda s: percentage(
+        s['fall_2025_accepted'], s['fall_2025_total'])),
+    'fall_2026_acceptance_gpa': ('summary',
+                                 lambda s: s['fall_2026_acceptance_gpa'] or 0),
+
+    # Q7–Q9 — program/university counts
+    'jhu_masters_cs': ('q7', lambda s: s['jhu_masters_cs']),
+    'phd_cs_top_schools': ('q8', lambda s: s['phd_cs_top_schools']),
+    'phd_cs_top_schools_llm': ('q9', lambda s: s['phd_cs_top_schools_llm']),
+
+    # Custom — top 10 programs and acceptance rate by degree
+    'top_programs': ('custom_1', lambda s: s['custom_1']),
+    'acceptance_by_degree': ('custom_2', lambda s: s['custom_2']),
+}
+
+
 def run_analysis_queries(database_url: Optional[str] = None) -> dict[str, Any]:
     """Execute all analysis queries and return template-ready results.
 
     The returned dict keys correspond exactly to the Jinja variables
-    used in ``templates/index.html`` (e.g. ``q1_fall_2026_count``).
+    used in ``templates/index.html`` (e.g. ``q1_fall_2026_count``),
+    and are the keys of ``ANALYSIS_FIELDS``.
 
     Args:
         database_url: Optional Postgres connection string override.
@@ -77,191 +165,97 @@ def run_analysis_queries(database_url: Optional[str] = None) -> dict[str, Any]:
     Returns:
         A dictionary of analysis results.  Empty dict on DB error.
     """
-    results: dict[str, Any] = {}
-    conn = get_db_connection(database_url)
-    cur = conn.cursor()
-
-    try:
-        # Q1 — How many applicants applied for Fall 2026?
-        cur.execute(
-            "SELECT COUNT(*) FROM applicants WHERE term = 'Fall 2026'"
-        )
-        results['q1_fall_2026_count'] = cur.fetchone()[0]
-
-        # Q2 — What percentage of entries are international students?
-        cur.execute("SELECT COUNT(*) FROM applicants")
-        total = cur.fetchone()[0]
-        results['total_count'] = total
-
-        cur.execute(
-            "SELECT COUNT(*) FROM applicants "
-            "WHERE us_or_international = 'International'"
-        )
-        results['international_count'] = cur.fetchone()[0]
+    url = database_url or get_database_url()
 
-        cur.execute(
-            "SELECT COUNT(*) FROM applicants "
-            "WHERE us_or_international = 'American'"
-        )
-        results['american_count'] = cur.fetchone()[0]
+    # Borrow a pooled connection; it is returned even if a query fails.
+    # Every Q1–Q9 number comes back from ONE statement (``SCALARS_SQL``:
+    # FILTER aggregates over the summary table plus one index-driven
+    # pass over applicants), so the dashboard costs three round trips
+    # instead of one per statistic.
+    with db.connection(url) as conn, conn.cursor() as cur:
+        s = fetch_scalars(cur)
+        metrics.execute(cur, 'custom_1', TOP_PROGRAMS_SQL)
+        s['custom_1'] = cur.fetchall()
+        metrics.execute(cur, 'custom_2', ACCEPTANCE_BY_DEGREE_SQL)
+        s['custom_2'] = cur.fetchall()
 
-        # Percentage needs a guard against division-by-zero
-        if total > 0:
-            results['international_percentage'] = round(
-                (results['international_count'] / total) * 100, 2
-            )
-        else:
-            results['international_percentage'] = 0.00
+    return {field: value(s) for field, (_, value) in ANALYSIS_FIELDS.items()}
 
-        # Q3 — Average GPA, GRE, GRE-V, GRE-AW
-        cur.execute(
-            "SELECT AVG(gpa) FROM applicants WHERE gpa IS NOT NULL"
-        )
-        results['avg_gpa'] = cur.fetchone()[0] or 0
 
-        cur.execute(
-            "SELECT AVG(gre) FROM applicants WHERE gre IS NOT NULL"
-        )
-        results['avg_gre'] = cur.fetchone()[0] or 0
+def analysis_fields(fields: Iterable[str], database_url: Optional[str] = None,
+                    cache: Optional[VersionedCache] = None) -> dict[str, Any]:
+    """Compute selected ``ANALYSIS_FIELDS``, running only their queries.
 
-        cur.execute(
-            "SELECT AVG(gre_v) FROM applicants WHERE gre_v IS NOT NULL"
-        )
-        results['avg_gre_v'] = cur.fetchone()[0] or 0
-
-        cur.execute(
-            "SELECT AVG(gre_aw) FROM applicants WHERE gre_aw IS NOT NULL"
-        )
-        results['avg_gre_aw'] = cur.fetchone()[0] or 0
+    Each source query's rows are cached per dataset version, so asking
+    for ``avg_gpa`` never scans ``applicants``, and a later request for
+    ``total_count`` reuses the summary row already fetched.
 
-        # Q4 — Average GPA of American students in Fall 2026
-        cur.execute(
-            "SELECT AVG(gpa) FROM applicants "
-            "WHERE us_or_international = 'American' "
-            "AND term = 'Fall 2026' AND gpa IS NOT NULL"
-        )
-        results['american_fall_2026_gpa'] = cur.fetchone()[0] or 0
+    Args:
+        fields: Names from ``ANALYSIS_FIELDS``.
+        database_url: Optional Postgres connection string override.
+        cache: Where to keep source rows; a throwaway cache if omitted.
 
-        # Q5 — Fall 2025 acceptance rate
-        cur.execute(
-            "SELECT COUNT(*) FROM applicants WHERE term = 'Fall 2025'"
-        )
-        f25_total = cur.fetchone()[0]
-        results['fall_2025_total'] = f25_total
-
-        # Using ILIKE '%%Accept%%' so it matches "Accepted", "Accepted via Email", etc.
-        # Double-%% is required because psycopg2 treats a single % as a parameter marker.
-        cur.execute(
-            "SELECT COUNT(*) FROM applicants "
-            "WHERE term = 'Fall 2025' AND status ILIKE '%%Accept%%'"
+    Returns:
+        ``{field: value}`` in the order of *fields*.
+    """
+    fields = list(fields)
+    sources = list(dict.fromkeys(ANALYSIS_FIELDS[f][0] for f in fields))
+
+    def _run(missing: list[Hashable]) -> dict[Hashable, Any]:
+        names = [key[1] for key in missing]
+        fetched, _ = run_queries(
+            {name: CONCURRENT_QUERIES[name] for name in names},
+            database_url or get_database_url(),
+            max_workers=min(QUERY_WORKERS, len(names)),
         )
-        f25_accepted = cur.fetchone()[0]
-        results['fall_2025_accepted'] = f25_accepted
-
-        if f25_total > 0:
-            results['fall_2025_acceptance_rate'] = round(
-                (f25_accepted / f25_total) * 100, 2
-            )
+        return {('source', name): result for name, result in fetched.items()}
+
+    rows = (cache or VersionedCache()).get_many(
+        [('source', name) for name in sources], _run)
+    s: dict[str, Any] = {}
+    for (_, name), (columns, result) in rows.items():
+        if name.startswith('custom_'):
+            s[name] = result
         else:
-            results['fall_2025_acceptance_rate'] = 0.00
-
-        # Q6 — Average GPA of accepted Fall 2026 applicants
-        cur.execute(
-            "SELECT AVG(gpa) FROM applicants "
-            "WHERE term = 'Fall 2026' AND status ILIKE '%%Accept%%' "
-            "AND gpa IS NOT NULL"
-        )
-        results['fall_2026_acceptance_gpa'] = cur.fetchone()[0] or 0
-
-        # Q7 — How many applicants to JHU Masters in Computer Science?
-        cur.execute(
-            "SELECT COUNT(*) FROM applicants "
-            "WHERE (program ILIKE '%%johns hopkins%%' "
-            "OR program ILIKE '%%jhu%%') "
-            "AND program ILIKE '%%computer science%%' "
-            "AND degree ILIKE '%%master%%'"
-        )
-        results['jhu_masters_cs'] = cur.fetchone()[0]
-
-        # Q8 — 2026 PhD CS acceptances at Georgetown / MIT / Stanford / CMU
-        cur.execute(
-            "SELECT COUNT(*) FROM applicants "
-            "WHERE term ILIKE '%%2026%%' "
-            "AND status ILIKE '%%Accept%%' "
-            "AND degree ILIKE '%%PhD%%' "
-            "AND program ILIKE '%%computer science%%' "
-            "AND (program ILIKE '%%georgetown%%' "
-            "OR program ILIKE '%%mit%%' "
-            "OR program ILIKE '%%stanford%%' "
-            "OR program ILIKE '%%carnegie mellon%%')"
-        )
-        results['phd_cs_top_schools'] = cur.fetchone()[0]
-
-        # Q9 — Same as Q8 but using LLM-generated fields for comparison
-        cur.execute(
-            "SELECT COUNT(*) FROM applicants "
-            "WHERE term ILIKE '%%2026%%' "
-            "AND status ILIKE '%%Accept%%' "
-            "AND degree ILIKE '%%PhD%%' "
-            "AND llm_generated_program ILIKE '%%computer science%%' "
-            "AND (llm_generated_university ILIKE '%%georgetown%%' "
-            "OR llm_generated_university ILIKE '%%mit%%' "
-            "OR llm_generated_university ILIKE '%%stanford%%' "
-            "OR llm_generated_university ILIKE '%%carnegie mellon%%')"
-        )
-        results['phd_cs_top_schools_llm'] = cur.fetchone()[0]
-
-        # Custom Q1 — Top 10 most popular programs (by LLM-cleaned name)
-        cur.execute(
-            "SELECT llm_generated_program, COUNT(*) AS cnt "
-            "FROM applicants WHERE llm_generated_program IS NOT NULL "
-            "GROUP BY llm_generated_program ORDER BY cnt DESC LIMIT 10"
-        )
-        results['top_programs'] = cur.fetchall()
-
-        # Custom Q2 — Acceptance rate broken down by degree type
-        cur.execute(
-            "SELECT degree, COUNT(*) AS total, "
-            "SUM(CASE WHEN status ILIKE '%%Accept%%' THEN 1 ELSE 0 END) "
-            "AS accepted, "
-            "ROUND(100.0 * SUM(CASE WHEN status ILIKE '%%Accept%%' "
-            "THEN 1 ELSE 0 END) / COUNT(*), 2) AS rate "
-            "FROM applicants WHERE degree IS NOT NULL "
-            "GROUP BY degree ORDER BY total DESC"
-        )
-        results['acceptance_by_degree'] = cur.fetchall()
-
-    finally:
-        # Always close the cursor and connection, even if a query fails
-        cur.close()
-        conn.close()
-
-    return results
+            s.update(zip(columns, result[0]))
+    return {field: ANALYSIS_FIELDS[field][1](s) for field in fields}
 
 
 # ---------------------------------------------------------------------------
 # Default scraper / loader (imported lazily to avoid circular imports)
 # ---------------------------------------------------------------------------
 
-def _default_scraper() -> list[dict]:
-    """Import ``src.scrape`` and pull ~10 pages of results.
+def _default_scraper(on_wait: Optional[Callable[[float], None]] = None,
+                     ) -> Iterator[str]:
+    """Import ``src.scrape`` and stream ~10 pages of results.
+
+    Args:
+        on_wait: Told about every rate-limit sleep (see
+            ``scrape.fetch_pages``).
 
     Returns:
-        A list of raw applicant dicts from Grad Cafe.
+        A generator of raw HTML pages from Grad Cafe; the ingest
+        pipeline parses them while later pages are still downloading.
     """
-    from src.scrape import scrape_data
-    return scrape_data(result_type='all', num_pages=10, delay=0.5)
+    from src.scrape import fetch_pages
+    return fetch_pages(result_type='all', num_pages=10, delay=0.5,
+                       on_wait=on_wait)
 
 
-def _default_loader(records: list[dict], database_url: str) -> None:
+def _default_loader(records: list[dict], database_url: str) -> Optional[int]:
     """Import ``src.load_data`` and bulk-insert the given records.
 
+    Called once per batch by the ingest pipeline.
+
     Args:
         records: List of applicant dicts to insert.
         database_url: PostgreSQL connection string.
+
+    Returns:
+        The number of new rows actually inserted.
     """
     from src.load_data import insert_records
-    insert_records(records, database_url)
+    return insert_records(records, database_url)
 
 
 # ---------------------------------------------------------------------------
@@ -278,7 +272,11 @@ def create_app(config: Optional[dict] = None) -> Flask:
     Args:
         config: Optional dict of configuration overrides.  Recognised
             keys include ``DATABASE_URL``, ``SCRAPER_FUNC``,
-            ``LOADER_FUNC``, and ``TESTING``.
+            ``PARSER_FUNC``, ``LOADER_FUNC``, ``TESTING``, the
+            ``INGEST_*`` pipeline sizes and job limits, the
+            ``EVENTS_*`` stream limits, ``SHARED_STATE``, and ``JOBS``
+            (a ready-made ``JobManager``).  ``SCRAPER_FUNC`` is called with an
+            ``on_wait`` keyword (see ``scrape.fetch_pages``).
 
     Returns:
         A fully configured Flask application instance.
@@ -291,83 +289,414 @@ def create_app(config: Optional[dict] = None) -> Flask:
     # Sensible defaults — overridden by ``config`` dict if provided
     app.config['DATABASE_URL'] = get_database_url()
     app.config['SCRAPER_FUNC'] = _default_scraper
+    app.config['PARSER_FUNC'] = parse_item
     app.config['LOADER_FUNC'] = _default_loader
-    app.config['_busy'] = False  # busy flag prevents concurrent pulls
+    # Ingest pipeline sizing: parse/write threads, queue depth, batch rows
+    app.config['INGEST_PARSE_WORKERS'] = 2
+    app.config['INGEST_WRITE_WORKERS'] = 1
+    app.config['INGEST_QUEUE_SIZE'] = 8
+    app.config['INGEST_BATCH_SIZE'] = 500
+    # Pull job limits: lease without heartbeat, hard timeout, and how
+    # often progress is written to ``ingest_jobs``
+    app.config['INGEST_LEASE_SECONDS'] = 60
+    app.config['INGEST_TIMEOUT_SECONDS'] = 1800
+    app.config['INGEST_HEARTBEAT_SECONDS'] = 1.0
+    # /pull_data/events: comment line after this much silence, and
+    # end the stream after this long (EventSource reconnects by itself)
+    app.config['EVENTS_KEEPALIVE_SECONDS'] = 15.0
+    app.config['EVENTS_MAX_SECONDS'] = 300.0
+    # Each open stream holds a worker thread: refuse more than this many
+    # per process (the page falls back to polling /status)
+    app.config['EVENTS_MAX_STREAMS'] = 4
+    # Cached values per process (dashboard sources, pages and one
+    # response per ``/api/analysis?fields=`` set); least recently used
+    # ones are dropped past this
+    app.config['ANALYSIS_CACHE_ENTRIES'] = 256
+    # Keep the dataset version in Postgres so several worker processes
+    # agree on it (see ``src.wsgi``); the dev server can stay in memory
+    app.config['SHARED_STATE'] = False
 
     if config:
         app.config.update(config)
 
+    # Analysis results, reused until a pull completes or is requested
+    if 'ANALYSIS_CACHE' not in app.config:
+        app.config['ANALYSIS_CACHE'] = (
+            SharedVersionedCache(app.config['DATABASE_URL'],
+                                 app.config['ANALYSIS_CACHE_ENTRIES'])
+            if app.config['SHARED_STATE']
+            else VersionedCache(app.config['ANALYSIS_CACHE_ENTRIES'])
+        )
+
+    # One pull at a time, across every process sharing the database
+    if 'JOBS' not in app.config:
+        app.config['JOBS'] = JobManager(
+            app.config['DATABASE_URL'],
+            lease_seconds=app.config['INGEST_LEASE_SECONDS'],
+            timeout_seconds=app.config['INGEST_TIMEOUT_SECONDS'],
+            heartbeat_seconds=app.config['INGEST_HEARTBEAT_SECONDS'],
+        )
+
+    # /pull_data/events responses currently open in this process
+    streams = {'open': 0}
+    streams_lock = threading.Lock()
+
     # --- Route definitions ---
 
     @app.route('/')
     def index():
         """Render the main analysis dashboard.
 
-        If the database is unreachable (e.g. first run before any data
-        is loaded), the page still renders with empty results.
+        The rendered page (and its compressed variants) is cached in
+        ``ANALYSIS_CACHE`` until the dataset version changes, so most
+        loads are a dictionary lookup — or an empty 304 when the
+        browser's ``If-None-Match`` still matches.  If the database is
+        unreachable (e.g. first run before any data is loaded), the
+        page still renders with empty results, and nothing is cached.
         """
+        cache: VersionedCache = app.config['ANALYSIS_CACHE']
+
+        def _render() -> CachedPage:
+            results = cache.get(
+                'analysis',
+                lambda: run_analysis_queries(app.config['DATABASE_URL']),
+            )
+            return CachedPage(render_template('index.html', results=results))
+
         try:
-            results = run_analysis_queries(app.config['DATABASE_URL'])
+            page = cache.get('page', _render)
         except Exception:
             # DB might not be set up yet — show the page anyway
-            results = {}
-        return render_template('index.html', results=results)
+            page = CachedPage(render_template('index.html', results={}))
+        return page.respond(request)
 
     @app.route('/pull_data', methods=['POST'])
     def pull_data():
-        """Start a data-pull cycle (scrape + load).
+        """Start a data-pull job (scrape + load).
 
         Returns:
-            200 with ``{"ok": true}`` when the pull starts.
+            200 with ``{"ok": true, "job_id": ...}`` when the pull starts.
             409 with ``{"busy": true}`` if a pull is already running.
         """
-        if app.config['_busy']:
+        jobs: JobManager = app.config['JOBS']
+        job_id = jobs.start()
+        if job_id is None:
             return jsonify({'ok': False, 'busy': True}), 409
 
-        app.config['_busy'] = True
         scraper_fn: Callable = app.config['SCRAPER_FUNC']
+        parser_fn: Callable = app.config['PARSER_FUNC']
         loader_fn: Callable = app.config['LOADER_FUNC']
         db_url: str = app.config['DATABASE_URL']
 
-        def _run_pull() -> None:
-            """Inner helper — runs scraper then loader; clears busy flag."""
+        def _pipeline(progress: Callable) -> dict[str, Any]:
+            """Inner helper — the pull itself, heartbeating via *progress*."""
+            counters: dict[str, Any] = {}
+            waits = {'waits': 0, 'wait_seconds': 0.0}
+
+            def _report(latest: dict[str, Any]) -> None:
+                counters.update(latest)
+                progress({**counters, **waits})
+
+            def _on_wait(seconds: float) -> None:
+                waits['waits'] += 1
+                waits['wait_seconds'] += seconds
+                _report({})
+
+            def _publish() -> None:
+                # Rebuild the cube and drop cached results before the
+                # job is marked finished, so a client reacting to the
+                # "done" event sees new data.  The rebuild reports no
+                # progress, so the lease is renewed while it runs.
+                with jobs.keep_alive(job_id):
+                    try:
+                        refresh_cube(db_url)
+                    finally:
+                        app.config['ANALYSIS_CACHE'].bump()
+
             try:
-                records = scraper_fn()
-                loader_fn(records, db_url)
-            finally:
-                app.config['_busy'] = False
+                stats = run_pipeline(
+                    scraper_fn(on_wait=_on_wait), loader_fn, db_url,
+                    parse_fn=parser_fn,
+                    parse_workers=app.config['INGEST_PARSE_WORKERS'],
+                    write_workers=app.config['INGEST_WRITE_WORKERS'],
+                    queue_size=app.config['INGEST_QUEUE_SIZE'],
+                    batch_size=app.config['INGEST_BATCH_SIZE'],
+                    on_progress=_report,
+                )
+            except BaseException:
+                # Even a failed pull may have written some batches; but
+                # the job records the pipeline's error, not a cleanup one
+                with contextlib.suppress(Exception):
+                    _publish()
+                raise
+            _publish()
+            return {**stats, **waits}
+
+        def _run_pull() -> None:
+            """Inner helper — runs the pipeline as job *job_id*."""
+            jobs.run(job_id, _pipeline)
 
         if app.config.get('TESTING'):
             # In test mode, run synchronously so assertions work immediately
             _run_pull()
         else:
-            # In production, run in a background thread to avoid blocking
-            thread = threading.Thread(target=_run_pull)
-            thread.daemon = True
+            # In production, run in a background thread to avoid blocking;
+            # if this process dies the job's lease simply runs out
+            thread = threading.Thread(
+                target=_run_pull, name=f'ingest-job-{job_id}', daemon=True
+            )
             thread.start()
 
-        return jsonify({'ok': True}), 200
+        return jsonify({'ok': True, 'job_id': job_id}), 200
+
+    @app.route('/pull_data/cancel', methods=['POST'])
+    def cancel_pull():
+        """Ask the running pull job, in whichever process, to stop.
+
+        Returns:
+            200 with ``{"cancelled": true}`` if a job was flagged, or
+            ``{"cancelled": false}`` when nothing was running.
+        """
+        cancelled = app.config['JOBS'].cancel()
+        return jsonify({'ok': True, 'cancelled': cancelled}), 200
+
+    @app.route('/pull_data/events')
+    def pull_events():
+        """Stream pull-job progress as Server-Sent Events.
+
+        One long-lived response replaces polling ``/status``.  Events
+        carry ``{"job": ..., "data_version": ...}`` where ``job`` has
+        the same fields as in ``/status``:
+
+        * ``snapshot`` — sent first: the running or most recent job.
+        * ``progress`` — pages fetched, records parsed, rows inserted
+          and rate-limit waits (``waits``, ``wait_seconds``), at most
+          once per ``INGEST_HEARTBEAT_SECONDS``.
+        * ``done`` — the job finished (``job.status`` says how).
+
+        A ``: keepalive`` comment is sent after
+        ``EVENTS_KEEPALIVE_SECONDS`` of silence, and the stream ends
+        after ``EVENTS_MAX_SECONDS``; browsers reconnect automatically.
+        Every stream in a process shares one LISTEN connection (see
+        ``jobs.JobListener``), but each holds a worker thread, so at
+        most ``EVENTS_MAX_STREAMS`` are open per process.
+
+        Returns:
+            A ``text/event-stream`` response, or 503 with
+            ``Retry-After`` when the stream limit is reached.
+        """
+        jobs: JobManager = app.config['JOBS']
+        cache: VersionedCache = app.config['ANALYSIS_CACHE']
+        keepalive = app.config['EVENTS_KEEPALIVE_SECONDS']
+        ends_at = time.monotonic() + app.config['EVENTS_MAX_SECONDS']
+
+        with streams_lock:
+            if streams['open'] >= app.config['EVENTS_MAX_STREAMS']:
+                return (jsonify({'ok': False, 'error': 'too many streams'}),
+                        503, {'Retry-After': str(SSE_RETRY_MS // 1000)})
+            streams['open'] += 1
+
+        def _release() -> None:
+            with streams_lock:
+                streams['open'] -= 1
+
+        def _stream() -> Iterator[str]:
+            events = jobs.watch(keepalive)
+            try:
+                yield f'retry: {SSE_RETRY_MS}\n\n'
+                for kind, job in events:
+                    if kind == 'keepalive':
+                        yield ': keepalive\n\n'
+                    else:
+                        data = json.dumps({'job': job,
+                                           'data_version': cache.version})
+                        yield f'event: {kind}\ndata: {data}\n\n'
+                    if time.monotonic() >= ends_at:
+                        break
+            finally:
+                events.close()
+
+        response = Response(_stream(), mimetype='text/event-stream', headers={
+            'Cache-Control': 'no-cache',
+            # Ask reverse proxies (nginx) not to buffer the stream
+            'X-Accel-Buffering': 'no',
+        })
+        # Runs even if the client leaves before the first event
+        response.call_on_close(_release)
+        return response
 
     @app.route('/update_analysis', methods=['POST'])
     def update_analysis():
         """Refresh the analysis page.
 
+        Rebuilds the cohort cube and bumps the dataset version so the
+        next page load re-runs the queries (e.g. after data was loaded
+        outside the app).
+
         Returns:
             200 with ``{"ok": true}`` on success.
             409 with ``{"busy": true}`` if a pull is in progress.
         """
-        if app.config['_busy']:
+        if app.config['JOBS'].current() is not None:
             return jsonify({'ok': False, 'busy': True}), 409
+        refresh_cube(app.config['DATABASE_URL'])
+        app.config['ANALYSIS_CACHE'].bump()
         return jsonify({'ok': True}), 200
 
     @app.route('/status')
     def status():
-        """Return the current busy state as JSON.
+        """Return the current pull job and recent results as JSON.
+
+        ``job`` is the running job with live counters (pages, records
+        parsed, rows inserted) and throughput (``pages_per_sec``,
+        ``records_per_sec``, ``rows_per_sec``), or ``null`` when idle.
+        ``last_pull`` summarises the most recent finished job, and
+        ``data_version`` changes whenever cached results are dropped.
+        """
+        jobs: JobManager = app.config['JOBS']
+        job = jobs.current()
+        last = jobs.latest_finished()
+        return jsonify({
+            'is_running': job is not None,
+            'job': job,
+            'last_pull': last and {
+                'status': last['status'],
+                'fetched': last['fetched'],
+                'inserted': last['inserted'],
+                'seconds': last['elapsed_seconds'],
+                'error': last['error'],
+            },
+            'data_version': app.config['ANALYSIS_CACHE'].version,
+        })
+
+    @app.route('/api/analysis')
+    def api_analysis():
+        """Return analysis results as JSON.
+
+        ``?fields=avg_gpa,jhu_masters_cs`` limits the response to those
+        ``ANALYSIS_FIELDS`` (default: all of them) and runs only the
+        queries behind them.  Source rows and finished responses are
+        cached per dataset version; responses carry an ``ETag`` and
+        are served gzip/brotli-compressed when the client accepts it.
+
+        Returns:
+            200 with ``{"data_version": ..., "fields": {...}}``.
+            400 with the list of valid names if a field is unknown.
+            503 if the database cannot be reached.
+        """
+        requested = [f.strip() for f in
+                     request.args.get('fields', '').split(',') if f.strip()]
+        unknown = sorted(set(requested) - set(ANALYSIS_FIELDS))
+        if unknown:
+            return jsonify({'ok': False, 'unknown': unknown,
+                            'available': list(ANALYSIS_FIELDS)}), 400
+        # Canonical order, so "a,b" and "b,a" share one cache entry
+        fields = tuple(f for f in ANALYSIS_FIELDS
+                       if not requested or f in requested)
+        cache: VersionedCache = app.config['ANALYSIS_CACHE']
+
+        def _render() -> CachedPage:
+            version = cache.version
+            values = analysis_fields(fields, app.config['DATABASE_URL'],
+                                     cache)
+            body = json.dumps({'data_version': version, 'fields': values},
+                              default=_json_default)
+            return CachedPage(body, mimetype='application/json')
+
+        try:
+            page = cache.get(('api', fields), _render)
+        except psycopg2.Error:
+            return jsonify({'ok': False, 'error': 'database unavailable'}), 503
+        return page.respond(request)
+
+    @app.route('/api/cohort')
+    def api_cohort():
+        """Answer an ad-hoc cohort question from query parameters.
+
+        ``?term=Fall 2026&university=Stanford&degree=PhD`` (any subset
+        of ``term``, ``university``, ``degree``, ``nationality`` and
+        ``program``) runs one prepared statement; see
+        ``analysis.cohort_stats`` for how each filter matches.
 
-        The frontend uses this endpoint to poll whether a pull is
-        still in progress.
+        Returns:
+            200 with ``{"filters": {...}, "applicants", "accepted",
+            "acceptance_rate", "avg_gpa"}``.
+            400 if the term cannot be parsed.
+            503 if the database cannot be reached.
         """
-        return jsonify({'is_running': app.config['_busy']})
+        filters = {name: request.args[name]
+                   for name in COHORT_FILTERS if request.args.get(name)}
+        try:
+            stats = cohort_stats(**filters,
+                                 database_url=app.config['DATABASE_URL'])
+        except ValueError as exc:
+            return jsonify({'ok': False, 'error': str(exc)}), 400
+        except psycopg2.Error:
+            return jsonify({'ok': False, 'error': 'database unavailable'}), 503
+        return jsonify({'filters': filters, **stats})
+
+    @app.route('/api/cube')
+    def api_cube():
+        """Answer a slice of the precomputed cohort cube.
+
+        ``?term=Fall 2026&degree=PhD`` (any of ``term``, ``status``,
+        ``degree``, ``nationality`` and ``university``, matched exactly)
+        returns that cell; adding ``&by=university,nationality`` returns
+        one cell per value combination instead.  The cube is read once
+        per dataset version, so answers never touch ``applicants``.
+
+        Returns:
+            200 with ``{"filters": {...}, "applicants", "accepted",
+            "acceptance_rate", "avg_gpa"}``, or with ``{"filters",
+            "by", "cells": [...]}`` when ``by`` is given.
+            400 for an unknown dimension or unparseable term.
+            503 if the database cannot be reached.
+        """
+        filters = {name: request.args[name]
+                   for name in CUBE_DIMENSIONS if request.args.get(name)}
+        by = [d.strip() for d in request.args.get('by', '').split(',')
+              if d.strip()]
+        url = app.config['DATABASE_URL']
+        try:
+            cube = app.config['ANALYSIS_CACHE'].get(
+                'cube', lambda: load_cube(url))
+            if by:
+                return jsonify({'filters': filters, 'by': by,
+                                'cells': cube.breakdown(by, **filters)})
+            return jsonify({'filters': filters, **cube.slice(**filters)})
+        except ValueError as exc:
+            return jsonify({'ok': False, 'error': str(exc)}), 400
+        except psycopg2.Error:
+            return jsonify({'ok': False, 'error': 'database unavailable'}), 503
+
+    @app.route('/metrics')
+    def query_metrics():
+        """Expose per-query timings recorded by ``src.metrics``.
+
+        Returns JSON by default.  Prometheus text format is returned for
+        ``?format=prometheus`` or when the ``Accept`` header prefers
+        ``text/plain`` (as Prometheus scrapers do).
+        """
+        registry = metrics.REGISTRY
+        wanted = request.args.get('format')
+        if wanted is None:
+            # Compare base types: scrapers send parameters such as
+            # ``text/plain;version=0.0.4`` that best_match will not match
+            quality = {
+                value.split(';')[0].strip(): q
+                for value, q in request.accept_mimetypes
+            }
+            if quality.get('text/plain', 0) > quality.get('application/json', 0):
+                wanted = 'prometheus'
+        if wanted == 'prometheus':
+            return Response(
+                registry.prometheus(),
+                mimetype='text/plain; version=0.0.4',
+            )
+        return jsonify({
+            'queries': registry.snapshot(),
+            'explain': registry.explain,
+        })
 
     return app
 
@@ -377,9 +706,18 @@ def create_app(config: Optional[dict] = None) -> Flask:
 # ---------------------------------------------------------------------------
 
 def main() -> None:
-    """Start the Flask development server on port 5000."""
+    """Start the Flask development server.
+
+    ``HOST`` / ``PORT`` choose the address (default ``127.0.0.1:5000``)
+    and ``FLASK_DEBUG=1`` turns on the debugger and reloader.  For
+    production, run ``src.wsgi:app`` under a multi-worker WSGI server.
+    """
     application = create_app()
-    application.run(debug=True, port=5000)
+    application.run(
+        host=os.environ.get('HOST', '127.0.0.1'),
+        port=int(os.environ.get('PORT', '5000')),
+        debug=os.environ.get('FLASK_DEBUG', '').lower() in ('1', 'true', 'yes'),
+    )
 
 
 if __name__ == '__main__':  # pragma: no cover
@@ -0,0 +1,320 @@
+"""In-process cache for results that only change when the data does.
+
+The dashboard numbers depend only on the rows in ``applicants``, and
+those change only when a pull finishes.  ``VersionedCache`` remembers
+computed values against a *dataset version*: an integer that the app
+bumps whenever new data may have landed (a pull completes, or a user
+asks for ``/update_analysis``).  Until the next bump, a lookup is one
+dictionary access under a lock — no database round trip at all.
+
+That version lives in process memory, which is only correct while a
+single process serves the app.  ``SharedVersionedCache`` keeps the
+number in Postgres instead (the one-row ``dataset_version`` table), so
+a pull finished by any worker invalidates every worker's cache; each
+lookup then costs one primary-key read rather than a full analysis.
+
+``CachedPage`` goes one step further for HTML: it holds the rendered
+bytes together with gzip (and, if the optional ``brotli`` package is
+installed, brotli) variants and a strong ``ETag``, so a cached page
+is served without re-rendering or re-compressing it, and a client
+that already has it gets an empty ``304 Not Modified``.
+
+Author: Jie Xu
+Course: JHU Modern Software Concepts
+Date: February 2026
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Callable, Hashable, Iterable, Iterator
+
+from flask import Request, Response
+
+from src import db
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Clients must revalidate with ``If-None-Match`` before reusing a copy,
+# since the page changes whenever a pull finishes
+CACHE_CONTROL = 'no-cache'
+
+
+class VersionedCache:
+    """Thread-safe memo of computed values, cleared on every version bump.
+
+    Misses on the same key are computed by one thread at a time, so a
+    burst of requests right after a bump runs the expensive query once
+    instead of once per request; misses on unrelated keys proceed in
+    parallel.  A value whose computation overlapped a bump is returned
+    to its caller but not stored, because it may predate the new data.
+
+    At most *max_entries* values are kept per version; past that the
+    least recently used one is dropped, so clients cycling through
+    ``?fields=`` subsets cannot grow the cache without bound.
+
+    Args:
+        max_entries: Values kept before evicting the least recently
+            used one.
+    """
+
+    def __init__(self, max_entries: int = 256) -> None:
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._version = 0
+        self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+        # key -> [compute lock, number of threads using it]; re-entrant
+        # so a compute() may itself read other cached keys
+        self._key_locks: dict[Hashable, list] = {}
+
+    # --- version source (overridden by SharedVersionedCache) ---
+
+    def _read_version(self) -> int:
+        """Return the authoritative dataset version."""
+        return self._version
+
+    def _next_version(self) -> int:
+        """Advance the authoritative dataset version and return it."""
+        return self._version + 1
+
+    def _sync(self, version: int) -> int:
+        """Adopt *version* if it is newer, dropping stale entries.
+
+        Versions only move forward, so a read that raced with a bump
+        can never take the cache back to an older one.
+        """
+        with self._lock:
+            if version > self._version:
+                self._version = version
+                self._entries.clear()
+            return self._version
+
+    @contextmanager
+    def _computing(self, keys: list[Hashable]) -> Iterator[None]:
+        """Hold the compute lock of every key in *keys*.
+
+        Locks are taken in a fixed order so two callers wanting
+        overlapping keys cannot deadlock, and are forgotten once no
+        thread needs them.
+        """
+        keys = sorted(keys, key=repr)
+        with self._lock:
+            locks = []
+            for key in keys:
+                slot = self._key_locks.setdefault(key, [threading.RLock(), 0])
+                slot[1] += 1
+                locks.append(slot[0])
+        held = []
+        try:
+            for lock in locks:
+                lock.acquire()
+                held.append(lock)
+            yield
+        finally:
+            for lock in reversed(held):
+                lock.release()
+            with self._lock:
+                for key in keys:
+                    slot = self._key_locks[key]
+                    slot[1] -= 1
+                    if not slot[1]:
+                        del self._key_locks[key]
+
+    def _store(self, values: dict[Hashable, Any]) -> None:
+        """Cache *values*, evicting least recently used entries.
+
+        The caller holds ``_lock``.
+        """
+        for key, value in values.items():
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _lookup(self, keys: list[Hashable]) -> dict[Hashable, Any]:
+        """Return the cached subset of *keys*, marking them recently used."""
+        with self._lock:
+            found = {}
+            for key in keys:
+                if key in self._entries:
+                    self._entries.move_to_end(key)
+                    found[key] = self._entries[key]
+            return found
+
+    # --- public API ---
+
+    @property
+    def version(self) -> int:
+        """The current dataset version."""
+        return self._sync(self._read_version())
+
+    @property
+    def size(self) -> int:
+        """Number of values cached for the current version."""
+        with self._lock:
+            return len(self._entries)
+
+    def bump(self) -> int:
+        """Start a new dataset version and drop every cached value.
+
+        Returns:
+            The new version number.
+        """
+        with self._lock:
+            self._version = max(self._version, self._next_version())
+            self._entries.clear()
+            return self._version
+
+    def get(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Return the cached value for *key*, computing it on a miss.
+
+        Args:
+            key: Identifies the value within the current version.
+            compute: Zero-argument callable producing the value.  If it
+                raises, nothing is cached and the exception propagates.
+
+        Returns:
+            The cached or freshly computed value.
+        """
+        return self.get_many([key], lambda missing: {key: compute()})[key]
+
+    def get_many(self, keys: Iterable[Hashable],
+                 compute: Callable[[list[Hashable]], dict[Hashable, Any]],
+                 ) -> dict[Hashable, Any]:
+        """Return cached values for *keys*, computing all misses at once.
+
+        Args:
+            keys: Values wanted from the current version.
+            compute: Called once with the keys that were not cached;
+                returns a dict holding a value for each of them.  If it
+                raises, nothing is cached and the exception propagates.
+
+        Returns:
+            ``{key: value}`` for every key in *keys*.
+        """
+        keys = list(dict.fromkeys(keys))
+        # Read the version before any data, so a value computed from
+        # older rows can only ever be stored under an older version
+        self._sync(self._read_version())
+        found = self._lookup(keys)
+        if len(found) == len(keys):
+            return found
+
+        with self._computing([key for key in keys if key not in found]):
+            # Another thread may have filled some while we waited
+            with self._lock:
+                version = self._version
+            found.update(self._lookup(keys))
+            missing = [key for key in keys if key not in found]
+            if missing:
+                values = compute(missing)
+                with self._lock:
+                    if self._version == version:
+                        self._store(values)
+                found.update(values)
+        return {key: found[key] for key in keys}
+
+
+
+class SharedVersionedCache(VersionedCache):
+    """A ``VersionedCache`` whose version is shared through Postgres.
+
+    Values stay in each process's memory; only the version number is
+    shared.  ``bump()`` increments the ``dataset_version`` row (added by
+    migration ``009``), and every lookup first reads it, so all worker
+    processes drop their entries as soon as any one of them bumps.
+
+    Args:
+        database_url: Database holding ``dataset_version``.
+        max_entries: Values kept per process, as for ``VersionedCache``.
+    """
+
+    def __init__(self, database_url: str, max_entries: int = 256) -> None:
+        super().__init__(max_entries)
+        self.database_url = database_url
+        self._schema_ready = False
+
+    def _ensure_schema(self) -> None:
+        """Apply pending migrations once per cache."""
+        if not self._schema_ready:
+            from src.load_data import migrate
+            migrate(self.database_url)
+            self._schema_ready = True
+
+    def _read_version(self) -> int:
+        self._ensure_schema()
+        with db.connection(self.database_url) as conn, conn.cursor() as cur:
+            cur.execute("SELECT version FROM dataset_version")
+            return cur.fetchone()[0]
+
+    def _next_version(self) -> int:
+        self._ensure_schema()
+        with db.connection(self.database_url) as conn, conn.cursor() as cur:
+            cur.execute(
+                "UPDATE dataset_version SET version = version + 1 "
+                "RETURNING version"
+            )
+            return cur.fetchone()[0]
+
+
+class CachedPage:
+    """A rendered page with precompressed variants and a strong ETag.
+
+    Each encoding gets its own ETag (``"<hash>"``, ``"<hash>-gzip"``,
+    ``"<hash>-br"``) because strong validators must differ between
+    byte-different representations.
+    """
+
+    def __init__(self, html: str, mimetype: str = 'text/html') -> None:
+        body = html.encode('utf-8')
+        digest = hashlib.sha256(body).hexdigest()[:32]
+        self.mimetype = mimetype
+        # encoding -> (bytes, etag); '' is the uncompressed identity form
+        self.variants: dict[str, tuple[bytes, str]] = {
+            '': (body, digest),
+            'gzip': (gzip.compress(body, compresslevel=9, mtime=0),
+                     f'{digest}-gzip'),
+        }
+        if brotli is not None:
+            self.variants['br'] = (brotli.compress(body), f'{digest}-br')
+
+    def _choose(self, request: Request) -> str:
+        """Pick the best encoding the client accepts (br > gzip > none)."""
+        for encoding in ('br', 'gzip'):
+            if encoding in self.variants and request.accept_encodings[encoding]:
+                return encoding
+        return ''
+
+    def respond(self, request: Request) -> Response:
+        """Build the response for *request*.
+
+        Args:
+            request: The current Flask request (its ``Accept-Encoding``
+                and ``If-None-Match`` headers are honoured).
+
+        Returns:
+            A 200 with the chosen variant, or an empty 304 if the
+            client's ``If-None-Match`` names any variant of this page.
+        """
+        encoding = self._choose(request)
+        body, etag = self.variants[encoding]
+        # Any variant's tag means the client holds this version (``*``
+        # matches too); answer with the tag of the variant it would get
+        if any(request.if_none_match.contains(tag)
+               for _, tag in self.variants.values()):
+            response = Response(status=304)
+        else:
+            response = Response(body, mimetype=self.mimetype)
+            if encoding:
+                response.headers['Content-Encoding'] = encoding
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = CACHE_CONTROL
+        response.vary.add('Accept-Encoding')
+        return response
@@ -5,6 +5,7 @@ Takes raw scraped data and normalizes it:
   - Converts dates to ISO-8601 (``YYYY-MM-DD``)
   - Strips leftover HTML tags and decodes common entities
   - Standardizes admission status labels (Accepted / Rejected / Waitlisted)
+  - Derives typed status categories and (season, year) term codes
 
 Author: Jie Xu
 Course: JHU Modern Software Concepts
@@ -115,6 +116,26 @@ def parse_program_university(text: Optional[str]) -> tuple[Optional[str], Option
     return text, None
 
 
+def split_program_university(text: Optional[str]) -> tuple[Optional[str], Optional[str]]:
+    """Split a ``"Program, University"`` value written by the loader.
+
+    The loader joins the two fields with ``", "``, and the parts may
+    themselves contain " at " or parentheses (``'Data Science (MS),
+    University of Illinois at Urbana-Champaign'``), so the first
+    ``", "`` is the separator.  Values without one fall back to
+    ``parse_program_university``.
+
+    Args:
+        text: The stored combined string, or ``None``.
+
+    Returns:
+        A ``(program, university)`` tuple; either may be ``None``.
+    """
+    if text and ', ' in text:
+        program, university = text.split(', ', 1)
+        return program.strip() or None, university.strip() or None
+    return parse_program_university(text)
+
 def standardize_gre(score: Optional[str]) -> Optional[str]:
     """Extract a numeric GRE score from a raw string.
 
@@ -184,6 +205,59 @@ def clean_status(status: Optional[str]) -> Optional[str]:
     return status.strip()
 
 
+# Values of the ``admission_status`` enum column, in declaration order
+STATUS_CATEGORIES = ('Accepted', 'Rejected', 'Waitlisted', 'Interview', 'Other')
+
+# ``term_season`` codes, numbered in calendar order so that
+# ``ORDER BY term_year, term_season`` is chronological
+TERM_SEASONS = {'winter': 1, 'spring': 2, 'summer': 3, 'fall': 4}
+
+
+def status_category(status: Optional[str]) -> Optional[str]:
+    """Map a raw status string onto one of ``STATUS_CATEGORIES``.
+
+    Builds on ``clean_status`` and also recognises interviews and
+    Grad Cafe's spaced spelling "Wait listed".
+
+    Args:
+        status: Raw status text.
+
+    Returns:
+        A member of ``STATUS_CATEGORIES``, or ``None`` when empty.
+    """
+    cleaned = clean_status(status)
+    if not cleaned:
+        return None
+    if cleaned in ('Accepted', 'Rejected', 'Waitlisted'):
+        return cleaned
+    compact = cleaned.upper().replace(' ', '')
+    if 'WAITLIST' in compact:
+        return 'Waitlisted'
+    if 'INTERVIEW' in compact:
+        return 'Interview'
+    return 'Other'
+
+
+def parse_term(term: Optional[str]) -> tuple[Optional[int], Optional[int]]:
+    """Split a term like ``'Fall 2026'`` into ``(season code, year)``.
+
+    Args:
+        term: Raw term text.
+
+    Returns:
+        A ``(term_season, term_year)`` tuple using ``TERM_SEASONS``
+        codes; either part is ``None`` when it cannot be found.
+    """
+    if not term:
+        return None, None
+    season = re.search(r'(winter|spring|summer|fall)', term, re.IGNORECASE)
+    year = re.search(r'(?<!\d)(\d{4})(?!\d)', term)
+    return (
+        TERM_SEASONS[season.group(1).lower()] if season else None,
+        int(year.group(1)) if year else None,
+    )
+
+
 def parse_date(date_str: Optional[str]) -> Optional[str]:
     """Convert a date string to ISO-8601 format (``YYYY-MM-DD``).
 
@@ -0,0 +1,218 @@
+"""Admissions cohort cube: every roll-up precomputed, sliced in memory.
+
+Questions like "acceptance rate by degree × term × nationality × school"
+used to be one more full-table ``GROUP BY`` each.  ``applicant_cube``
+(migration ``010``, rebuilt by ``load_data.refresh_cube`` after each
+load) instead stores every non-empty combination of the five
+``DIMENSIONS``, including the ones where some dimensions are "all".
+``load_cube`` reads it once per dataset version into a ``Cube``:
+
+* ``Cube.slice(term='Fall 2026', degree='PhD')`` is a single dict
+  lookup, whatever combination of dimensions is fixed;
+* ``Cube.breakdown(['university'], term='Fall 2026')`` lists the cells
+  of one grouping set, e.g. every school's numbers for that term.
+
+Filter values match case-insensitively and exactly (rows that differ
+only in case are one cell); a ``term`` must name both season and year.
+
+Author: Jie Xu
+Course: JHU Modern Software Concepts
+Date: February 2026
+"""
+
+from __future__ import annotations
+
+from typing import Any, Iterable, Optional, Sequence
+
+from src import db, metrics
+from src.clean import TERM_SEASONS, parse_term
+from src.query_data import percentage
+
+
+# Cube dimensions, in the order of ``applicant_cube.grouping_id`` bits
+# (most significant first)
+DIMENSIONS = ('term', 'status', 'degree', 'nationality', 'university')
+
+# dimension -> bit that is set in a cell's mask when it is fixed
+_BITS = {dim: 1 << (len(DIMENSIONS) - 1 - i)
+         for i, dim in enumerate(DIMENSIONS)}
+_ALL_BITS = (1 << len(DIMENSIONS)) - 1
+
+_SEASON_NAMES = {code: name.title() for name, code in TERM_SEASONS.items()}
+
+CUBE_SQL = (
+    "SELECT grouping_id, term_year, term_season, status_category::text, "
+    "degree, us_or_international, university, "
+    "applicants, accepted, gpa_sum, gpa_n "
+    "FROM applicant_cube"
+)
+
+
+# ---------------------------------------------------------------------------
+# Value helpers
+# ---------------------------------------------------------------------------
+
+def _key(value: Any) -> Any:
+    """Lookup form of a stored dimension value (text is case-folded)."""
+    return value.casefold() if isinstance(value, str) else value
+
+
+def _label(dim: str, value: Any) -> Any:
+    """Display form of a stored value (terms become ``'Fall 2026'``)."""
+    if dim != 'term':
+        return value
+    year, season = value
+    if year is None and season is None:
+        return None
+    return ' '.join(str(part) for part in
+                    (_SEASON_NAMES.get(season), year) if part is not None)
+
+
+def _parse(dim: str, value: str) -> Any:
+    """Turn a user-supplied filter value into its lookup form.
+
+    Raises:
+        ValueError: For a term without both a season and a year.
+    """
+    if dim != 'term':
+        return _key(value.strip())
+    season, year = parse_term(value)
+    if season is None or year is None:
+        raise ValueError(f'term needs a season and a year: {value!r}')
+    return year, season
+
+
+def _stats(applicants: int, accepted: int, gpa_sum: float,
+           gpa_n: int) -> dict[str, Any]:
+    """Cell statistics in the same shape as ``analysis.cohort_stats``."""
+    return {
+        'applicants': applicants,
+        'accepted': accepted,
+        'acceptance_rate': percentage(accepted, applicants),
+        'avg_gpa': round(gpa_sum / gpa_n, 2) if gpa_n else None,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Cube
+# ---------------------------------------------------------------------------
+
+class Cube:
+    """In-memory ``applicant_cube`` that answers slices by lookup.
+
+    Each cell is keyed by ``(mask, values)``: which dimensions it fixes
+    (one ``_BITS`` bit each) and their lookup values in ``DIMENSIONS``
+    order.
+
+    Args:
+        rows: ``applicant_cube`` rows in ``CUBE_SQL`` column order.
+    """
+
+    def __init__(self, rows: Iterable[Sequence[Any]]) -> None:
+        # (mask, values) -> summed counts; the table groups raw values,
+        # so spellings that differ only in case ('PhD', 'phd') arrive as
+        # separate rows and are merged into one cell here
+        counts: dict[tuple[int, tuple], list] = {}
+        # (mask, values) -> (lookup values, labels, applicants of the
+        # row they came from): the most common spelling is displayed
+        names: dict[tuple[int, tuple], tuple[dict, dict, int]] = {}
+        for (grouping_id, year, season, status, degree, nationality,
+             university, *row_counts) in rows:
+            mask = ~grouping_id & _ALL_BITS
+            stored = dict(zip(DIMENSIONS, ((year, season), status, degree,
+                                           nationality, university)))
+            fixed = [dim for dim in DIMENSIONS if mask & _BITS[dim]]
+            keys = {dim: _key(stored[dim]) for dim in fixed}
+            cell = (mask, tuple(keys.values()))
+            total = counts.setdefault(cell, [0, 0, 0.0, 0])
+            counts[cell] = [a + b for a, b in zip(total, row_counts)]
+            if cell not in names or row_counts[0] > names[cell][2]:
+                names[cell] = (keys, {dim: _label(dim, stored[dim])
+                                      for dim in fixed}, row_counts[0])
+
+        self._cells: dict[tuple[int, tuple], dict[str, Any]] = {
+            cell: _stats(*total) for cell, total in counts.items()}
+        # mask -> [(lookup values by dimension, display labels, stats)]
+        self._groups: dict[int, list[tuple[dict, dict, dict]]] = {}
+        for cell, (keys, labels, _) in names.items():
+            self._groups.setdefault(cell[0], []).append(
+                (keys, labels, self._cells[cell]))
+
+    def __len__(self) -> int:
+        """Number of cells, across every grouping set."""
+        return len(self._cells)
+
+    @staticmethod
+    def _filters(filters: dict[str, Optional[str]]) -> dict[str, Any]:
+        """Parse the filters that are set, in ``DIMENSIONS`` order."""
+        unknown = sorted(set(filters) - set(DIMENSIONS))
+        if unknown:
+            raise ValueError(f'unknown dimension: {unknown[0]!r}')
+        return {dim: _parse(dim, filters[dim])
+                for dim in DIMENSIONS if filters.get(dim)}
+
+    def slice(self, **filters: Optional[str]) -> dict[str, Any]:
+        """Statistics for the cohort matching *filters*.
+
+        Args:
+            **filters: Any of ``DIMENSIONS``, e.g. ``term='Fall 2026'``,
+                ``degree='PhD'``; unset dimensions are rolled up.
+
+        Returns:
+            ``applicants``, ``accepted``, ``acceptance_rate`` and
+            ``avg_gpa``; zeros (and ``None``) for an empty cohort.
+
+        Raises:
+            ValueError: For an unknown dimension or unparseable term.
+        """
+        keys = self._filters(filters)
+        mask = sum(_BITS[dim] for dim in keys)
+        stats = self._cells.get((mask, tuple(keys.values())))
+        return dict(stats) if stats else _stats(0, 0, 0.0, 0)
+
+    def breakdown(self, by: Sequence[str],
+                  **filters: Optional[str]) -> list[dict[str, Any]]:
+        """Statistics for each value combination of *by* within a slice.
+
+        Reads only the cells of one grouping set, never ``applicants``.
+
+        Args:
+            by: Dimensions to group by, e.g. ``['degree', 'term']``.
+            **filters: Fixed dimensions, as for ``slice``.
+
+        Returns:
+            One dict per non-empty group, largest first: the *by*
+            values (``None`` where unknown) plus the ``slice`` keys.
+
+        Raises:
+            ValueError: For an unknown dimension, unparseable term, or
+                a dimension used both in *by* and as a filter.
+        """
+        keys = self._filters(filters)
+        for dim in by:
+            if dim not in _BITS:
+                raise ValueError(f'unknown dimension: {dim!r}')
+            if dim in keys:
+                raise ValueError(f'{dim!r} is both grouped and filtered')
+        mask = sum(_BITS[dim] for dim in {*keys, *by})
+        cells = [
+            {**{dim: labels[dim] for dim in by}, **stats}
+            for values, labels, stats in self._groups.get(mask, [])
+            if all(values[dim] == key for dim, key in keys.items())
+        ]
+        cells.sort(key=lambda cell: -cell['applicants'])
+        return cells
+
+
+def load_cube(database_url: Optional[str] = None) -> Cube:
+    """Read ``applicant_cube`` into a ``Cube``.
+
+    Args:
+        database_url: Optional Postgres connection string.
+
+    Returns:
+        The cube as of the last ``load_data.refresh_cube``.
+    """
+    with db.connection(database_url) as conn, conn.cursor() as cur:
+        metrics.execute(cur, 'cube', CUBE_SQL)
+        return Cube(cur.fetchall())
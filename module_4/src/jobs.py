@@ -0,0 +1,495 @@
+"""Background pull jobs, coordinated through Postgres.
+
+``/pull_data`` used to guard against overlapping pulls with a boolean
+in ``app.config``, which every worker process had its own copy of.
+Jobs now live in the ``ingest_jobs`` table (migration ``007``):
+
+* **Lease** — ``start()`` is one ``INSERT``; a partial unique index
+  allows only one ``running`` row, so across any number of processes
+  exactly one caller gets a job id and the rest see "busy".
+* **Heartbeat / progress** — the pipeline's ``on_progress`` callback
+  writes the live counters (pages, records, rows inserted) and pushes
+  ``lease_expires_at`` forward.  A job whose owner died stops renewing
+  and is marked ``failed`` once its lease runs out, freeing the slot.
+* **Cancellation and timeout** — ``cancel()`` sets a flag on the row
+  and every job gets a ``deadline_at``.  The owner notices either at
+  its next heartbeat and stops the pipeline.
+* **Events** — a trigger (migration ``008``) sends every change to a
+  job row on the ``ingest_jobs`` NOTIFY channel.  Each process
+  keeps a single LISTEN connection (``get_listener``) that fans those
+  changes out to every ``watch()`` in it, so a browser connected to
+  any process sees a pull running in any other.
+
+Author: Jie Xu
+Course: JHU Modern Software Concepts
+Date: February 2026
+"""
+
+from __future__ import annotations
+
+import datetime
+import json
+import os
+import queue
+import select
+import socket
+import threading
+import time
+from contextlib import contextmanager, suppress
+from typing import Any, Callable, Iterator, Optional
+
+import psycopg2
+
+from src import db
+
+
+# Terminal states a job can finish in
+FINISHED_STATES = ('succeeded', 'failed', 'cancelled', 'timed_out')
+
+# NOTIFY channel the ``ingest_jobs`` trigger publishes row changes on
+EVENTS_CHANNEL = 'ingest_jobs'
+
+_JOB_COLUMNS = (
+    "id, status, owner, started_at, heartbeat_at, lease_expires_at, "
+    "deadline_at, finished_at, cancel_requested, pages, fetched, "
+    "inserted, batches, waits, wait_seconds, error, "
+    "extract(epoch FROM coalesce(finished_at, now()) - started_at) "
+    "AS elapsed_seconds"
+)
+
+ProgressFn = Callable[[dict[str, Any]], None]
+
+
+class JobStopped(Exception):
+    """Raised from a heartbeat when the running job must stop."""
+
+    status = 'cancelled'
+
+
+class JobCancelled(JobStopped):
+    """The job was cancelled, or its lease was taken over."""
+
+
+class JobTimedOut(JobStopped):
+    """The job ran past its deadline."""
+
+    status = 'timed_out'
+
+
+def _job_dict(job: dict[str, Any]) -> dict[str, Any]:
+    """Make an ``ingest_jobs`` row JSON-friendly and add rates."""
+    for key, value in job.items():
+        if isinstance(value, datetime.datetime):
+            job[key] = value.isoformat()
+    elapsed = float(job['elapsed_seconds'] or 0)
+    job['elapsed_seconds'] = round(elapsed, 3)
+    per_sec = (lambda n: round(n / elapsed, 2) if elapsed > 0 else 0.0)
+    job['pages_per_sec'] = per_sec(job['pages'])
+    job['records_per_sec'] = per_sec(job['fetched'])
+    job['rows_per_sec'] = per_sec(job['inserted'] or 0)
+    return job
+
+
+class JobListener:
+    """One LISTEN connection on ``EVENTS_CHANNEL``, shared in-process.
+
+    The connection is opened by the first ``subscribe()`` and read by a
+    daemon thread that copies each notification payload onto every
+    subscriber's queue.  The thread closes the connection once the
+    last subscriber has left, so an idle process holds none.
+
+    Args:
+        database_url: Connection string to LISTEN on.
+        poll_seconds: How often the reader checks for departed
+            subscribers while the channel is quiet.
+    """
+
+    def __init__(self, database_url: str, poll_seconds: float = 1.0) -> None:
+        self.database_url = database_url
+        self.poll_seconds = poll_seconds
+        self._lock = threading.Lock()
+        self._subscribers: set[queue.Queue] = set()
+        self._conn: Optional[Any] = None
+
+    def subscribe(self) -> queue.Queue:
+        """Register a subscriber, connecting first if nobody listens yet.
+
+        Returns the subscriber's queue only once LISTEN is in effect,
+        so a snapshot read afterwards cannot miss a change.  The queue
+        receives JSON payloads, and ``None`` if the connection is lost.
+
+        Raises:
+            psycopg2.Error: If the listening connection cannot be opened.
+        """
+        subscriber: queue.Queue = queue.Queue()
+        with self._lock:
+            if self._conn is None:
+                conn = psycopg2.connect(self.database_url)
+                try:
+                    conn.autocommit = True
+                    with conn.cursor() as cur:
+                        cur.execute(f'LISTEN {EVENTS_CHANNEL}')
+                except psycopg2.Error:
+                    conn.close()
+                    raise
+                self._conn = conn
+                threading.Thread(target=self._read, args=(conn,),
+                                 name='ingest-job-events', daemon=True).start()
+            self._subscribers.add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: queue.Queue) -> None:
+        """Stop delivering to *subscriber*."""
+        with self._lock:
+            self._subscribers.discard(subscriber)
+
+    def _read(self, conn: Any) -> None:
+        """Fan notifications out until idle or disconnected."""
+        try:
+            while True:
+                with self._lock:
+                    if not self._subscribers:
+                        self._conn = None
+                        return
+                if not select.select([conn], [], [], self.poll_seconds)[0]:
+                    continue
+                conn.poll()
+                with self._lock:
+                    subscribers = list(self._subscribers)
+                while conn.notifies:
+                    payload = conn.notifies.pop(0).payload
+                    for subscriber in subscribers:
+                        subscriber.put(payload)
+        except (psycopg2.Error, OSError):
+            # Connection lost: end every watch; clients reconnect
+            with self._lock:
+                self._conn = None
+                subscribers = list(self._subscribers)
+            for subscriber in subscribers:
+                subscriber.put(None)
+        finally:
+            conn.close()
+
+
+# Keyed by (pid, url) like ``db`` pools: a forked worker starts its own
+# listener instead of sharing the parent's socket and reader thread.
+_listeners: dict[tuple[int, str], JobListener] = {}
+_listeners_lock = threading.Lock()
+
+
+def get_listener(database_url: str) -> JobListener:
+    """Return this process's ``JobListener`` for *database_url*."""
+    key = (os.getpid(), database_url)
+    with _listeners_lock:
+        if key not in _listeners:
+            _listeners[key] = JobListener(database_url)
+        return _listeners[key]
+
+
+class JobManager:
+    """Start, track, cancel and finish pull jobs stored in Postgres.
+
+    Args:
+        database_url: Connection string of the database holding
+            ``ingest_jobs`` (created on first use via ``migrate``).
+        lease_seconds: How long a job survives without a heartbeat.
+        timeout_seconds: Wall-clock limit for a single job.
+        heartbeat_seconds: Minimum interval between progress writes;
+            progress reported more often is coalesced.
+    """
+
+    def __init__(self, database_url: str, lease_seconds: float = 60.0,
+                 timeout_seconds: float = 1800.0,
+                 heartbeat_seconds: float = 1.0) -> None:
+        self.database_url = database_url
+        self.lease_seconds = lease_seconds
+        self.timeout_seconds = timeout_seconds
+        self.heartbeat_seconds = heartbeat_seconds
+        self.owner = f'{socket.gethostname()}:{os.getpid()}'
+        self._schema_ready = False
+        self._lock = threading.Lock()
+        self._last_beat: dict[int, float] = {}
+
+    # --- helpers ---
+
+    def _ensure_schema(self) -> None:
+        """Apply pending migrations once per manager."""
+        if not self._schema_ready:
+            from src.load_data import migrate
+            migrate(self.database_url)
+            self._schema_ready = True
+
+    @staticmethod
+    def _expire_stale(cur: Any) -> None:
+        """Mark running jobs whose lease ran out as failed."""
+        cur.execute(
+            "UPDATE ingest_jobs SET status = 'failed', finished_at = now(), "
+            "error = 'lease expired' "
+            "WHERE status = 'running' AND lease_expires_at < now()"
+        )
+
+    def _select_one(self, where: str) -> Optional[dict[str, Any]]:
+        """Return the newest job matching *where*, or ``None``."""
+        self._ensure_schema()
+        with db.connection(self.database_url) as conn, conn.cursor() as cur:
+            self._expire_stale(cur)
+            cur.execute(
+                f"SELECT {_JOB_COLUMNS} FROM ingest_jobs WHERE {where} "
+                "ORDER BY id DESC LIMIT 1"
+            )
+            row = cur.fetchone()
+            columns = [col[0] for col in cur.description]
+        return _job_dict(dict(zip(columns, row))) if row else None
+
+    # --- lifecycle ---
+
+    def start(self) -> Optional[int]:
+        """Try to take the single pull lease.
+
+        Returns:
+            The new job id, or ``None`` if another job is running.
+        """
+        self._ensure_schema()
+        with db.connection(self.database_url) as conn, conn.cursor() as cur:
+            self._expire_stale(cur)
+            cur.execute(
+                "INSERT INTO ingest_jobs "
+                "(owner, lease_expires_at, deadline_at) VALUES "
+                "(%s, now() + make_interval(secs => %s), "
+                "now() + make_interval(secs => %s)) "
+                "ON CONFLICT DO NOTHING RETURNING id",
+                (self.owner, self.lease_seconds, self.timeout_seconds),
+            )
+            row = cur.fetchone()
+        return row[0] if row else None
+
+    def progress(self, job_id: int, stats: dict[str, Any],
+                 force: bool = False) -> None:
+        """Record live counters and renew the lease (rate-limited).
+
+        Suitable as ``run_pipeline``'s ``on_progress`` callback.
+
+        Args:
+            job_id: The job being reported on.
+            stats: Counters with ``pages``, ``fetched``, ``inserted``,
+                ``batches`` and optionally ``waits`` / ``wait_seconds``.
+            force: Write even if the last write was very recent.
+
+        Raises:
+            JobCancelled: If cancellation was requested, or the job is
+                no longer running (its lease was expired by another
+                process).
+            JobTimedOut: If the job is past its deadline.
+        """
+        now = time.monotonic()
+        with self._lock:
+            last = self._last_beat.get(job_id)
+            if not force and last is not None \
+                    and now - last < self.heartbeat_seconds:
+                return
+            self._last_beat[job_id] = now
+
+        with db.connection(self.database_url) as conn, conn.cursor() as cur:
+            cur.execute(
+                "UPDATE ingest_jobs SET heartbeat_at = now(), "
+                "lease_expires_at = now() + make_interval(secs => %s), "
+                "pages = %s, fetched = %s, inserted = %s, batches = %s, "
+                "waits = %s, wait_seconds = %s "
+                "WHERE id = %s AND status = 'running' "
+                "RETURNING cancel_requested, now() >= deadline_at",
+                (self.lease_seconds, stats.get('pages', 0),
+                 stats.get('fetched', 0), stats.get('inserted'),
+                 stats.get('batches', 0), stats.get('waits', 0),
+                 stats.get('wait_seconds', 0), job_id),
+            )
+            row = cur.fetchone()
+        if row is None:
+            raise JobCancelled(f'job {job_id} is no longer running')
+        cancel_requested, past_deadline = row
+        if cancel_requested:
+            raise JobCancelled(f'job {job_id} was cancelled')
+        if past_deadline:
+            raise JobTimedOut(
+                f'job {job_id} exceeded {self.timeout_seconds:g}s'
+            )
+
+    def renew(self, job_id: int) -> bool:
+        """Push the lease forward without touching the counters.
+
+        Args:
+            job_id: The job to keep alive.
+
+        Returns:
+            ``False`` if the job is no longer running.
+        """
+        with db.connection(self.database_url) as conn, conn.cursor() as cur:
+            cur.execute(
+                "UPDATE ingest_jobs SET heartbeat_at = now(), "
+                "lease_expires_at = now() + make_interval(secs => %s) "
+                "WHERE id = %s AND status = 'running'",
+                (self.lease_seconds, job_id),
+            )
+            return cur.rowcount == 1
+
+    @contextmanager
+    def keep_alive(self, job_id: int) -> Iterator[None]:
+        """Renew the lease in the background for the ``with`` block.
+
+        For work that reports no progress, such as rebuilding the cube
+        after a pull, but may outlast ``lease_seconds``.
+
+        Args:
+            job_id: The job to keep alive.
+        """
+        self.renew(job_id)
+        stop = threading.Event()
+
+        def _beat() -> None:
+            while not stop.wait(self.lease_seconds / 3):
+                # A failed renewal is retried at the next beat
+                with suppress(psycopg2.Error):
+                    self.renew(job_id)
+
+        beater = threading.Thread(target=_beat, daemon=True,
+                                  name=f'ingest-job-{job_id}-lease')
+        beater.start()
+        try:
+            yield
+        finally:
+            stop.set()
+            beater.join()
+
+    def finish(self, job_id: int, status: str,
+               stats: Optional[dict[str, Any]] = None,
+               error: Optional[str] = None) -> bool:
+        """Move a running job to a terminal state.
+
+        Args:
+            job_id: The job to finish.
+            status: One of ``FINISHED_STATES``.
+            stats: Final counters, if known.
+            error: Message for failed / cancelled / timed-out jobs.
+
+        Returns:
+            ``False`` if the job was no longer running (e.g. its lease
+            had expired and another process marked it ``failed``).
+
+        Raises:
+            ValueError: If *status* is not a terminal state.
+        """
+        if status not in FINISHED_STATES:
+            raise ValueError(f'not a finished state: {status!r}')
+        stats = stats or {}
+        with db.connection(self.database_url) as conn, conn.cursor() as cur:
+            cur.execute(
+                "UPDATE ingest_jobs SET status = %s, finished_at = now(), "
+                "error = %s, pages = coalesce(%s, pages), "
+                "fetched = coalesce(%s, fetched), "
+                "inserted = CASE WHEN %s THEN %s ELSE inserted END, "
+                "batches = coalesce(%s, batches), "
+                "waits = coalesce(%s, waits), "
+                "wait_seconds = coalesce(%s, wait_seconds) "
+                "WHERE id = %s AND status = 'running'",
+                (status, error, stats.get('pages'), stats.get('fetched'),
+                 'inserted' in stats, stats.get('inserted'),
+                 stats.get('batches'), stats.get('waits'),
+                 stats.get('wait_seconds'), job_id),
+            )
+            finished = cur.rowcount == 1
+        with self._lock:
+            self._last_beat.pop(job_id, None)
+        return finished
+
+    def run(self, job_id: int,
+            work: Callable[[ProgressFn], dict[str, Any]]) -> Optional[dict]:
+        """Run *work* as job *job_id* and record how it ended.
+
+        Args:
+            job_id: A job returned by ``start()``.
+            work: Called with a progress callback (see ``progress``);
+                returns the final counters.
+
+        Returns:
+            The counters from *work*, or ``None`` if the job was
+            cancelled, timed out, or had already lost its lease.
+
+        Raises:
+            Exception: Whatever *work* raised, after marking the job
+                ``failed``.
+        """
+        try:
+            stats = work(lambda counters: self.progress(job_id, counters))
+        except JobStopped as exc:
+            self.finish(job_id, exc.status, error=str(exc))
+            return None
+        except BaseException as exc:
+            self.finish(job_id, 'failed', error=f'{type(exc).__name__}: {exc}')
+            raise
+        if not self.finish(job_id, 'succeeded', stats):
+            return None
+        return stats
+
+    def cancel(self) -> bool:
+        """Ask the running job (in any process) to stop.
+
+        Returns:
+            ``True`` if a running job was flagged.
+        """
+        self._ensure_schema()
+        with db.connection(self.database_url) as conn, conn.cursor() as cur:
+            cur.execute(
+                "UPDATE ingest_jobs SET cancel_requested = true "
+                "WHERE status = 'running' RETURNING id"
+            )
+            return cur.fetchone() is not None
+
+    # --- queries ---
+
+    def current(self) -> Optional[dict[str, Any]]:
+        """The running job with live rates, or ``None`` when idle."""
+        return self._select_one("status = 'running'")
+
+    def latest_finished(self) -> Optional[dict[str, Any]]:
+        """The most recently started job that has finished, if any."""
+        return self._select_one("status <> 'running'")
+
+    # --- events ---
+
+    def watch(self, keepalive_seconds: float = 15.0,
+              ) -> Iterator[tuple[str, Optional[dict[str, Any]]]]:
+        """Yield job changes as they happen, from any process.
+
+        Subscribes to the process-wide ``JobListener`` for as long as
+        the generator is alive; close the generator to leave.  Ends if
+        the listening connection is lost.
+
+        Args:
+            keepalive_seconds: How long to wait for a change before
+                yielding a ``'keepalive'`` event.
+
+        Yields:
+            ``(kind, job)`` pairs: first ``('snapshot', job)`` with the
+            running or most recent job (``None`` if there is none),
+            then ``('progress', job)`` while a job runs, ``('done',
+            job)`` when it finishes, and ``('keepalive', None)`` after
+            each quiet interval.
+        """
+        self._ensure_schema()
+        listener = get_listener(self.database_url)
+        # Subscribing before the snapshot means no change is missed
+        subscriber = listener.subscribe()
+        try:
+            yield 'snapshot', self.current() or self.latest_finished()
+            while True:
+                try:
+                    payload = subscriber.get(timeout=keepalive_seconds)
+                except queue.Empty:
+                    yield 'keepalive', None
+                    continue
+                if payload is None:
+                    return
+                job = _job_dict(json.loads(payload))
+                kind = 'progress' if job['status'] == 'running' else 'done'
+                yield kind, job
+        finally:
+            listener.unsubscribe(subscriber)
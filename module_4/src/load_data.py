@@ -1,7 +1,8 @@
 """Load applicant data into PostgreSQL.
 
 Creates the ``applicants`` table (if it does not exist), converts JSON
-records into row tuples, and bulk-inserts them using ``execute_values``.
+records into row tuples, and bulk-inserts them using ``execute_values``
+or, for large loads, Postgres ``COPY`` into a staging table.
 The ``url`` column carries a UNIQUE constraint so that re-pulling the
 same data never creates duplicate rows (``ON CONFLICT DO NOTHING``).
 
@@ -14,11 +15,16 @@ from __future__ import annotations
 
 import json
 import os
-from typing import Any, Optional
+import time
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, Optional, Union
 
 import psycopg2
 from psycopg2.extras import execute_values
 
+from src import db
+from src.clean import parse_term, split_program_university, status_category
+
 # ---------------------------------------------------------------------------
 # SQL: table schema with a UNIQUE constraint on ``url`` for idempotency
 # ---------------------------------------------------------------------------
@@ -43,6 +49,383 @@ CREATE TABLE IF NOT EXISTS applicants (
 );
 """
 
+# ---------------------------------------------------------------------------
+# Schema migrations
+# ---------------------------------------------------------------------------
+# Each migration runs once, in order, and is recorded by name in
+# ``schema_migrations``.  Never edit one that has shipped; append a new
+# entry instead.
+
+MIGRATIONS_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS schema_migrations (
+    name TEXT PRIMARY KEY,
+    applied_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+"""
+
+# Arbitrary key for ``pg_advisory_xact_lock`` so that two processes
+# starting at once do not apply the same migration twice
+MIGRATION_LOCK_ID = 4_212_026
+
+# ---------------------------------------------------------------------------
+# Aggregate summary table
+# ---------------------------------------------------------------------------
+# ``applicant_summary`` holds one row per (term, status, nationality,
+# degree) with counts and score sums, so dashboard statistics read a
+# few dozen rows instead of scanning ``applicants``.  Key columns are
+# NOT NULL (they form the primary key), so missing values are stored
+# as 0 / ''.  An AFTER INSERT trigger folds each inserted batch in.
+
+SUMMARY_KEYS = (
+    'term_year', 'term_season', 'status_category',
+    'us_or_international', 'degree',
+)
+
+SUMMARY_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS applicant_summary (
+    term_year SMALLINT NOT NULL,
+    term_season SMALLINT NOT NULL,
+    status_category TEXT NOT NULL,
+    us_or_international TEXT NOT NULL,
+    degree TEXT NOT NULL,
+    applicants BIGINT NOT NULL,
+    gpa_sum DOUBLE PRECISION NOT NULL,
+    gpa_n BIGINT NOT NULL,
+    gre_sum DOUBLE PRECISION NOT NULL,
+    gre_n BIGINT NOT NULL,
+    gre_v_sum DOUBLE PRECISION NOT NULL,
+    gre_v_n BIGINT NOT NULL,
+    gre_aw_sum DOUBLE PRECISION NOT NULL,
+    gre_aw_n BIGINT NOT NULL,
+    PRIMARY KEY (term_year, term_season, status_category,
+                 us_or_international, degree)
+);
+"""
+
+# Aggregate rows of ``{source}`` into summary-table shape
+_SUMMARY_SELECT = """
+SELECT coalesce(term_year, 0), coalesce(term_season, 0),
+       coalesce(status_category::text, ''),
+       coalesce(us_or_international, ''), coalesce(degree, ''),
+       COUNT(*),
+       coalesce(SUM(gpa), 0), COUNT(gpa),
+       coalesce(SUM(gre), 0), COUNT(gre),
+       coalesce(SUM(gre_v), 0), COUNT(gre_v),
+       coalesce(SUM(gre_aw), 0), COUNT(gre_aw)
+FROM {source}
+GROUP BY 1, 2, 3, 4, 5
+ORDER BY 1, 2, 3, 4, 5
+"""
+
+SUMMARY_TRIGGER_SQL = f"""
+CREATE OR REPLACE FUNCTION applicant_summary_add() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    INSERT INTO applicant_summary AS s
+    {_SUMMARY_SELECT.format(source='new_rows')}
+    ON CONFLICT ({', '.join(SUMMARY_KEYS)}) DO UPDATE SET
+        applicants = s.applicants + EXCLUDED.applicants,
+        gpa_sum = s.gpa_sum + EXCLUDED.gpa_sum,
+        gpa_n = s.gpa_n + EXCLUDED.gpa_n,
+        gre_sum = s.gre_sum + EXCLUDED.gre_sum,
+        gre_n = s.gre_n + EXCLUDED.gre_n,
+        gre_v_sum = s.gre_v_sum + EXCLUDED.gre_v_sum,
+        gre_v_n = s.gre_v_n + EXCLUDED.gre_v_n,
+        gre_aw_sum = s.gre_aw_sum + EXCLUDED.gre_aw_sum,
+        gre_aw_n = s.gre_aw_n + EXCLUDED.gre_aw_n;
+    RETURN NULL;
+END $$;
+
+DROP TRIGGER IF EXISTS applicants_summary_insert ON applicants;
+CREATE TRIGGER applicants_summary_insert
+    AFTER INSERT ON applicants
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION applicant_summary_add();
+"""
+
+REFRESH_SUMMARY_SQL = f"""
+LOCK TABLE applicant_summary IN EXCLUSIVE MODE;
+TRUNCATE applicant_summary;
+INSERT INTO applicant_summary
+{_SUMMARY_SELECT.format(source='applicants')};
+"""
+
+
+def refresh_summary(database_url: Optional[str] = None) -> None:
+    """Rebuild ``applicant_summary`` from scratch.
+
+    The insert trigger keeps the summary current on its own; this is
+    for after bulk ``UPDATE``/``DELETE`` on ``applicants`` (which the
+    trigger does not track) or to repair drift.
+
+    Args:
+        database_url: Optional override for the connection string.
+    """
+    url = database_url or get_database_url()
+    with db.connection(url) as conn:
+        with conn.cursor() as cur:
+            cur.execute(REFRESH_SUMMARY_SQL)
+
+
+# ---------------------------------------------------------------------------
+# Cohort cube
+# ---------------------------------------------------------------------------
+# ``applicant_cube`` holds every roll-up of ``applicants`` over five
+# dimensions: term (year and season together), status, degree,
+# nationality and canonical university (the LLM-standardised name,
+# else the parsed one).  ``grouping_id`` is ``GROUPING()`` over those
+# dimensions in that order: a set bit means the dimension is rolled up
+# ("all"), so a NULL in a dimension that is kept still means "unknown".
+# Only non-empty cells exist.  Unlike the summary it has no trigger; it
+# is rebuilt as a whole after each load (``refresh_cube``).
+
+CUBE_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS applicant_cube (
+    grouping_id SMALLINT NOT NULL,
+    term_year SMALLINT,
+    term_season SMALLINT,
+    status_category admission_status,
+    degree TEXT,
+    us_or_international TEXT,
+    university TEXT,
+    applicants INTEGER NOT NULL,
+    accepted INTEGER NOT NULL,
+    gpa_sum DOUBLE PRECISION NOT NULL,
+    gpa_n INTEGER NOT NULL
+);
+"""
+
+# Aggregates to the finest grain first and rolls that up: a CUBE
+# straight over ``applicants`` hashes every row once per grouping set.
+# Every other cell covers at least one row; only the grand total
+# exists over an empty table, where the sums are NULL, hence coalesce
+REFRESH_CUBE_SQL = """
+LOCK TABLE applicant_cube IN EXCLUSIVE MODE;
+TRUNCATE applicant_cube;
+INSERT INTO applicant_cube
+WITH base AS MATERIALIZED (
+    SELECT term_year, term_season, status_category, degree,
+           us_or_international,
+           coalesce(nullif(llm_generated_university, ''), university)
+               AS university,
+           COUNT(*) AS applicants,
+           COUNT(*) FILTER (WHERE status_category = 'Accepted') AS accepted,
+           coalesce(SUM(gpa), 0) AS gpa_sum, COUNT(gpa) AS gpa_n
+    FROM applicants
+    GROUP BY 1, 2, 3, 4, 5, 6
+)
+SELECT GROUPING(term_year, status_category, degree, us_or_international,
+                university),
+       term_year, term_season, status_category, degree,
+       us_or_international, university,
+       coalesce(SUM(applicants), 0), coalesce(SUM(accepted), 0),
+       coalesce(SUM(gpa_sum), 0), coalesce(SUM(gpa_n), 0)
+FROM base
+GROUP BY CUBE ((term_year, term_season), status_category, degree,
+               us_or_international, university);
+"""
+
+
+def refresh_cube(database_url: Optional[str] = None) -> int:
+    """Rebuild ``applicant_cube`` from ``applicants``.
+
+    Run after each load.  The rebuild is one transaction, so readers
+    never see a half-built cube.
+
+    Args:
+        database_url: Optional override for the connection string.
+
+    Returns:
+        The number of cells written.
+    """
+    url = database_url or get_database_url()
+    with db.connection(url) as conn:
+        with conn.cursor() as cur:
+            cur.execute(REFRESH_CUBE_SQL)
+            return cur.rowcount
+
+
+def _split_university(cur: psycopg2.extensions.cursor) -> None:
+    """Backfill ``university`` by splitting combined ``program`` values.
+
+    Rows loaded before the column existed hold ``"Program, University"``
+    in ``program``.  Each is split with ``clean.split_program_university``
+    and rewritten in batches; rows with no recognisable university are
+    left alone.  A server-side cursor streams the rows so memory stays
+    flat on large tables.
+
+    Args:
+        cur: Cursor inside the migration transaction.
+    """
+    reader = cur.connection.cursor(name='split_university')
+    reader.itersize = DEFAULT_BATCH_SIZE
+    reader.execute(
+        "SELECT p_id, program FROM applicants "
+        "WHERE university IS NULL AND program IS NOT NULL"
+    )
+    update_sql = (
+        "UPDATE applicants AS a "
+        "SET program = v.program, university = v.university "
+        "FROM (VALUES %s) AS v (p_id, program, university) "
+        "WHERE a.p_id = v.p_id"
+    )
+    updates: list[tuple] = []
+    for p_id, combined in reader:
+        program, university = split_program_university(combined)
+        if university:
+            updates.append((p_id, program, university))
+        if len(updates) >= DEFAULT_BATCH_SIZE:
+            execute_values(cur, update_sql, updates)
+            updates = []
+    if updates:
+        execute_values(cur, update_sql, updates)
+    reader.close()
+
+
+MIGRATIONS: list[tuple[str, Union[str, Callable]]] = [
+    # Equality filters used by nearly every dashboard query
+    ('001_filter_indexes', """
+        CREATE INDEX IF NOT EXISTS ix_applicants_term
+            ON applicants (term);
+        CREATE INDEX IF NOT EXISTS ix_applicants_us_or_international
+            ON applicants (us_or_international);
+    """),
+    # Trigram GIN indexes let ``ILIKE '%...%'`` use an index scan
+    ('002_trigram_indexes', """
+        CREATE EXTENSION IF NOT EXISTS pg_trgm;
+        CREATE INDEX IF NOT EXISTS ix_applicants_program_trgm
+            ON applicants USING gin (program gin_trgm_ops);
+        CREATE INDEX IF NOT EXISTS ix_applicants_llm_program_trgm
+            ON applicants USING gin (llm_generated_program gin_trgm_ops);
+        CREATE INDEX IF NOT EXISTS ix_applicants_llm_university_trgm
+            ON applicants USING gin (llm_generated_university gin_trgm_ops);
+    """),
+    # Typed status / term columns so filters become indexable equality
+    # checks.  The backfill mirrors ``clean.status_category`` and
+    # ``clean.parse_term``; new rows get the values from ``prepare_row``.
+    ('003_status_term_columns', r"""
+        DO $$ BEGIN
+            CREATE TYPE admission_status AS ENUM
+                ('Accepted', 'Rejected', 'Waitlisted', 'Interview', 'Other');
+        EXCEPTION WHEN duplicate_object THEN NULL;
+        END $$;
+        ALTER TABLE applicants
+            ADD COLUMN IF NOT EXISTS status_category admission_status,
+            ADD COLUMN IF NOT EXISTS term_season SMALLINT,
+            ADD COLUMN IF NOT EXISTS term_year SMALLINT;
+        UPDATE applicants SET
+            status_category = CASE
+                WHEN btrim(coalesce(status, '')) = '' THEN NULL
+                WHEN status ILIKE '%accept%' THEN 'Accepted'
+                WHEN status ILIKE '%reject%' THEN 'Rejected'
+                WHEN replace(status, ' ', '') ILIKE '%waitlist%'
+                    THEN 'Waitlisted'
+                WHEN replace(status, ' ', '') ILIKE '%interview%'
+                    THEN 'Interview'
+                ELSE 'Other'
+            END::admission_status,
+            term_season = CASE
+                lower(substring(term FROM '(?i)(winter|spring|summer|fall)'))
+                WHEN 'winter' THEN 1 WHEN 'spring' THEN 2
+                WHEN 'summer' THEN 3 WHEN 'fall' THEN 4
+            END,
+            term_year = substring(term FROM '(?<![0-9])([0-9]{4})(?![0-9])')::smallint;
+        CREATE INDEX IF NOT EXISTS ix_applicants_term_year_season_status
+            ON applicants (term_year, term_season, status_category);
+        CREATE INDEX IF NOT EXISTS ix_applicants_status_category
+            ON applicants (status_category);
+    """),
+    # University gets its own column instead of being glued onto
+    # ``program``; lower() + text_pattern_ops serves both equality and
+    # anchored prefix (``LIKE 'stanford%'``) lookups
+    ('004_university_column', """
+        ALTER TABLE applicants ADD COLUMN IF NOT EXISTS university TEXT;
+        CREATE INDEX IF NOT EXISTS ix_applicants_university_lower
+            ON applicants (lower(university) text_pattern_ops);
+    """),
+    ('005_split_university', _split_university),
+    # Pre-aggregated statistics, kept current by a statement-level
+    # insert trigger and seeded from any rows already present
+    ('006_applicant_summary',
+     SUMMARY_TABLE_SQL + SUMMARY_TRIGGER_SQL + REFRESH_SUMMARY_SQL),
+    # Background pull jobs (see ``src.jobs``).  The partial unique index
+    # allows at most one ``running`` row, which is what makes acquiring
+    # the pull lease a single atomic INSERT.
+    ('007_ingest_jobs', """
+        CREATE TABLE IF NOT EXISTS ingest_jobs (
+            id BIGSERIAL PRIMARY KEY,
+            status TEXT NOT NULL DEFAULT 'running' CHECK (status IN
+                ('running', 'succeeded', 'failed', 'cancelled',
+                 'timed_out')),
+            owner TEXT,
+            started_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+            heartbeat_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+            lease_expires_at TIMESTAMPTZ NOT NULL,
+            deadline_at TIMESTAMPTZ NOT NULL,
+            finished_at TIMESTAMPTZ,
+            cancel_requested BOOLEAN NOT NULL DEFAULT false,
+            pages INTEGER NOT NULL DEFAULT 0,
+            fetched INTEGER NOT NULL DEFAULT 0,
+            inserted INTEGER,
+            batches INTEGER NOT NULL DEFAULT 0,
+            error TEXT
+        );
+        CREATE UNIQUE INDEX IF NOT EXISTS ux_ingest_jobs_one_running
+            ON ingest_jobs ((true)) WHERE status = 'running';
+    """),
+    # Rate-limit wait counters, and a NOTIFY on every job change so
+    # /pull_data/events can push progress to clients in any process
+    ('008_ingest_job_events', """
+        ALTER TABLE ingest_jobs
+            ADD COLUMN IF NOT EXISTS waits INTEGER NOT NULL DEFAULT 0,
+            ADD COLUMN IF NOT EXISTS wait_seconds DOUBLE PRECISION
+                NOT NULL DEFAULT 0;
+        CREATE OR REPLACE FUNCTION ingest_jobs_notify() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            PERFORM pg_notify('ingest_jobs', (to_jsonb(NEW) || jsonb_build_object(
+                'error', left(NEW.error, 1000),
+                'elapsed_seconds', extract(epoch FROM
+                    coalesce(NEW.finished_at, now()) - NEW.started_at)
+            ))::text);
+            RETURN NULL;
+        END $$;
+        DROP TRIGGER IF EXISTS ingest_jobs_notify ON ingest_jobs;
+        CREATE TRIGGER ingest_jobs_notify
+            AFTER INSERT OR UPDATE ON ingest_jobs
+            FOR EACH ROW EXECUTE FUNCTION ingest_jobs_notify();
+    """),
+    # Dataset version shared by every app process (see
+    # ``cache.SharedVersionedCache``); a single row, enforced by the
+    # boolean primary key
+    ('009_dataset_version', """
+        CREATE TABLE IF NOT EXISTS dataset_version (
+            id BOOLEAN PRIMARY KEY DEFAULT true CHECK (id),
+            version BIGINT NOT NULL DEFAULT 0
+        );
+        INSERT INTO dataset_version DEFAULT VALUES ON CONFLICT DO NOTHING;
+    """),
+    # Every roll-up over term x status x degree x nationality x
+    # university (see ``src.cube``), seeded from the rows already present
+    ('010_applicant_cube', CUBE_TABLE_SQL + REFRESH_CUBE_SQL),
+]
+
+
+# Column order shared by ``prepare_row``, the INSERT and the COPY paths
+INSERT_COLUMNS = (
+    'program', 'comments', 'date_added', 'url', 'status', 'term',
+    'us_or_international', 'gpa', 'gre', 'gre_v', 'gre_aw', 'degree',
+    'llm_generated_program', 'llm_generated_university',
+    'status_category', 'term_season', 'term_year', 'university',
+)
+
+LOAD_METHODS = ('values', 'copy')
+
+# Rows encoded and sent per batch.  COPY has far less per-row overhead
+# than a multi-row INSERT, so it takes bigger bites.
+DEFAULT_BATCH_SIZE = 1000
+COPY_BATCH_SIZE = 50000
+
 
 # ---------------------------------------------------------------------------
 # Database helpers
@@ -63,19 +446,51 @@ def get_database_url() -> str:
     )
 
 
-def create_table(database_url: Optional[str] = None) -> None:
-    """Run ``CREATE TABLE IF NOT EXISTS`` for the applicants table.
+def migrate(database_url: Optional[str] = None) -> list[str]:
+    """Create the applicants table and apply any pending migrations.
+
+    Safe to call on every start-up: applied migrations are skipped, and
+    an advisory lock serialises concurrent callers.  A migration step
+    is either a SQL string or a function taking the open cursor.
 
     Args:
         database_url: Optional override for the connection string.
+
+    Returns:
+        Names of the migrations applied by this call (empty when the
+        schema was already current).
     """
     url = database_url or get_database_url()
-    conn = psycopg2.connect(url)
-    cur = conn.cursor()
-    cur.execute(CREATE_TABLE_SQL)
-    conn.commit()
-    cur.close()
-    conn.close()
+    applied: list[str] = []
+    with db.connection(url) as conn:
+        with conn.cursor() as cur:
+            cur.execute("SELECT pg_advisory_xact_lock(%s)", (MIGRATION_LOCK_ID,))
+            cur.execute(CREATE_TABLE_SQL)
+            cur.execute(MIGRATIONS_TABLE_SQL)
+            cur.execute("SELECT name FROM schema_migrations")
+            done = {row[0] for row in cur.fetchall()}
+            for name, step in MIGRATIONS:
+                if name in done:
+                    continue
+                # Most steps are plain SQL; data backfills are functions
+                if callable(step):
+                    step(cur)
+                else:
+                    cur.execute(step)
+                cur.execute(
+                    "INSERT INTO schema_migrations (name) VALUES (%s)", (name,)
+                )
+                applied.append(name)
+    return applied
+
+
+def create_table(database_url: Optional[str] = None) -> None:
+    """Create the applicants table and bring its schema up to date.
+
+    Args:
+        database_url: Optional override for the connection string.
+    """
+    migrate(database_url)
 
 
 # ---------------------------------------------------------------------------
@@ -126,17 +541,24 @@ def prepare_row(entry: dict) -> tuple:
 
     Handles both raw-scraper dicts (which have ``'university'`` and
     ``'entry_link'``) and cleaned/pre-processed dicts (which may
-    already have ``'url'`` and ``'term'``).
+    already have ``'url'`` and ``'term'``, and a combined
+    ``"Program, University"`` string in ``'program'`` that is split
+    with ``clean.split_program_university``).
+
+    The typed ``status_category`` / ``term_season`` / ``term_year``
+    columns are derived here, once, so queries can filter on them
+    with plain equality instead of ``ILIKE``.
 
     Args:
         entry: A single applicant dict.
 
     Returns:
-        A 14-element tuple aligned with the INSERT column order.
+        A tuple aligned with ``INSERT_COLUMNS``.
     """
-    university = entry.get('university', '') or ''
-    program = entry.get('program', '') or ''
-    combined = f"{program}, {university}".strip(', ')
+    program = entry.get('program') or None
+    university = entry.get('university') or None
+    if program and not university:
+        program, university = split_program_university(program)
 
     # Prefer the explicit field; fall back to the boolean ``international`` flag
     us_or_intl = entry.get('us_or_international')
@@ -145,13 +567,16 @@ def prepare_row(entry: dict) -> tuple:
             entry.get('international')
         )
 
+    term = entry.get('semester_year') or entry.get('term')
+    term_season, term_year = parse_term(term)
+
     return (
-        combined or None,                                    # program
+        program,                                             # program
         entry.get('comments'),                               # comments
         None,                                                # date_added
         entry.get('url') or entry.get('entry_link'),         # url (UNIQUE)
         entry.get('status'),                                 # status
-        entry.get('semester_year') or entry.get('term'),     # term
+        term,                                                # term
         us_or_intl,                                          # us_or_international
         safe_float(entry.get('gpa')),                        # gpa
         safe_float(
@@ -164,48 +589,251 @@ def prepare_row(entry: dict) -> tuple:
         entry.get('degree'),                                 # degree
         entry.get('llm_generated_program'),
         entry.get('llm_generated_university'),
+        status_category(entry.get('status')),                # status_category
+        term_season,                                         # term_season
+        term_year,                                           # term_year
+        university,                                          # university
+    )
+
+
+# ---------------------------------------------------------------------------
+# COPY support
+# ---------------------------------------------------------------------------
+
+def _csv_field(value: Any) -> str:
+    """Encode one value for ``COPY ... WITH (FORMAT csv)``.
+
+    ``None`` becomes an unquoted empty field (read back as NULL), while
+    strings are always quoted so an empty string stays an empty string.
+
+    Args:
+        value: A single column value from ``prepare_row``.
+
+    Returns:
+        The CSV-encoded field.
+    """
+    if value is None:
+        return ''
+    if isinstance(value, str):
+        return '"' + value.replace('"', '""') + '"'
+    return str(value)
+
+
+class _CopyStream:
+    """Read-only file object that renders CSV lines on demand.
+
+    ``cursor.copy_expert`` pulls data with ``read(size)``, so rows are
+    encoded only as Postgres consumes them instead of building the whole
+    CSV payload in memory first.
+    """
+
+    def __init__(self, rows: Iterable[tuple]) -> None:
+        self._lines = (
+            ','.join(_csv_field(v) for v in row) + '\n' for row in rows
+        )
+        self._buffer = ''
+
+    def read(self, size: int = -1) -> str:
+        """Return up to *size* characters (everything when negative)."""
+        while size < 0 or len(self._buffer) < size:
+            line = next(self._lines, None)
+            if line is None:
+                break
+            self._buffer += line
+        if size < 0:
+            chunk, self._buffer = self._buffer, ''
+        else:
+            chunk, self._buffer = self._buffer[:size], self._buffer[size:]
+        return chunk
+
+
+def copy_rows(cur: psycopg2.extensions.cursor, rows: Iterable[tuple]) -> int:
+    """Bulk-load *rows* via ``COPY`` into a staging table, then merge.
+
+    The staging table is a temporary clone of the insert columns
+    (dropped at commit, and emptied after each merge so several
+    batches can reuse it in one transaction).  The merge uses the same
+    ``ON CONFLICT (url) DO NOTHING`` rule as the ``execute_values``
+    path, so both load methods are equally idempotent.
+
+    Args:
+        cur: An open cursor; the caller commits.
+        rows: Tuples in ``INSERT_COLUMNS`` order (see ``prepare_row``).
+
+    Returns:
+        The number of rows actually inserted by the merge.
+    """
+    columns = ', '.join(INSERT_COLUMNS)
+    cur.execute(
+        "CREATE TEMP TABLE IF NOT EXISTS applicants_staging "
+        "ON COMMIT DROP AS "
+        f"SELECT {columns} FROM applicants WITH NO DATA"
+    )
+    cur.copy_expert(
+        f"COPY applicants_staging ({columns}) FROM STDIN WITH (FORMAT csv)",
+        _CopyStream(rows),
     )
+    cur.execute(
+        f"INSERT INTO applicants ({columns}) "
+        f"SELECT {columns} FROM applicants_staging "
+        "ON CONFLICT (url) DO NOTHING"
+    )
+    inserted = cur.rowcount
+    cur.execute("TRUNCATE applicants_staging")
+    return inserted
 
 
 # ---------------------------------------------------------------------------
 # Bulk insert
 # ---------------------------------------------------------------------------
 
-def insert_records(records: list[dict],
-                   database_url: Optional[str] = None) -> int:
-    """Bulk-insert applicant records, skipping duplicates.
+def _insert_batch(cur: psycopg2.extensions.cursor,
+                  rows: list[tuple]) -> int:
+    """Insert one batch with ``execute_values``; return rows inserted.
+
+    ``RETURNING p_id`` yields one row per tuple that was actually
+    written, so conflicts skipped by ``ON CONFLICT DO NOTHING`` are
+    not counted.
+
+    Args:
+        cur: An open cursor; the caller commits.
+        rows: Tuples in ``INSERT_COLUMNS`` order.
+
+    Returns:
+        The number of rows inserted.
+    """
+    insert_sql = f"""
+        INSERT INTO applicants ({', '.join(INSERT_COLUMNS)})
+        VALUES %s
+        ON CONFLICT (url) DO NOTHING
+        RETURNING p_id
+    """
+    returned = execute_values(
+        cur, insert_sql, rows, page_size=len(rows), fetch=True
+    )
+    return len(returned)
+
+
+def iter_row_batches(records: Iterable[dict],
+                     batch_size: int) -> Iterator[list[tuple]]:
+    """Encode records with ``prepare_row`` lazily, one batch at a time.
+
+    Only the current batch of tuples exists at any moment, so a
+    generator of records can be loaded without ever holding the whole
+    dataset in memory.
+
+    Args:
+        records: Any iterable of applicant dicts (list, generator, ...).
+        batch_size: Maximum tuples per yielded batch.
+
+    Yields:
+        Lists of at most *batch_size* tuples in ``INSERT_COLUMNS`` order.
+    """
+    iterator = iter(records)
+    while True:
+        batch = [prepare_row(r) for r in islice(iterator, batch_size)]
+        if not batch:
+            return
+        yield batch
+
+
+def _rate(rows: int, seconds: float) -> float:
+    """Rows per second, guarding against a zero-length interval."""
+    return round(rows / seconds, 1) if seconds > 0 else 0.0
+
+
+def load_records(records: Iterable[dict],
+                 database_url: Optional[str] = None,
+                 method: str = 'values',
+                 batch_size: Optional[int] = None) -> dict[str, Any]:
+    """Bulk-insert applicant records and report exactly what happened.
 
     Uses ``ON CONFLICT (url) DO NOTHING`` so that re-pulling the
-    same data is safe (idempotent).
+    same data is safe (idempotent).  Inserted rows are counted from
+    the database itself (``RETURNING`` / ``rowcount``), so
+    ``skipped`` is the number of duplicates that were ignored.
+
+    Records are encoded and written one batch at a time (see
+    ``iter_row_batches``); each batch is released before the next is
+    built, so peak memory depends on *batch_size*, not on the input.
+    All batches share one transaction.
 
     Args:
-        records: List of applicant dicts to insert.
+        records: Any iterable of applicant dicts.
         database_url: Optional Postgres connection string override.
+        method: ``'values'`` for multi-row ``INSERT`` via
+            ``execute_values``, or ``'copy'`` to stream rows through
+            ``COPY FROM STDIN`` (much faster for large loads).
+        batch_size: Rows per batch.  Defaults to
+            ``DEFAULT_BATCH_SIZE`` for ``'values'`` and
+            ``COPY_BATCH_SIZE`` for ``'copy'``.
 
     Returns:
-        The number of rows passed to ``execute_values`` (not
-        necessarily the number actually inserted, due to conflicts).
+        A dict with ``total``, ``inserted``, ``skipped``, ``seconds``
+        and ``rows_per_sec`` for the whole load, plus a ``batches``
+        list with the same five keys per batch.
+
+    Raises:
+        ValueError: If *method* is not one of ``LOAD_METHODS`` or
+            *batch_size* is not positive.
     """
+    if method not in LOAD_METHODS:
+        raise ValueError(
+            f"Unknown load method {method!r}; expected one of {LOAD_METHODS}"
+        )
+    if batch_size is None:
+        batch_size = COPY_BATCH_SIZE if method == 'copy' else DEFAULT_BATCH_SIZE
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be positive, got {batch_size}")
+
     url = database_url or get_database_url()
-    conn = psycopg2.connect(url)
-    cur = conn.cursor()
+    write = copy_rows if method == 'copy' else _insert_batch
+
+    batches: list[dict[str, Any]] = []
+    with db.connection(url) as conn:
+        with conn.cursor() as cur:
+            for chunk in iter_row_batches(records, batch_size):
+                started = time.perf_counter()
+                inserted = write(cur, chunk)
+                elapsed = time.perf_counter() - started
+                batches.append({
+                    'total': len(chunk),
+                    'inserted': inserted,
+                    'skipped': len(chunk) - inserted,
+                    'seconds': round(elapsed, 6),
+                    'rows_per_sec': _rate(len(chunk), elapsed),
+                })
+
+    total = sum(b['total'] for b in batches)
+    inserted = sum(b['inserted'] for b in batches)
+    seconds = sum(b['seconds'] for b in batches)
+    return {
+        'total': total,
+        'inserted': inserted,
+        'skipped': total - inserted,
+        'seconds': round(seconds, 6),
+        'rows_per_sec': _rate(total, seconds),
+        'batches': batches,
+    }
+
+
+def insert_records(records: Iterable[dict],
+                   database_url: Optional[str] = None,
+                   method: str = 'values') -> int:
+    """Bulk-insert applicant records, skipping duplicates.
 
-    rows = [prepare_row(r) for r in records]
+    Thin wrapper around ``load_records`` for callers that only need
+    the count.
 
-    insert_sql = """
-        INSERT INTO applicants (
-            program, comments, date_added, url, status, term,
-            us_or_international, gpa, gre, gre_v, gre_aw, degree,
-            llm_generated_program, llm_generated_university
-        ) VALUES %s
-        ON CONFLICT (url) DO NOTHING
-    """
+    Args:
+        records: Any iterable of applicant dicts to insert.
+        database_url: Optional Postgres connection string override.
+        method: ``'values'`` or ``'copy'`` (see ``load_records``).
 
-    execute_values(cur, insert_sql, rows, page_size=1000)
-    conn.commit()
-    cur.close()
-    conn.close()
-    return len(rows)
+    Returns:
+        The number of rows actually inserted (duplicates excluded).
+    """
+    return load_records(records, database_url, method)['inserted']
 
 
 # ---------------------------------------------------------------------------
@@ -244,8 +872,12 @@ def main() -> None:
 
     database_url = get_database_url()
     create_table(database_url)
-    count = insert_records(data, database_url)
-    print(f"Inserted {count} rows.")
+    stats = load_records(data, database_url, method='copy')
+    refresh_cube(database_url)
+    print(f"Inserted {stats['inserted']} rows "
+          f"({stats['skipped']} duplicates skipped) "
+          f"in {stats['seconds']:.2f}s "
+          f"({stats['rows_per_sec']:.0f} rows/s).")
 
 
 if __name__ == '__main__':  # pragma: no cover
@@ -0,0 +1,149 @@
+"""Per-query timing and plan instrumentation.
+
+Every analysis statement goes through ``execute(cur, name, sql)``,
+which times it and records the result under a stable name (``q1`` …
+``q9``, ``custom_1``, ``custom_2``, plus ``scalars`` / ``summary`` for
+the consolidated statements).  The numbers accumulate in a process-wide
+``QueryMetrics`` registry that the Flask app exposes at ``/metrics``
+(JSON, or Prometheus text format) and ``query_data.py --profile``
+prints.
+
+With ``REGISTRY.explain`` switched on, each statement is first run as
+``EXPLAIN (ANALYZE, BUFFERS)`` and the plan is kept with its timings.
+That executes every query twice, so it is meant for profiling, not
+for normal serving.
+
+Author: Jie Xu
+Course: JHU Modern Software Concepts
+Date: February 2026
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Optional, Sequence
+
+import psycopg2.extensions
+
+
+# Prefix for every exported Prometheus metric
+PROMETHEUS_PREFIX = 'gradcafe_query'
+
+
+class QueryMetrics:
+    """Thread-safe running statistics per named query.
+
+    Attributes:
+        explain: When true, ``execute`` also captures an
+            ``EXPLAIN (ANALYZE, BUFFERS)`` plan for every statement.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._stats: dict[str, dict[str, Any]] = {}
+        self.explain = False
+
+    def record(self, name: str, seconds: float, rows: int,
+               plan: Optional[str] = None) -> None:
+        """Add one execution of query *name*.
+
+        Args:
+            name: Stable query name (e.g. ``'q7'``).
+            seconds: Wall time of the execution.
+            rows: Rows returned (``cursor.rowcount``).
+            plan: Optional ``EXPLAIN`` output to keep as the latest plan.
+        """
+        with self._lock:
+            stats = self._stats.setdefault(name, {
+                'calls': 0, 'total_seconds': 0.0, 'max_seconds': 0.0,
+                'last_seconds': 0.0, 'last_rows': 0, 'plan': None,
+            })
+            stats['calls'] += 1
+            stats['total_seconds'] += seconds
+            stats['max_seconds'] = max(stats['max_seconds'], seconds)
+            stats['last_seconds'] = seconds
+            stats['last_rows'] = rows
+            if plan is not None:
+                stats['plan'] = plan
+
+    def reset(self) -> None:
+        """Forget everything recorded so far."""
+        with self._lock:
+            self._stats.clear()
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Return a copy of the statistics, with ``avg_seconds`` added.
+
+        Returns:
+            ``{name: {calls, total_seconds, avg_seconds, max_seconds,
+            last_seconds, last_rows, plan}}`` sorted by name.
+        """
+        with self._lock:
+            snap = {name: dict(stats) for name, stats in self._stats.items()}
+        for stats in snap.values():
+            stats['avg_seconds'] = stats['total_seconds'] / stats['calls']
+        return dict(sorted(snap.items()))
+
+    def prometheus(self) -> str:
+        """Render the statistics in the Prometheus text exposition format.
+
+        Returns:
+            A ``text/plain; version=0.0.4`` payload: a summary
+            (``_sum`` / ``_count``) of query durations plus gauges for
+            the latest duration, the slowest duration and the latest
+            row count, each labelled by query name.
+        """
+        snap = self.snapshot()
+        metric = f'{PROMETHEUS_PREFIX}_duration_seconds'
+        lines = [
+            f'# HELP {metric} Wall time spent executing each named query.',
+            f'# TYPE {metric} summary',
+        ]
+        for name, stats in snap.items():
+            lines.append(f'{metric}_sum{{query="{name}"}} '
+                         f'{stats["total_seconds"]:.6f}')
+            lines.append(f'{metric}_count{{query="{name}"}} {stats["calls"]}')
+
+        gauges = (
+            ('last_seconds', 'Wall time of the latest execution.', '.6f'),
+            ('max_seconds', 'Slowest execution seen.', '.6f'),
+            ('last_rows', 'Rows returned by the latest execution.', 'd'),
+        )
+        for key, help_text, fmt in gauges:
+            gauge = f'{PROMETHEUS_PREFIX}_{key}'
+            lines.append(f'# HELP {gauge} {help_text}')
+            lines.append(f'# TYPE {gauge} gauge')
+            for name, stats in snap.items():
+                lines.append(f'{gauge}{{query="{name}"}} '
+                             f'{stats[key]:{fmt}}')
+        return '\n'.join(lines) + '\n'
+
+
+# Process-wide registry used by query_data, app and /metrics
+REGISTRY = QueryMetrics()
+
+
+def execute(cur: psycopg2.extensions.cursor, name: str, sql: str,
+            params: Optional[Sequence[Any]] = None,
+            registry: Optional[QueryMetrics] = None) -> None:
+    """Execute *sql* on *cur* and record its timing under *name*.
+
+    Results are left on the cursor for the caller to fetch.  Works
+    with any cursor class, so it composes with custom cursor factories.
+
+    Args:
+        cur: An open cursor.
+        name: Stable name to record the execution under.
+        sql: The statement to run.
+        params: Optional query parameters.
+        registry: Where to record; defaults to ``REGISTRY``.
+    """
+    registry = registry or REGISTRY
+    plan = None
+    if registry.explain:
+        cur.execute('EXPLAIN (ANALYZE, BUFFERS) ' + sql, params)
+        plan = '\n'.join(row[0] for row in cur.fetchall())
+    started = time.perf_counter()
+    cur.execute(sql, params)
+    registry.record(name, time.perf_counter() - started, cur.rowcount, plan)
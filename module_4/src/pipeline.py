@@ -0,0 +1,254 @@
+"""Concurrent scrape -> parse -> load pipeline.
+
+A pull used to run the scraper to completion and only then hand the
+full list to the loader, so network time and database time added up.
+``run_pipeline`` instead connects three stages with bounded queues:
+
+    fetch (1 thread)  ->  parse (N threads)  ->  write (M threads)
+
+* **fetch** iterates the page source (e.g. ``scrape.fetch_pages``),
+  so HTTP requests and their polite delays happen here.
+* **parse** turns each page into applicant dicts.
+* **write** groups dicts into batches and hands each batch to the
+  loader while the earlier stages keep fetching.
+
+Because each queue holds at most ``queue_size`` items, memory stays
+bounded no matter how many pages are pulled, and a pull takes roughly
+as long as its slowest stage instead of the sum of all three.
+
+An optional ``on_progress`` callback sees the running counters after
+every page, parse and batch.  If it raises (say, because the job was
+cancelled or ran out of time — see ``src.jobs``), the pipeline shuts
+down just as it does for any other stage error.
+
+Author: Jie Xu
+Course: JHU Modern Software Concepts
+Date: February 2026
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from typing import Any, Callable, Iterable, Optional
+
+
+# Marks the end of a queue's input
+_DONE = object()
+
+# How long a blocked put/get waits before re-checking for cancellation
+_POLL_SECONDS = 0.1
+
+
+# ---------------------------------------------------------------------------
+# Stage helpers
+# ---------------------------------------------------------------------------
+
+def parse_item(item: Any) -> list[dict]:
+    """Default parse stage: turn one fetched item into applicant dicts.
+
+    HTML pages (strings) are parsed with ``scrape.extract_entries``;
+    anything else is assumed to be an already-parsed record and is
+    passed through unchanged.  This lets scrapers that return dicts
+    (such as the fakes used in tests) share the same pipeline.
+
+    Args:
+        item: One HTML page or one applicant dict.
+
+    Returns:
+        A list of applicant dicts (empty for a page with no results).
+    """
+    if isinstance(item, str):
+        from src.scrape import extract_entries
+        return extract_entries(item)
+    return [item]
+
+
+class _Stop(Exception):
+    """Raised inside a stage when the pipeline is shutting down."""
+
+
+def _put(q: queue.Queue, item: Any, stop: threading.Event) -> None:
+    """Block until *item* is queued, giving up if the pipeline stops."""
+    while True:
+        if stop.is_set():
+            raise _Stop()
+        try:
+            q.put(item, timeout=_POLL_SECONDS)
+            return
+        except queue.Full:
+            continue
+
+
+def _get(q: queue.Queue, stop: threading.Event) -> Any:
+    """Block until an item is available, giving up if the pipeline stops."""
+    while True:
+        if stop.is_set():
+            raise _Stop()
+        try:
+            return q.get(timeout=_POLL_SECONDS)
+        except queue.Empty:
+            continue
+
+
+# ---------------------------------------------------------------------------
+# Pipeline
+# ---------------------------------------------------------------------------
+
+def run_pipeline(pages: Iterable[Any],
+                 load_fn: Callable[[list[dict], str], Optional[int]],
+                 database_url: str,
+                 parse_fn: Callable[[Any], list[dict]] = parse_item,
+                 parse_workers: int = 2,
+                 write_workers: int = 1,
+                 queue_size: int = 8,
+                 batch_size: int = 500,
+                 on_progress: Optional[Callable[[dict[str, Any]], None]] = None,
+                 ) -> dict[str, Any]:
+    """Run fetch, parse and write concurrently over bounded queues.
+
+    A page that parses to zero records means the source is exhausted
+    (Grad Cafe returns an empty table past the last page), so the
+    fetch stage stops requesting more.  If any stage raises, the
+    others are cancelled and the first exception is re-raised here.
+
+    Args:
+        pages: Iterable of raw items to fetch — HTML pages from
+            ``scrape.fetch_pages`` or already-parsed dicts.
+        load_fn: Called as ``load_fn(batch, database_url)`` for each
+            batch of at most ``batch_size`` dicts.  Should return the
+            number of new rows, or ``None`` if it cannot tell.
+        database_url: Connection string passed through to ``load_fn``.
+        parse_fn: Maps one fetched item to a list of applicant dicts.
+        parse_workers: Number of parse threads.
+        write_workers: Number of loader threads.
+        queue_size: Capacity of each inter-stage queue.
+        batch_size: Maximum records per ``load_fn`` call.
+        on_progress: Optional callback given a copy of the counters
+            (``pages``, ``fetched``, ``inserted``, ``batches``) as they
+            change.  It is called from the worker threads; an exception
+            it raises cancels the pipeline and is re-raised here.
+
+    Returns:
+        A dict with ``pages`` (items fetched), ``fetched`` (records
+        parsed), ``inserted`` (sum of ``load_fn`` results, or ``None``
+        if any batch reported ``None``), ``batches`` and ``seconds``.
+    """
+    page_q: queue.Queue = queue.Queue(maxsize=queue_size)
+    record_q: queue.Queue = queue.Queue(maxsize=queue_size)
+    stop = threading.Event()       # cancel everything (error)
+    exhausted = threading.Event()  # source has no more results
+    lock = threading.Lock()
+    errors: list[BaseException] = []
+    stats: dict[str, Any] = {
+        'pages': 0, 'fetched': 0, 'inserted': 0, 'batches': 0,
+    }
+    parsers_left = [parse_workers]
+
+    def _fail(exc: BaseException) -> None:
+        with lock:
+            errors.append(exc)
+        stop.set()
+
+    def _report() -> None:
+        if on_progress is not None:
+            with lock:
+                snapshot = dict(stats)
+            on_progress(snapshot)
+
+    def _fetch() -> None:
+        iterator = iter(pages)
+        try:
+            for page in iterator:
+                if exhausted.is_set():
+                    break
+                with lock:
+                    stats['pages'] += 1
+                _report()
+                _put(page_q, page, stop)
+            for _ in range(parse_workers):
+                _put(page_q, _DONE, stop)
+        except _Stop:
+            pass
+        except BaseException as exc:  # pylint: disable=broad-except
+            _fail(exc)
+        finally:
+            close = getattr(iterator, 'close', None)
+            if close:
+                close()
+
+    def _parse() -> None:
+        try:
+            while True:
+                page = _get(page_q, stop)
+                if page is _DONE:
+                    break
+                records = parse_fn(page)
+                if not records:
+                    exhausted.set()
+                    continue
+                with lock:
+                    stats['fetched'] += len(records)
+                _report()
+                _put(record_q, records, stop)
+            # The last parser to finish tells every writer to flush
+            with lock:
+                parsers_left[0] -= 1
+                last = parsers_left[0] == 0
+            if last:
+                for _ in range(write_workers):
+                    _put(record_q, _DONE, stop)
+        except _Stop:
+            pass
+        except BaseException as exc:  # pylint: disable=broad-except
+            _fail(exc)
+
+    def _flush(batch: list[dict]) -> None:
+        inserted = load_fn(batch, database_url)
+        with lock:
+            stats['batches'] += 1
+            if stats['inserted'] is not None and isinstance(inserted, int):
+                stats['inserted'] += inserted
+            else:
+                stats['inserted'] = None
+        _report()
+
+    def _write() -> None:
+        batch: list[dict] = []
+        try:
+            while True:
+                records = _get(record_q, stop)
+                if records is _DONE:
+                    break
+                batch.extend(records)
+                while len(batch) >= batch_size:
+                    _flush(batch[:batch_size])
+                    batch = batch[batch_size:]
+            if batch:
+                _flush(batch)
+        except _Stop:
+            pass
+        except BaseException as exc:  # pylint: disable=broad-except
+            _fail(exc)
+
+    started = time.perf_counter()
+    threads = [threading.Thread(target=_fetch, name='ingest-fetch')]
+    threads += [
+        threading.Thread(target=_parse, name=f'ingest-parse-{i}')
+        for i in range(parse_workers)
+    ]
+    threads += [
+        threading.Thread(target=_write, name=f'ingest-write-{i}')
+        for i in range(write_workers)
+    ]
+    for thread in threads:
+        thread.daemon = True
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    if errors:
+        raise errors[0]
+    stats['seconds'] = round(time.perf_counter() - started, 3)
+    return stats
@@ -5,6 +5,17 @@ Each public function runs one analytical query against the
 accept an optional ``database_url`` parameter so the test suite can
 redirect them to a dedicated test database.
 
+``run_all_queries`` answers every question in three round trips (see
+``SCALARS_SQL``); the per-question functions remain for callers that
+only need one number.
+
+Term and status filters use the typed ``term_year`` / ``term_season``
+/ ``status_category`` columns populated at load time
+(``term_season`` 4 = Fall, see ``clean.TERM_SEASONS``).  Counts and
+averages (Q1–Q6, custom Q2) read the pre-aggregated
+``applicant_summary`` table; only the program/university questions
+touch ``applicants`` directly.
+
 Author: Jie Xu
 Course: JHU Modern Software Concepts
 Date: February 2026
@@ -12,11 +23,17 @@ Date: February 2026
 
 from __future__ import annotations
 
+import argparse
 import os
-from typing import Any, Optional
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Optional
 
 import psycopg2
 
+from src import db, metrics
+
 
 # ---------------------------------------------------------------------------
 # Database helpers
@@ -51,11 +68,205 @@ def get_connection(database_url: Optional[str] = None) -> psycopg2.extensions.co
     return psycopg2.connect(url)
 
 
+@contextmanager
+def _cursor(database_url: Optional[str] = None) -> Iterator[psycopg2.extensions.cursor]:
+    """Yield a cursor on a connection borrowed from the shared pool.
+
+    Args:
+        database_url: Optional override.  Defaults to
+            ``get_database_url()``.
+
+    Yields:
+        An open cursor; the connection goes back to the pool on exit.
+    """
+    url = database_url or get_database_url()
+    with db.connection(url) as conn:
+        with conn.cursor() as cur:
+            yield cur
+
+
+# ---------------------------------------------------------------------------
+# Shared SQL
+# ---------------------------------------------------------------------------
+# Predicates and aggregate builders shared by the per-question
+# functions below and by the single-pass ``SCALARS_SQL``, so the two
+# can never drift apart.
+# (``%%`` is a literal ``%`` once psycopg2 formats the string.)
+
+_FALL_2026 = "term_year = 2026 AND term_season = 4"
+_FALL_2025 = "term_year = 2025 AND term_season = 4"
+_ACCEPTED = "status_category = 'Accepted'"
+_AMERICAN = "us_or_international = 'American'"
+_INTERNATIONAL = "us_or_international = 'International'"
+_OTHER = "us_or_international = 'Other'"
+
+Q7_WHERE = (
+    "(lower(university) LIKE 'johns hopkins%%' "
+    "OR lower(university) = 'jhu') "
+    "AND program ILIKE '%%computer science%%' "
+    "AND degree ILIKE '%%master%%'"
+)
+
+Q8_WHERE = (
+    "term_year = 2026 "
+    f"AND {_ACCEPTED} "
+    "AND degree ILIKE '%%PhD%%' "
+    "AND program ILIKE '%%computer science%%' "
+    "AND (lower(university) LIKE 'georgetown%%' "
+    "OR lower(university) LIKE 'massachusetts institute of technology%%' "
+    "OR lower(university) = 'mit' "
+    "OR lower(university) LIKE 'stanford%%' "
+    "OR lower(university) LIKE 'carnegie mellon%%')"
+)
+
+Q9_WHERE = (
+    "term_year = 2026 "
+    f"AND {_ACCEPTED} "
+    "AND degree ILIKE '%%PhD%%' "
+    "AND llm_generated_program ILIKE '%%computer science%%' "
+    "AND (llm_generated_university ILIKE '%%georgetown%%' "
+    "OR llm_generated_university ILIKE '%%mit%%' "
+    "OR llm_generated_university ILIKE '%%stanford%%' "
+    "OR llm_generated_university ILIKE '%%carnegie mellon%%')"
+)
+
+
+def _avg(column: str, where: str = 'TRUE') -> str:
+    """SQL for a filtered average over ``applicant_summary`` sums."""
+    return (
+        f"SUM({column}_sum) FILTER (WHERE {where}) "
+        f"/ NULLIF(SUM({column}_n) FILTER (WHERE {where}), 0)"
+    )
+
+
+def _count(where: str = 'TRUE') -> str:
+    """SQL for a filtered applicant count over ``applicant_summary``."""
+    return f"coalesce(SUM(applicants) FILTER (WHERE {where}), 0)::bigint"
+
+
+def _summary(*columns: str) -> str:
+    """SQL selecting ``_count`` / ``_avg`` expressions from the summary."""
+    return f"SELECT {', '.join(columns)} FROM applicant_summary"
+
+
+# Q1–Q6 in one FILTER-aggregate pass over the summary table
+SUMMARY_SCALARS_SQL = f"""
+SELECT
+    {_count(_FALL_2026)} AS fall_2026_count,
+    {_count()} AS total,
+    {_count(_INTERNATIONAL)} AS international,
+    {_count(_AMERICAN)} AS american,
+    {_count(_OTHER)} AS other,
+    {_avg('gpa')} AS avg_gpa,
+    {_avg('gre')} AS avg_gre,
+    {_avg('gre_v')} AS avg_gre_v,
+    {_avg('gre_aw')} AS avg_gre_aw,
+    {_avg('gpa', _AMERICAN + ' AND ' + _FALL_2026)}
+        AS american_fall_2026_gpa,
+    {_count(_FALL_2025)} AS fall_2025_total,
+    {_count(_FALL_2025 + ' AND ' + _ACCEPTED)} AS fall_2025_accepted,
+    {_avg('gpa', _FALL_2026 + ' AND ' + _ACCEPTED)}
+        AS fall_2026_acceptance_gpa
+FROM applicant_summary
+"""
+
+Q7_SQL = f"SELECT COUNT(*) AS jhu_masters_cs FROM applicants WHERE {Q7_WHERE}"
+Q8_SQL = (
+    f"SELECT COUNT(*) AS phd_cs_top_schools FROM applicants WHERE {Q8_WHERE}"
+)
+Q9_SQL = (
+    "SELECT COUNT(*) AS phd_cs_top_schools_llm FROM applicants "
+    f"WHERE {Q9_WHERE}"
+)
+
+# Every Q1–Q9 scalar in ONE statement: the summary pass cross-joined
+# with one scalar subquery per program/university count (Q7–Q9).  The
+# subqueries each keep their own index plan; folding them into one
+# OR'd pass over applicants was measured slower (see
+# benchmarks/bench_analysis.py).
+SCALARS_SQL = f"""
+SELECT s.*, a.*
+FROM ({SUMMARY_SCALARS_SQL}) AS s
+CROSS JOIN (
+    SELECT ({Q7_SQL}) AS jhu_masters_cs,
+           ({Q8_SQL}) AS phd_cs_top_schools,
+           ({Q9_SQL}) AS phd_cs_top_schools_llm
+) AS a
+"""
+
+TOP_PROGRAMS_SQL = (
+    "SELECT llm_generated_program, COUNT(*) AS cnt "
+    "FROM applicants WHERE llm_generated_program IS NOT NULL "
+    "GROUP BY llm_generated_program ORDER BY cnt DESC LIMIT 10"
+)
+
+# The summary stores a missing degree as '', so blank and NULL degrees
+# are both left out (reading ``applicants``, blanks were a group)
+ACCEPTANCE_BY_DEGREE_SQL = (
+    "SELECT degree, SUM(applicants)::bigint AS total, "
+    f"{_count(_ACCEPTED)} AS accepted, "
+    f"ROUND(100.0 * {_count(_ACCEPTED)} "
+    "/ SUM(applicants), 2) AS rate "
+    "FROM applicant_summary WHERE degree <> '' "
+    "GROUP BY degree ORDER BY total DESC"
+)
+
+# What ``run_all_queries`` sends, by name.  On one connection, three
+# statements; across a thread pool, the scalar statement is split back
+# into its independent parts so they run side by side.  Every query
+# except the custom ones returns one row of named scalars.
+SEQUENTIAL_QUERIES: dict[str, str] = {
+    'scalars': SCALARS_SQL,
+    'custom_1': TOP_PROGRAMS_SQL,
+    'custom_2': ACCEPTANCE_BY_DEGREE_SQL,
+}
+
+CONCURRENT_QUERIES: dict[str, str] = {
+    'summary': SUMMARY_SCALARS_SQL,
+    'q7': Q7_SQL,
+    'q8': Q8_SQL,
+    'q9': Q9_SQL,
+    'custom_1': TOP_PROGRAMS_SQL,
+    'custom_2': ACCEPTANCE_BY_DEGREE_SQL,
+}
+
+# Threads used by ``run_all_queries`` unless told otherwise; each one
+# borrows its own pooled connection, so keep this below DB_POOL_MAX
+QUERY_WORKERS = 4
+
+
+def percentage(part: int, whole: int) -> float:
+    """Return ``part / whole`` as a percentage rounded to 2 places.
+
+    Args:
+        part: Numerator count.
+        whole: Denominator count.
+
+    Returns:
+        The percentage, or ``0.00`` when *whole* is zero.
+    """
+    return round((part / whole) * 100, 2) if whole > 0 else 0.00
+
+
+def fetch_scalars(cur: psycopg2.extensions.cursor) -> dict[str, Any]:
+    """Run ``SCALARS_SQL`` on *cur* and return its row as a dict.
+
+    Args:
+        cur: An open cursor (the caller owns the connection).
+
+    Returns:
+        A dict keyed by the ``SCALARS_SQL`` column names.
+    """
+    metrics.execute(cur, 'scalars', SCALARS_SQL)
+    row = cur.fetchone()
+    return dict(zip((col[0] for col in cur.description), row))
+
+
 # ---------------------------------------------------------------------------
 # Individual query functions (Q1 – Q9 + two custom)
 # ---------------------------------------------------------------------------
-# Each function opens its own connection for simplicity.
-# TODO: refactor to share a single connection if performance matters.
+# Each function borrows a pooled connection (see ``src.db``), so running
+# all eleven no longer means eleven connection handshakes.
 
 def query_fall_2026_count(database_url: Optional[str] = None) -> int:
     """Q1: How many applicants applied for Fall 2026?
@@ -66,14 +277,9 @@ def query_fall_2026_count(database_url: Optional[str] = None) -> int:
     Returns:
         An integer count.
     """
-    conn = get_connection(database_url)
-    cur = conn.cursor()
-    cur.execute(
-        "SELECT COUNT(*) FROM applicants WHERE term = 'Fall 2026'"
-    )
-    result = cur.fetchone()[0]
-    cur.close()
-    conn.close()
+    with _cursor(database_url) as cur:
+        metrics.execute(cur, 'q1', _summary(_count(_FALL_2026)))
+        result = cur.fetchone()[0]
     return result
 
 
@@ -87,44 +293,25 @@ def query_international_percentage(database_url: Optional[str] = None) -> dict:
         A dict with keys ``total``, ``international``, ``american``,
         ``other``, and ``percentage``.
     """
-    conn = get_connection(database_url)
-    cur = conn.cursor()
+    with _cursor(database_url) as cur:
+        metrics.execute(cur, 'q2', _summary(_count()))
+        total = cur.fetchone()[0]
 
-    cur.execute("SELECT COUNT(*) FROM applicants")
-    total = cur.fetchone()[0]
+        metrics.execute(cur, 'q2', _summary(_count(_INTERNATIONAL)))
+        international = cur.fetchone()[0]
 
-    cur.execute(
-        "SELECT COUNT(*) FROM applicants "
-        "WHERE us_or_international = 'International'"
-    )
-    international = cur.fetchone()[0]
+        metrics.execute(cur, 'q2', _summary(_count(_AMERICAN)))
+        american = cur.fetchone()[0]
 
-    cur.execute(
-        "SELECT COUNT(*) FROM applicants "
-        "WHERE us_or_international = 'American'"
-    )
-    american = cur.fetchone()[0]
-
-    cur.execute(
-        "SELECT COUNT(*) FROM applicants "
-        "WHERE us_or_international = 'Other'"
-    )
-    other = cur.fetchone()[0]
-
-    cur.close()
-    conn.close()
-
-    # Guard against division-by-zero when the table is empty
-    percentage = round(
-        (international / total) * 100, 2
-    ) if total > 0 else 0.00
+        metrics.execute(cur, 'q2', _summary(_count(_OTHER)))
+        other = cur.fetchone()[0]
 
     return {
         'total': total,
         'international': international,
         'american': american,
         'other': other,
-        'percentage': percentage,
+        'percentage': percentage(international, total),
     }
 
 
@@ -132,7 +319,8 @@ def query_average_scores(database_url: Optional[str] = None) -> dict:
     """Q3: Average GPA, GRE, GRE-V, and GRE-AW across all applicants.
 
     Only applicants who reported each score are included in the
-    respective average (``WHERE ... IS NOT NULL``).
+    respective average (the summary keeps a sum and a non-NULL count
+    per score).
 
     Args:
         database_url: Optional Postgres connection string.
@@ -141,23 +329,18 @@ def query_average_scores(database_url: Optional[str] = None) -> dict:
         A dict with keys ``avg_gpa``, ``avg_gre``, ``avg_gre_v``,
         and ``avg_gre_aw``.
     """
-    conn = get_connection(database_url)
-    cur = conn.cursor()
-
-    cur.execute("SELECT AVG(gpa) FROM applicants WHERE gpa IS NOT NULL")
-    avg_gpa = cur.fetchone()[0]
-
-    cur.execute("SELECT AVG(gre) FROM applicants WHERE gre IS NOT NULL")
-    avg_gre = cur.fetchone()[0]
+    with _cursor(database_url) as cur:
+        metrics.execute(cur, 'q3', _summary(_avg('gpa')))
+        avg_gpa = cur.fetchone()[0]
 
-    cur.execute("SELECT AVG(gre_v) FROM applicants WHERE gre_v IS NOT NULL")
-    avg_gre_v = cur.fetchone()[0]
+        metrics.execute(cur, 'q3', _summary(_avg('gre')))
+        avg_gre = cur.fetchone()[0]
 
-    cur.execute("SELECT AVG(gre_aw) FROM applicants WHERE gre_aw IS NOT NULL")
-    avg_gre_aw = cur.fetchone()[0]
+        metrics.execute(cur, 'q3', _summary(_avg('gre_v')))
+        avg_gre_v = cur.fetchone()[0]
 
-    cur.close()
-    conn.close()
+        metrics.execute(cur, 'q3', _summary(_avg('gre_aw')))
+        avg_gre_aw = cur.fetchone()[0]
 
     return {
         'avg_gpa': avg_gpa,
@@ -176,25 +359,19 @@ def query_american_fall_2026_gpa(database_url: Optional[str] = None) -> Optional
     Returns:
         The average GPA as a float, or ``None``.
     """
-    conn = get_connection(database_url)
-    cur = conn.cursor()
-    cur.execute(
-        "SELECT AVG(gpa) FROM applicants "
-        "WHERE us_or_international = 'American' "
-        "AND term = 'Fall 2026' AND gpa IS NOT NULL"
-    )
-    result = cur.fetchone()[0]
-    cur.close()
-    conn.close()
+    with _cursor(database_url) as cur:
+        metrics.execute(
+            cur, 'q4', _summary(_avg('gpa', _AMERICAN + ' AND ' + _FALL_2026))
+        )
+        result = cur.fetchone()[0]
     return result
 
 
 def query_fall_2025_acceptance_rate(database_url: Optional[str] = None) -> dict:
     """Q5: What percentage of Fall 2025 entries are acceptances?
 
-    Uses ``ILIKE '%%Accept%%'`` so that variations like "Accepted
-    via Email" are counted.  Double-percent is required because
-    psycopg2 treats ``%`` as a parameter marker.
+    Filters on the load-time ``status_category`` column, so
+    variations like "Accepted via Email" count as acceptances.
 
     Args:
         database_url: Optional Postgres connection string.
@@ -202,31 +379,19 @@ def query_fall_2025_acceptance_rate(database_url: Optional[str] = None) -> dict:
     Returns:
         A dict with keys ``total``, ``accepted``, and ``percentage``.
     """
-    conn = get_connection(database_url)
-    cur = conn.cursor()
-
-    cur.execute(
-        "SELECT COUNT(*) FROM applicants WHERE term = 'Fall 2025'"
-    )
-    total = cur.fetchone()[0]
-
-    cur.execute(
-        "SELECT COUNT(*) FROM applicants "
-        "WHERE term = 'Fall 2025' AND status ILIKE '%%Accept%%'"
-    )
-    accepted = cur.fetchone()[0]
-
-    cur.close()
-    conn.close()
+    with _cursor(database_url) as cur:
+        metrics.execute(cur, 'q5', _summary(_count(_FALL_2025)))
+        total = cur.fetchone()[0]
 
-    percentage = round(
-        (accepted / total) * 100, 2
-    ) if total > 0 else 0.00
+        metrics.execute(
+            cur, 'q5', _summary(_count(_FALL_2025 + ' AND ' + _ACCEPTED))
+        )
+        accepted = cur.fetchone()[0]
 
     return {
         'total': total,
         'accepted': accepted,
-        'percentage': percentage,
+        'percentage': percentage(accepted, total),
     }
 
 
@@ -239,23 +404,19 @@ def query_fall_2026_acceptance_gpa(database_url: Optional[str] = None) -> Option
     Returns:
         The average GPA as a float, or ``None``.
     """
-    conn = get_connection(database_url)
-    cur = conn.cursor()
-    cur.execute(
-        "SELECT AVG(gpa) FROM applicants "
-        "WHERE term = 'Fall 2026' AND status ILIKE '%%Accept%%' "
-        "AND gpa IS NOT NULL"
-    )
-    result = cur.fetchone()[0]
-    cur.close()
-    conn.close()
+    with _cursor(database_url) as cur:
+        metrics.execute(
+            cur, 'q6', _summary(_avg('gpa', _FALL_2026 + ' AND ' + _ACCEPTED))
+        )
+        result = cur.fetchone()[0]
     return result
 
 
 def query_jhu_masters_cs(database_url: Optional[str] = None) -> int:
     """Q7: How many applicants to JHU Masters in Computer Science?
 
-    Matches both "Johns Hopkins" and "JHU" abbreviations via ILIKE.
+    Matches "Johns Hopkins ..." by prefix and the bare "JHU"
+    abbreviation exactly, using the indexed ``lower(university)``.
 
     Args:
         database_url: Optional Postgres connection string.
@@ -263,18 +424,12 @@ def query_jhu_masters_cs(database_url: Optional[str] = None) -> int:
     Returns:
         An integer count.
     """
-    conn = get_connection(database_url)
-    cur = conn.cursor()
-    cur.execute(
-        "SELECT COUNT(*) FROM applicants "
-        "WHERE (program ILIKE '%%johns hopkins%%' "
-        "OR program ILIKE '%%jhu%%') "
-        "AND program ILIKE '%%computer science%%' "
-        "AND degree ILIKE '%%master%%'"
-    )
-    result = cur.fetchone()[0]
-    cur.close()
-    conn.close()
+    with _cursor(database_url) as cur:
+        metrics.execute(
+            cur, 'q7',
+            "SELECT COUNT(*) FROM applicants WHERE " + Q7_WHERE
+        )
+        result = cur.fetchone()[0]
     return result
 
 
@@ -282,6 +437,8 @@ def query_top_schools_phd_cs(database_url: Optional[str] = None) -> int:
     """Q8: 2026 PhD CS acceptances at four top schools.
 
     Schools checked: Georgetown, MIT, Stanford, Carnegie Mellon.
+    Anchored prefix / equality matches on ``university`` avoid the
+    false positives of substring search ("mit" inside "Smith").
 
     Args:
         database_url: Optional Postgres connection string.
@@ -289,22 +446,12 @@ def query_top_schools_phd_cs(database_url: Optional[str] = None) -> int:
     Returns:
         An integer count of matching acceptances.
     """
-    conn = get_connection(database_url)
-    cur = conn.cursor()
-    cur.execute(
-        "SELECT COUNT(*) FROM applicants "
-        "WHERE term ILIKE '%%2026%%' "
-        "AND status ILIKE '%%Accept%%' "
-        "AND degree ILIKE '%%PhD%%' "
-        "AND program ILIKE '%%computer science%%' "
-        "AND (program ILIKE '%%georgetown%%' "
-        "OR program ILIKE '%%mit%%' "
-        "OR program ILIKE '%%stanford%%' "
-        "OR program ILIKE '%%carnegie mellon%%')"
-    )
-    result = cur.fetchone()[0]
-    cur.close()
-    conn.close()
+    with _cursor(database_url) as cur:
+        metrics.execute(
+            cur, 'q8',
+            "SELECT COUNT(*) FROM applicants WHERE " + Q8_WHERE
+        )
+        result = cur.fetchone()[0]
     return result
 
 
@@ -320,22 +467,12 @@ def query_top_schools_phd_cs_llm(database_url: Optional[str] = None) -> int:
     Returns:
         An integer count.
     """
-    conn = get_connection(database_url)
-    cur = conn.cursor()
-    cur.execute(
-        "SELECT COUNT(*) FROM applicants "
-        "WHERE term ILIKE '%%2026%%' "
-        "AND status ILIKE '%%Accept%%' "
-        "AND degree ILIKE '%%PhD%%' "
-        "AND llm_generated_program ILIKE '%%computer science%%' "
-        "AND (llm_generated_university ILIKE '%%georgetown%%' "
-        "OR llm_generated_university ILIKE '%%mit%%' "
-        "OR llm_generated_university ILIKE '%%stanford%%' "
-        "OR llm_generated_university ILIKE '%%carnegie mellon%%')"
-    )
-    result = cur.fetchone()[0]
-    cur.close()
-    conn.close()
+    with _cursor(database_url) as cur:
+        metrics.execute(
+            cur, 'q9',
+            "SELECT COUNT(*) FROM applicants WHERE " + Q9_WHERE
+        )
+        result = cur.fetchone()[0]
     return result
 
 
@@ -348,42 +485,26 @@ def query_top_programs(database_url: Optional[str] = None) -> list[tuple]:
     Returns:
         A list of ``(program_name, count)`` tuples.
     """
-    conn = get_connection(database_url)
-    cur = conn.cursor()
-    cur.execute(
-        "SELECT llm_generated_program, COUNT(*) AS cnt "
-        "FROM applicants WHERE llm_generated_program IS NOT NULL "
-        "GROUP BY llm_generated_program ORDER BY cnt DESC LIMIT 10"
-    )
-    results = cur.fetchall()
-    cur.close()
-    conn.close()
+    with _cursor(database_url) as cur:
+        metrics.execute(cur, 'custom_1', TOP_PROGRAMS_SQL)
+        results = cur.fetchall()
     return results
 
 
 def query_acceptance_by_degree(database_url: Optional[str] = None) -> list[tuple]:
     """Custom Q2: Acceptance rate broken down by degree type.
 
+    Applicants with no degree, ``NULL`` or blank, are not counted.
+
     Args:
         database_url: Optional Postgres connection string.
 
     Returns:
         A list of ``(degree, total, accepted, rate)`` tuples.
     """
-    conn = get_connection(database_url)
-    cur = conn.cursor()
-    cur.execute(
-        "SELECT degree, COUNT(*) AS total, "
-        "SUM(CASE WHEN status ILIKE '%%Accept%%' THEN 1 ELSE 0 END) "
-        "AS accepted, "
-        "ROUND(100.0 * SUM(CASE WHEN status ILIKE '%%Accept%%' "
-        "THEN 1 ELSE 0 END) / COUNT(*), 2) AS rate "
-        "FROM applicants WHERE degree IS NOT NULL "
-        "GROUP BY degree ORDER BY total DESC"
-    )
-    results = cur.fetchall()
-    cur.close()
-    conn.close()
+    with _cursor(database_url) as cur:
+        metrics.execute(cur, 'custom_2', ACCEPTANCE_BY_DEGREE_SQL)
+        results = cur.fetchall()
     return results
 
 
@@ -391,28 +512,134 @@ def query_acceptance_by_degree(database_url: Optional[str] = None) -> list[tuple
 # Aggregate runner
 # ---------------------------------------------------------------------------
 
-def run_all_queries(database_url: Optional[str] = None) -> dict[str, Any]:
+QueryResult = tuple[list[str], list[tuple]]
+
+
+def _fetch(cur: psycopg2.extensions.cursor, name: str,
+           sql: str) -> QueryResult:
+    """Execute *sql* as query *name*; return ``(column_names, rows)``."""
+    metrics.execute(cur, name, sql)
+    rows = cur.fetchall()
+    return [col[0] for col in cur.description], rows
+
+
+def _fetch_timed(name: str, sql: str,
+                 database_url: Optional[str]) -> tuple[QueryResult, float]:
+    """Run *sql* on its own pooled connection and time it."""
+    started = time.perf_counter()
+    with _cursor(database_url) as cur:
+        result = _fetch(cur, name, sql)
+    return result, time.perf_counter() - started
+
+
+def run_queries(queries: dict[str, str],
+                database_url: Optional[str] = None,
+                max_workers: int = QUERY_WORKERS,
+                ) -> tuple[dict[str, QueryResult], dict[str, float]]:
+    """Run named, independent queries, concurrently if allowed.
+
+    With ``max_workers`` above 1 the queries are dispatched across a
+    thread pool, each on its own pooled connection, so the wall time
+    is roughly that of the slowest query.  Otherwise they run one
+    after another on a single connection.
+
+    Args:
+        queries: Mapping of name to SQL (no parameters).
+        database_url: Optional Postgres connection string.
+        max_workers: Maximum queries in flight at once.
+
+    Returns:
+        ``(results, timings)``: ``results[name]`` is
+        ``(column_names, rows)`` and ``timings[name]`` is that query's
+        wall time in seconds.
+    """
+    results: dict[str, QueryResult] = {}
+    timings: dict[str, float] = {}
+    if max_workers <= 1:
+        with _cursor(database_url) as cur:
+            for name, sql in queries.items():
+                started = time.perf_counter()
+                results[name] = _fetch(cur, name, sql)
+                timings[name] = time.perf_counter() - started
+        return results, timings
+
+    with ThreadPoolExecutor(max_workers=max_workers,
+                            thread_name_prefix='query') as pool:
+        futures = {
+            name: pool.submit(_fetch_timed, name, sql, database_url)
+            for name, sql in queries.items()
+        }
+        for name, future in futures.items():
+            results[name], timings[name] = future.result()
+    return results, timings
+
+
+def run_all_queries(database_url: Optional[str] = None,
+                    max_workers: int = QUERY_WORKERS,
+                    timings: Optional[dict[str, float]] = None,
+                    ) -> dict[str, Any]:
     """Run every query and return a consolidated results dict.
 
+    Sequentially (``max_workers=1``) this is three round trips on one
+    pooled connection: ``SCALARS_SQL`` for all Q1–Q9 numbers, then the
+    two custom row-set queries.  Concurrently, ``CONCURRENT_QUERIES``
+    runs side by side.  Either way the result is the same; the
+    ``query_*`` functions above answer the same questions one at a
+    time.
+
     Args:
         database_url: Optional Postgres connection string.
+        max_workers: Queries in flight at once (see ``run_queries``).
+        timings: If given, filled with each query's wall time in
+            seconds plus ``'total'`` for the whole call.
 
     Returns:
         A dict with keys ``q1`` through ``q9``, ``custom_1``,
         and ``custom_2``.
     """
+    started = time.perf_counter()
+    queries = SEQUENTIAL_QUERIES if max_workers <= 1 else CONCURRENT_QUERIES
+    fetched, query_timings = run_queries(queries, database_url, max_workers)
+
+    # Merge the one-row scalar results into a single name -> value dict
+    s: dict[str, Any] = {}
+    for name, (columns, rows) in fetched.items():
+        if not name.startswith('custom_'):
+            s.update(zip(columns, rows[0]))
+
+    if timings is not None:
+        timings.update(query_timings)
+        timings['total'] = time.perf_counter() - started
+
     return {
-        'q1': query_fall_2026_count(database_url),
-        'q2': query_international_percentage(database_url),
-        'q3': query_average_scores(database_url),
-        'q4': query_american_fall_2026_gpa(database_url),
-        'q5': query_fall_2025_acceptance_rate(database_url),
-        'q6': query_fall_2026_acceptance_gpa(database_url),
-        'q7': query_jhu_masters_cs(database_url),
-        'q8': query_top_schools_phd_cs(database_url),
-        'q9': query_top_schools_phd_cs_llm(database_url),
-        'custom_1': query_top_programs(database_url),
-        'custom_2': query_acceptance_by_degree(database_url),
+        'q1': s['fall_2026_count'],
+        'q2': {
+            'total': s['total'],
+            'international': s['international'],
+            'american': s['american'],
+            'other': s['other'],
+            'percentage': percentage(s['international'], s['total']),
+        },
+        'q3': {
+            'avg_gpa': s['avg_gpa'],
+            'avg_gre': s['avg_gre'],
+            'avg_gre_v': s['avg_gre_v'],
+            'avg_gre_aw': s['avg_gre_aw'],
+        },
+        'q4': s['american_fall_2026_gpa'],
+        'q5': {
+            'total': s['fall_2025_total'],
+            'accepted': s['fall_2025_accepted'],
+            'percentage': percentage(
+                s['fall_2025_accepted'], s['fall_2025_total']
+            ),
+        },
+        'q6': s['fall_2026_acceptance_gpa'],
+        'q7': s['jhu_masters_cs'],
+        'q8': s['phd_cs_top_schools'],
+        'q9': s['phd_cs_top_schools_llm'],
+        'custom_1': fetched['custom_1'][1],
+        'custom_2': fetched['custom_2'][1],
     }
 
 
@@ -420,9 +647,77 @@ def run_all_queries(database_url: Optional[str] = None) -> dict[str, Any]:
 # CLI entry point
 # ---------------------------------------------------------------------------
 
-def main() -> None:
-    """Print all analysis results to the terminal."""
-    results = run_all_queries()
+# Each question's one-at-a-time function, by the name it records under
+PROFILED_QUERIES: dict[str, Callable[[Optional[str]], Any]] = {
+    'q1': query_fall_2026_count,
+    'q2': query_international_percentage,
+    'q3': query_average_scores,
+    'q4': query_american_fall_2026_gpa,
+    'q5': query_fall_2025_acceptance_rate,
+    'q6': query_fall_2026_acceptance_gpa,
+    'q7': query_jhu_masters_cs,
+    'q8': query_top_schools_phd_cs,
+    'q9': query_top_schools_phd_cs_llm,
+    'custom_1': query_top_programs,
+    'custom_2': query_acceptance_by_degree,
+}
+
+
+def profile_queries(database_url: Optional[str] = None) -> dict[str, dict]:
+    """Run every question once with ``EXPLAIN (ANALYZE, BUFFERS)``.
+
+    Uses the individual ``query_*`` functions so each of ``q1`` …
+    ``custom_2`` is timed and explained on its own.  Statistics already
+    in ``metrics.REGISTRY`` are discarded first.
+
+    Args:
+        database_url: Optional Postgres connection string.
+
+    Returns:
+        ``metrics.REGISTRY.snapshot()`` after the run.
+    """
+    registry = metrics.REGISTRY
+    registry.reset()
+    registry.explain = True
+    try:
+        for query in PROFILED_QUERIES.values():
+            query(database_url)
+    finally:
+        registry.explain = False
+    return registry.snapshot()
+
+
+def _print_profile(profile: dict[str, dict]) -> None:
+    """Print a timing table followed by each query's plan."""
+    print("\nQUERY PROFILE")
+    print(f"  {'query':<10} {'calls':>5} {'total ms':>9} {'rows':>5}")
+    for name, stats in profile.items():
+        print(f"  {name:<10} {stats['calls']:>5} "
+              f"{stats['total_seconds'] * 1000:>9.1f} "
+              f"{stats['last_rows']:>5}")
+    for name, stats in profile.items():
+        print(f"\n--- {name} (last statement) ---")
+        print(stats['plan'])
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    """Print all analysis results and per-query timings to the terminal.
+
+    Args:
+        argv: Command-line arguments (defaults to ``sys.argv[1:]``).
+            ``--profile`` additionally runs each question on its own
+            and prints its timing and ``EXPLAIN (ANALYZE, BUFFERS)``
+            plan.
+    """
+    parser = argparse.ArgumentParser(description='Grad Cafe analysis queries')
+    parser.add_argument(
+        '--profile', action='store_true',
+        help='time and EXPLAIN (ANALYZE, BUFFERS) every query',
+    )
+    args = parser.parse_args(argv)
+
+    timings: dict[str, float] = {}
+    results = run_all_queries(timings=timings)
     print("=" * 60)
     print("GRAD CAFE DATA ANALYSIS")
     print("=" * 60)
@@ -449,6 +744,13 @@ def main() -> None:
     print(f"\nCustom Q1: Top programs: {results['custom_1']}")
     print(f"\nCustom Q2: Acceptance by degree: {results['custom_2']}")
 
+    print("\nQuery timings (ms):")
+    for name, seconds in timings.items():
+        print(f"  {name:<10} {seconds * 1000:8.1f}")
+
+    if args.profile:
+        _print_profile(profile_queries())
+
     print("=" * 60)
     return results
 
@@ -16,7 +16,7 @@ import os
 import re
 import time
 import random
-from typing import Optional
+from typing import Callable, Iterator, Optional
 
 from urllib.request import urlopen, Request
 from urllib.parse import urlencode
@@ -28,15 +28,18 @@ from bs4 import BeautifulSoup
 # Main scraper function
 # ---------------------------------------------------------------------------
 
-def scrape_data(result_type: str = 'all',
+def fetch_pages(result_type: str = 'all',
                 num_pages: int = 500,
                 start_page: int = 1,
-                delay: float = 0.5) -> list[dict]:
-    """Scrape Grad Cafe list pages and return parsed entries.
+                delay: float = 0.5,
+                on_wait: Optional[Callable[[float], None]] = None,
+                ) -> Iterator[str]:
+    """Yield the raw HTML of successive Grad Cafe list pages.
 
-    Iterates through paginated result pages, extracting applicant
-    data from the HTML table.  Stops early when a page comes back
-    empty (no more data) or after 5 consecutive network errors.
+    This is the network half of ``scrape_data``: it knows nothing
+    about the page layout, so parsing can run elsewhere (for example
+    in a separate pipeline stage).  The consumer decides when the
+    results are exhausted and simply stops iterating.
 
     Args:
         result_type: Filter — ``'all'``, ``'accepted'``,
@@ -44,9 +47,13 @@ def scrape_data(result_type: str = 'all',
         num_pages: Maximum number of pages to request.
         start_page: Page number to begin from (1-indexed).
         delay: Base delay in seconds between requests.
+        on_wait: Optional callback told how many seconds the scraper
+            is about to sleep, before every politeness delay or
+            back-off after an error.
 
-    Returns:
-        A list of applicant dicts, one per entry found.
+    Yields:
+        One decoded HTML page per successful request.  Stops after a
+        404 or 5 consecutive network errors.
     """
     base_url = "https://www.thegradcafe.com/survey/index.php"
 
@@ -59,9 +66,13 @@ def scrape_data(result_type: str = 'all',
     }
     decision = decision_map.get(result_type.lower(), '')
 
-    all_data: list[dict] = []
     errors = 0  # consecutive-error counter
 
+    def _wait(seconds: float) -> None:
+        if on_wait is not None:
+            on_wait(seconds)
+        time.sleep(seconds)
+
     for page in range(start_page, start_page + num_pages):
         try:
             params: dict = {'page': page, 'sort': 'newest'}
@@ -76,30 +87,55 @@ def scrape_data(result_type: str = 'all',
             with urlopen(req, timeout=15) as resp:
                 html = resp.read().decode('utf-8', errors='ignore')
 
-            entries = extract_entries(html)
-            if not entries:
-                break  # empty page means we've exhausted all results
-
-            all_data.extend(entries)
-            errors = 0  # reset the error counter after a successful page
-
-            # Be polite: sleep between requests (with small random jitter)
-            time.sleep(delay + random.uniform(0, delay * 0.5))
-
         except HTTPError as exc:
             if exc.code == 404:
                 break  # no more pages exist
             errors += 1
             if errors >= 5:
                 break  # too many consecutive server errors
-            time.sleep(5)
+            _wait(5)
+            continue
 
         except (URLError, Exception):
             errors += 1
             if errors >= 5:
                 break
-            time.sleep(5)
+            _wait(5)
+            continue
 
+        errors = 0  # reset the error counter after a successful page
+        yield html
+
+        # Be polite: sleep between requests (with small random jitter)
+        _wait(delay + random.uniform(0, delay * 0.5))
+
+
+def scrape_data(result_type: str = 'all',
+                num_pages: int = 500,
+                start_page: int = 1,
+                delay: float = 0.5) -> list[dict]:
+    """Scrape Grad Cafe list pages and return parsed entries.
+
+    Iterates through paginated result pages, extracting applicant
+    data from the HTML table.  Stops early when a page comes back
+    empty (no more data) or after 5 consecutive network errors.
+
+    Args:
+        result_type: Filter — ``'all'``, ``'accepted'``,
+            ``'rejected'``, or ``'waitlisted'``.
+        num_pages: Maximum number of pages to request.
+        start_page: Page number to begin from (1-indexed).
+        delay: Base delay in seconds between requests.
+
+    Returns:
+        A list of applicant dicts, one per entry found.
+    """
+    all_data: list[dict] = []
+    for html in fetch_pages(result_type, num_pages, start_page, delay):
+        entries = extract_entries(html)
+        if not entries:
+            break  # empty page means we've exhausted all results
+        all_data.extend(entries)
     return all_data
 
 
@@ -0,0 +1,40 @@
+"""Production WSGI entry point.
+
+``python -m src.app`` runs Flask's single-process development server.
+For real traffic, serve ``src.wsgi:app`` with a multi-worker server,
+for example::
+
+    gunicorn -c gunicorn.conf.py src.wsgi:app
+
+Nothing the app relies on for correctness lives only in one worker's
+memory:
+
+* the pull lease, progress and cancellation are rows in
+  ``ingest_jobs`` (``src.jobs``);
+* the dataset version that invalidates cached results is the
+  ``dataset_version`` row (``cache.SharedVersionedCache``), so a pull
+  finished in one worker drops every worker's cached page;
+* progress events reach every worker through ``LISTEN``/``NOTIFY``;
+  each worker serves at most ``WEB_EVENT_STREAMS`` event streams,
+  which ``gunicorn.conf.py`` adds to its thread count;
+* connection pools are per process (``src.db``), even after a fork.
+
+What remains per worker is a cache of already-computed results and
+the ``/metrics`` counters, which describe the worker that answers.
+
+Author: Jie Xu
+Course: JHU Modern Software Concepts
+Date: February 2026
+"""
+
+from __future__ import annotations
+
+import os
+
+from src.app import create_app
+
+app = create_app({
+    'SHARED_STATE': True,
+    # Keep in step with the thread count in gunicorn.conf.py
+    'EVENTS_MAX_STREAMS': int(os.environ.get('WEB_EVENT_STREAMS', '4')),
+})
@@ -13,7 +13,8 @@ import pytest
 import psycopg2
 
 from src.app import create_app
-from src.load_data import CREATE_TABLE_SQL
+from src.clean import parse_program_university, parse_term, status_category
+from src.load_data import migrate
 
 # Local Postgres URL; overridden by env-var in CI.
 _BASE_URL = os.environ.get(
@@ -134,15 +135,18 @@ def db_url(_ensure_test_database):
     """Drop + recreate the applicants table so each test starts clean."""
     conn = psycopg2.connect(_BASE_URL)
     cur = conn.cursor()
-    cur.execute("DROP TABLE IF EXISTS applicants")
-    cur.execute(CREATE_TABLE_SQL)
+    cur.execute(
+        "DROP TABLE IF EXISTS applicants, schema_migrations, "
+        "applicant_summary, ingest_jobs, dataset_version, applicant_cube"
+    )
     conn.commit()
     cur.close()
     conn.close()
+    migrate(_BASE_URL)
     return _BASE_URL
 
 
-def _fake_scraper():
+def _fake_scraper(on_wait=None):
     """Return the canned SAMPLE_RECORDS (no network needed)."""
     return list(SAMPLE_RECORDS)
 
@@ -158,18 +162,23 @@ def _fake_loader(records, database_url):
                 (program, comments, url, status, term,
                  us_or_international, gpa, gre, gre_v, gre_aw,
                  degree, llm_generated_program,
-                 llm_generated_university)
-            VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)
+                 llm_generated_university,
+                 status_category, term_season, term_year, university)
+            VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)
             ON CONFLICT (url) DO NOTHING
             """,
             (
-                r.get('program'), r.get('comments'), r.get('url'),
+                parse_program_university(r.get('program'))[0],
+                r.get('comments'), r.get('url'),
                 r.get('status'), r.get('term'),
                 r.get('us_or_international'),
                 r.get('gpa'), r.get('gre'), r.get('gre_v'),
                 r.get('gre_aw'), r.get('degree'),
                 r.get('llm_generated_program'),
                 r.get('llm_generated_university'),
+                status_category(r.get('status')),
+                *parse_term(r.get('term')),
+                parse_program_university(r.get('program'))[1],
             ),
         )
     conn.commit()
@@ -51,7 +51,7 @@ def test_update_analysis_returns_200_when_idle(client):
 @pytest.mark.buttons
 def test_pull_data_returns_409_when_busy(app, client):
     """If a pull is already running, we should get 409 + busy=True."""
-    app.config['_busy'] = True
+    job_id = app.config['JOBS'].start()
     try:
         resp = client.post('/pull_data')
         assert resp.status_code == 409
@@ -59,20 +59,20 @@ def test_pull_data_returns_409_when_busy(app, client):
         assert body['busy'] is True
         assert body['ok'] is False
     finally:
-        app.config['_busy'] = False
+        app.config['JOBS'].finish(job_id, 'cancelled')
 
 
 @pytest.mark.buttons
 def test_update_analysis_returns_409_when_busy(app, client):
     """Same idea — update_analysis is also blocked while busy."""
-    app.config['_busy'] = True
+    job_id = app.config['JOBS'].start()
     try:
         resp = client.post('/update_analysis')
         assert resp.status_code == 409
         body = resp.get_json()
         assert body['busy'] is True
     finally:
-        app.config['_busy'] = False
+        app.config['JOBS'].finish(job_id, 'cancelled')
 
 
 # --- Status endpoint ---
@@ -87,10 +87,39 @@ def test_status_returns_not_running(client):
 
 @pytest.mark.buttons
 def test_status_returns_running_when_busy(app, client):
-    """If we manually set _busy, /status should report it."""
-    app.config['_busy'] = True
+    """While a job holds the lease, /status reports it with its counters."""
+    jobs = app.config['JOBS']
+    job_id = jobs.start()
     try:
-        resp = client.get('/status')
-        assert resp.get_json()['is_running'] is True
+        jobs.progress(job_id, {'pages': 3, 'fetched': 60, 'inserted': 40,
+                               'batches': 1})
+        body = client.get('/status').get_json()
+        assert body['is_running'] is True
+        assert body['job']['id'] == job_id
+        assert body['job']['pages'] == 3
+        assert body['job']['inserted'] == 40
+        assert body['job']['rows_per_sec'] >= 0
     finally:
-        app.config['_busy'] = False
+        jobs.finish(job_id, 'cancelled')
+
+
+@pytest.mark.buttons
+def test_status_reports_last_pull(db_url):
+    """After a pull, /status says how many records were fetched and new."""
+    from src.app import create_app
+    from tests.conftest import SAMPLE_RECORDS, _fake_scraper
+
+    app = create_app({
+        'DATABASE_URL': db_url,
+        'TESTING': True,
+        'SCRAPER_FUNC': _fake_scraper,
+        'LOADER_FUNC': lambda records, url: 4,
+    })
+    client = app.test_client()
+    assert client.get('/status').get_json()['last_pull'] is None
+
+    client.post('/pull_data')
+    last = client.get('/status').get_json()['last_pull']
+    assert last['fetched'] == len(SAMPLE_RECORDS)
+    assert last['inserted'] == 4
+    assert last['status'] == 'succeeded'
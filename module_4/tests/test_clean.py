@@ -13,9 +13,13 @@ import pytest
 from src.clean import (
     clean_data,
     parse_program_university,
+    split_program_university,
     standardize_gre,
     standardize_gpa,
     clean_status,
+    status_category,
+    parse_term,
+    TERM_SEASONS,
     parse_date,
     remove_html,
     save_cleaned_data,
@@ -109,6 +113,25 @@ def test_parse_none():
     assert parse_program_university(None) == (None, None)
 
 
+
+# --- split_program_university ---
+
+@pytest.mark.web
+@pytest.mark.parametrize('text, expected', [
+    ('Computer Science, University of Illinois at Urbana-Champaign',
+     ('Computer Science', 'University of Illinois at Urbana-Champaign')),
+    ('Data Science (MS), Stanford University',
+     ('Data Science (MS)', 'Stanford University')),
+    ('Physics, University of California, Berkeley',
+     ('Physics', 'University of California, Berkeley')),
+    ('Physics at MIT', ('Physics', 'MIT')),
+    ('Undeclared', ('Undeclared', None)),
+    (None, (None, None)),
+])
+def test_split_program_university(text, expected):
+    """Loader-format values split on the first ', ' before other formats."""
+    assert split_program_university(text) == expected
+
 # --- standardize_gre ---
 
 @pytest.mark.web
@@ -189,6 +212,27 @@ def test_clean_status_none():
     assert clean_status(None) is None
 
 
+# --- status_category / parse_term ---
+
+@pytest.mark.web
+def test_status_category_buckets():
+    assert status_category('Accepted via E-mail') == 'Accepted'
+    assert status_category('Wait listed') == 'Waitlisted'
+    assert status_category('Interview on 01/02') == 'Interview'
+    assert status_category('Other') == 'Other'
+    assert status_category('  ') is None
+    assert status_category(None) is None
+
+
+@pytest.mark.web
+def test_parse_term():
+    assert parse_term('Fall 2026') == (TERM_SEASONS['fall'], 2026)
+    assert parse_term('spring2025') == (TERM_SEASONS['spring'], 2025)
+    assert parse_term('2024') == (None, 2024)
+    assert parse_term('Fall') == (TERM_SEASONS['fall'], None)
+    assert parse_term(None) == (None, None)
+
+
 # --- parse_date ---
 
 @pytest.mark.web
@@ -0,0 +1,160 @@
+"""
+test_cohort.py - Tests for the parameterized analysis engine.
+
+Covers filter parsing, the prepared-statement cache (one PREPARE per
+connection and shape), answers from both the summary table and
+applicants, and the /api/cohort route.
+
+Author: Jie Xu
+"""
+
+import psycopg2
+import pytest
+
+from src import analysis, db, metrics
+from src.analysis import (
+    PreparedStatements, acceptance_rate, build_filters, cohort_stats,
+)
+from tests.conftest import SAMPLE_RECORDS, _fake_loader
+
+
+@pytest.fixture()
+def seeded(db_url):
+    """Test DB with SAMPLE_RECORDS loaded and a fresh statement cache."""
+    _fake_loader(SAMPLE_RECORDS, db_url)
+    db.close_all()
+    statements = PreparedStatements()
+    original, analysis.STATEMENTS = analysis.STATEMENTS, statements
+    yield db_url
+    analysis.STATEMENTS = original
+    db.close_all()
+
+
+# --- filters ---
+
+@pytest.mark.analysis
+def test_build_filters_parses_and_escapes():
+    """Terms split into season/year; LIKE wildcards are escaped."""
+    assert build_filters(term='Fall 2026') == {'term_season': 4,
+                                               'term_year': 2026}
+    assert build_filters(term='2025') == {'term_year': 2025}
+    assert build_filters(university='St_an%', degree='PhD',
+                         nationality='American', program='CS') == {
+        'degree': '%PhD%', 'nationality': 'American',
+        'university': 'st\\_an\\%%', 'program': '%CS%'}
+    assert build_filters() == {}
+
+
+@pytest.mark.analysis
+def test_build_filters_rejects_bad_term():
+    """A term with neither season nor year is an error."""
+    with pytest.raises(ValueError):
+        build_filters(term='someday')
+
+
+# --- answers ---
+
+@pytest.mark.db
+def test_cohort_stats_from_summary(seeded):
+    """Term/degree/nationality questions match the sample data."""
+    stats = cohort_stats(term='Fall 2025', database_url=seeded)
+    assert stats == {'applicants': 2, 'accepted': 1,
+                     'acceptance_rate': 50.0, 'avg_gpa': 3.55}
+    assert cohort_stats(degree='phd', nationality='American',
+                        database_url=seeded)['applicants'] == 2
+    assert cohort_stats(database_url=seeded)['applicants'] == 5
+
+
+@pytest.mark.db
+def test_cohort_stats_from_applicants(seeded):
+    """School and program filters read applicants and match Q7."""
+    from src.query_data import query_jhu_masters_cs
+
+    stats = cohort_stats(university='johns hopkins', degree='Master',
+                         program='computer science', database_url=seeded)
+    assert stats['applicants'] == query_jhu_masters_cs(seeded) == 1
+    assert acceptance_rate(term='Fall 2026', university='Stanford',
+                           database_url=seeded) == 100.0
+
+
+@pytest.mark.db
+def test_cohort_stats_empty_and_literal_wildcards(seeded):
+    """'%' is matched literally, and an empty cohort has no GPA."""
+    stats = cohort_stats(university='%', database_url=seeded)
+    assert stats == {'applicants': 0, 'accepted': 0,
+                     'acceptance_rate': 0.0, 'avg_gpa': None}
+
+
+# --- prepared statement cache ---
+
+@pytest.mark.db
+def test_statements_prepared_once_per_shape(seeded, monkeypatch):
+    """Repeats with new values reuse the prepared statement."""
+    monkeypatch.setenv('DB_POOL_MAX', '1')
+    db.close_all()
+    statements = analysis.STATEMENTS
+    for term in ('Fall 2025', 'Fall 2026', 'Spring 2024'):
+        cohort_stats(term=term, database_url=seeded)
+    assert (len(statements), statements.prepares,
+            statements.executions) == (1, 1, 3)
+
+    cohort_stats(term='Fall 2026', university='MIT', database_url=seeded)
+    assert (len(statements), statements.prepares) == (2, 2)
+
+    # A new connection prepares again; the SQL is not rebuilt
+    db.close_all()
+    cohort_stats(term='Fall 2026', database_url=seeded)
+    assert (len(statements), statements.prepares) == (2, 3)
+
+
+@pytest.mark.db
+def test_statement_is_a_server_side_prepare(seeded):
+    """The statement shows up in pg_prepared_statements on its connection."""
+    with db.connection(seeded) as conn, conn.cursor() as cur:
+        analysis.STATEMENTS.execute(
+            cur, 'probe', 'probe', lambda: ('SELECT $1::int + 1', ['int']),
+            [41])
+        assert cur.fetchone() == (42,)
+        cur.execute("SELECT statement FROM pg_prepared_statements")
+        assert any('SELECT $1::int + 1' in row[0] for row in cur.fetchall())
+
+
+@pytest.mark.db
+def test_cohort_stats_records_metrics(seeded):
+    """Executions are timed under 'cohort_stats' like other queries."""
+    metrics.REGISTRY.reset()
+    cohort_stats(degree='PhD', database_url=seeded)
+    assert metrics.REGISTRY.snapshot()['cohort_stats']['calls'] == 1
+    metrics.REGISTRY.reset()
+
+
+# --- route ---
+
+@pytest.mark.web
+def test_api_cohort_route(seeded_client):
+    """/api/cohort echoes its filters and answers the question."""
+    resp = seeded_client.get('/api/cohort?term=Fall+2026&degree=PhD&x=1')
+    assert resp.status_code == 200
+    body = resp.get_json()
+    assert body['filters'] == {'term': 'Fall 2026', 'degree': 'PhD'}
+    assert (body['applicants'], body['acceptance_rate']) == (2, 100.0)
+
+
+@pytest.mark.web
+def test_api_cohort_bad_term(client):
+    """An unparseable term is a 400, not a server error."""
+    resp = client.get('/api/cohort?term=whenever')
+    assert resp.status_code == 400
+    assert 'whenever' in resp.get_json()['error']
+
+
+@pytest.mark.web
+def test_api_cohort_database_unavailable(client, monkeypatch):
+    """A database outage is a 503, like /api/analysis and /api/cube."""
+    def _down(url=None):
+        raise psycopg2.OperationalError('down')
+
+    monkeypatch.setattr(db, 'get_pool', _down)
+    resp = client.get('/api/cohort?degree=PhD')
+    assert resp.status_code == 503
+    assert resp.get_json()['error'] == 'database unavailable'
@@ -0,0 +1,228 @@
+"""
+test_cube.py - Tests for the precomputed admissions cohort cube.
+
+Covers the cube table (built by the migration, rebuilt after loads),
+slices and breakdowns against the sample data, input validation and
+the /api/cube route.
+
+Author: Jie Xu
+"""
+
+import itertools
+
+import psycopg2
+import pytest
+
+from src import metrics
+from src.cube import DIMENSIONS, Cube, load_cube
+from src.load_data import refresh_cube
+from tests.conftest import SAMPLE_RECORDS, _fake_loader
+
+NO_TERM = {
+    'url': 'https://gradcafe.com/result/1006',
+    'program': 'Chemistry, Yale University',
+    'status': None,
+    'term': None,
+    'degree': 'PhD',
+    'gpa': None,
+    'us_or_international': 'American',
+    'llm_generated_program': 'Chemistry',
+    'llm_generated_university': None,
+}
+
+
+@pytest.fixture()
+def cube(db_url):
+    """The cube over SAMPLE_RECORDS."""
+    _fake_loader(SAMPLE_RECORDS, db_url)
+    refresh_cube(db_url)
+    return load_cube(db_url)
+
+
+# --- building ---
+
+@pytest.mark.db
+def test_migration_builds_cube_from_existing_rows(db_url):
+    """An empty database has a zero grand total; refresh_cube fills it."""
+    empty = load_cube(db_url)
+    assert len(empty) == 1
+    assert empty.slice() == {'applicants': 0, 'accepted': 0,
+                             'acceptance_rate': 0.0, 'avg_gpa': None}
+    _fake_loader(SAMPLE_RECORDS, db_url)
+    cells = refresh_cube(db_url)
+    assert cells == len(load_cube(db_url)) > 0
+
+
+@pytest.mark.db
+def test_every_grouping_set_adds_up(cube):
+    """Each grouping set partitions all five applicants."""
+    for size in range(len(DIMENSIONS) + 1):
+        for by in itertools.combinations(DIMENSIONS, size):
+            cells = cube.breakdown(list(by))
+            assert sum(c['applicants'] for c in cells) == 5
+            assert sum(c['accepted'] for c in cells) == 4
+
+
+@pytest.mark.db
+def test_cube_stale_until_refreshed(cube, db_url):
+    """The cube only changes when it is rebuilt."""
+    _fake_loader([NO_TERM], db_url)
+    assert load_cube(db_url).slice()['applicants'] == 5
+    refresh_cube(db_url)
+    assert load_cube(db_url).slice()['applicants'] == 6
+
+
+@pytest.mark.db
+def test_load_data_main_refreshes_cube(monkeypatch, db_url):
+    """Loading the JSON file also rebuilds the cube."""
+    from src import load_data
+
+    monkeypatch.setattr(load_data, 'load_json_data',
+                        lambda p: list(SAMPLE_RECORDS))
+    monkeypatch.setattr(load_data, 'get_database_url', lambda: db_url)
+    load_data.main()
+    assert load_cube(db_url).slice()['applicants'] == 5
+
+
+# --- slices ---
+
+@pytest.mark.db
+def test_slice_answers(cube, db_url):
+    """Cells match the sample data and analysis.cohort_stats."""
+    from src.analysis import cohort_stats
+
+    assert cube.slice() == {'applicants': 5, 'accepted': 4,
+                            'acceptance_rate': 80.0, 'avg_gpa': 3.71}
+    assert cube.slice(term='Fall 2025') == cohort_stats(
+        term='Fall 2025', database_url=db_url)
+    assert cube.slice(term='fall 2026', degree='phd',
+                      nationality='International',
+                      university='Stanford University',
+                      status='accepted') == {
+        'applicants': 1, 'accepted': 1,
+        'acceptance_rate': 100.0, 'avg_gpa': 3.8}
+    assert cube.slice(university='Nowhere', degree=None) == {
+        'applicants': 0, 'accepted': 0,
+        'acceptance_rate': 0.0, 'avg_gpa': None}
+
+
+@pytest.mark.db
+def test_breakdown_matches_acceptance_by_degree(cube, db_url):
+    """breakdown(['degree']) agrees with custom question 2."""
+    from src.query_data import query_acceptance_by_degree
+
+    expected = [(degree, total, accepted, float(rate))
+                for degree, total, accepted, rate
+                in query_acceptance_by_degree(db_url)]
+    assert [(c['degree'], c['applicants'], c['accepted'],
+             c['acceptance_rate'])
+            for c in cube.breakdown(['degree'])] == expected
+
+
+@pytest.mark.db
+def test_breakdown_within_slice(cube):
+    """Grouping is restricted to the filtered cells, largest first."""
+    cells = cube.breakdown(['university'], degree='PhD')
+    assert cells[0] == {'university': 'Stanford University',
+                        'applicants': 2, 'accepted': 2,
+                        'acceptance_rate': 100.0, 'avg_gpa': 3.7}
+    assert {c['university'] for c in cells} == {
+        'Stanford University', 'Massachusetts Institute of Technology',
+        'Harvard University'}
+    assert cube.breakdown(['term', 'nationality'], status='Rejected') == [
+        {'term': 'Fall 2025', 'nationality': 'American', 'applicants': 1,
+         'accepted': 0, 'acceptance_rate': 0.0, 'avg_gpa': 3.5}]
+
+
+@pytest.mark.db
+def test_unknown_values_are_their_own_group(cube, db_url):
+    """Missing terms, statuses and GPAs group under None."""
+    _fake_loader([NO_TERM], db_url)
+    refresh_cube(db_url)
+    cells = load_cube(db_url).breakdown(['term', 'status'],
+                                        university='Yale University')
+    assert cells == [{'term': None, 'status': None, 'applicants': 1,
+                      'accepted': 0, 'acceptance_rate': 0.0,
+                      'avg_gpa': None}]
+
+
+@pytest.mark.db
+def test_case_variants_share_a_cell(cube, db_url):
+    """'PhD' and 'phd' rows are counted together, not overwritten."""
+    phd = cube.slice(degree='PhD')['applicants']
+    variant = dict(NO_TERM, url='https://gradcafe.com/result/1007',
+                   degree='phd', llm_generated_university='yale university')
+    _fake_loader([NO_TERM, variant], db_url)
+    refresh_cube(db_url)
+    merged = load_cube(db_url)
+    assert merged.slice(degree='PhD')['applicants'] == phd + 2
+    assert merged.slice(university='Yale University',
+                        degree='phd')['applicants'] == 2
+    degrees = merged.breakdown(['degree'])
+    assert [c['applicants'] for c in degrees if c['degree'].casefold()
+            == 'phd'] == [phd + 2]
+    assert sum(c['applicants'] for c in degrees) == 7
+
+
+@pytest.mark.analysis
+def test_term_labels():
+    """Partial terms are labelled with whatever part is known."""
+    rows = [(0b01111, 2026, None, None, None, None, None, 1, 0, 0.0, 0),
+            (0b01111, None, 2, None, None, None, None, 1, 0, 0.0, 0)]
+    terms = {c['term'] for c in Cube(rows).breakdown(['term'])}
+    assert terms == {'2026', 'Spring'}
+
+
+@pytest.mark.analysis
+@pytest.mark.parametrize('call', [
+    lambda c: c.slice(color='red'),
+    lambda c: c.slice(term='2026'),
+    lambda c: c.breakdown(['color']),
+    lambda c: c.breakdown(['degree'], degree='PhD'),
+])
+def test_invalid_questions(call):
+    """Unknown dimensions, year-only terms and overlaps are rejected."""
+    with pytest.raises(ValueError):
+        call(Cube([]))
+
+
+# --- route ---
+
+@pytest.mark.web
+def test_api_cube_slice_and_breakdown(seeded_client):
+    """A pull rebuilds the cube; /api/cube serves slices and groups."""
+    resp = seeded_client.get('/api/cube?term=Fall+2026&degree=PhD&x=1')
+    assert resp.status_code == 200
+    body = resp.get_json()
+    assert body['filters'] == {'term': 'Fall 2026', 'degree': 'PhD'}
+    assert (body['applicants'], body['acceptance_rate']) == (2, 100.0)
+
+    body = seeded_client.get('/api/cube?by=nationality,+term').get_json()
+    assert body['by'] == ['nationality', 'term']
+    assert len(body['cells']) == 4
+
+
+@pytest.mark.web
+def test_api_cube_reads_table_once_per_version(seeded_client):
+    """Slices are served from memory until the data changes."""
+    metrics.REGISTRY.reset()
+    for degree in ('PhD', 'Masters', 'PhD'):
+        seeded_client.get(f'/api/cube?degree={degree}')
+    assert metrics.REGISTRY.snapshot()['cube']['calls'] == 1
+    seeded_client.post('/update_analysis')
+    seeded_client.get('/api/cube')
+    assert metrics.REGISTRY.snapshot()['cube']['calls'] == 2
+    metrics.REGISTRY.reset()
+
+
+@pytest.mark.web
+def test_api_cube_errors(client, monkeypatch):
+    """Bad questions are 400s; an unreachable database is a 503."""
+    def _down(url):
+        raise psycopg2.OperationalError('down')
+
+    with monkeypatch.context() as patch:
+        patch.setattr('src.app.load_cube', _down)
+        assert client.get('/api/cube').status_code == 503
+    assert client.get('/api/cube?term=someday').status_code == 400
+    assert client.get('/api/cube?by=color').status_code == 400
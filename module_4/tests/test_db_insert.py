@@ -137,13 +137,44 @@ def test_convert_international_status():
 
 @pytest.mark.db
 def test_prepare_row():
-    """The returned tuple should have 14 elements (one per column)."""
-    from src.load_data import prepare_row
+    """The returned tuple should have one element per insert column."""
+    from src.load_data import INSERT_COLUMNS, prepare_row
     row = prepare_row(SAMPLE_RECORDS[0])
     assert isinstance(row, tuple)
-    assert len(row) == 14
+    assert len(row) == len(INSERT_COLUMNS)
+    derived = dict(zip(INSERT_COLUMNS, row))
+    assert derived['status_category'] == 'Accepted'
+    assert (derived['term_season'], derived['term_year']) == (4, 2026)
+    assert derived['program'] == 'Computer Science'
+    assert derived['university'] == 'Massachusetts Institute of Technology'
+
+
+@pytest.mark.db
+def test_prepare_row_keeps_explicit_university():
+    """Scraper dicts already carry university separately; nothing is glued."""
+    from src.load_data import INSERT_COLUMNS, prepare_row
+    row = dict(zip(INSERT_COLUMNS, prepare_row(
+        {'program': 'Computer Science', 'university': 'Smith College'}
+    )))
+    assert row['program'] == 'Computer Science'
+    assert row['university'] == 'Smith College'
 
 
+@pytest.mark.db
+@pytest.mark.parametrize('combined, program, university', [
+    ('Computer Science, University of Illinois at Urbana-Champaign',
+     'Computer Science', 'University of Illinois at Urbana-Champaign'),
+    ('Economics, University of Texas at Austin',
+     'Economics', 'University of Texas at Austin'),
+    ('Data Science (MS), Stanford University',
+     'Data Science (MS)', 'Stanford University'),
+])
+def test_prepare_row_splits_on_first_comma(combined, program, university):
+    """School names with ' at ' and programs with parentheses stay whole."""
+    from src.load_data import INSERT_COLUMNS, prepare_row
+    row = dict(zip(INSERT_COLUMNS, prepare_row({'program': combined})))
+    assert (row['program'], row['university']) == (program, university)
+
 @pytest.mark.db
 def test_prepare_row_no_us_field():
     """When us_or_international is absent, fall back to the 'international' flag."""
@@ -164,6 +195,140 @@ def test_insert_records(db_url):
     assert count == len(SAMPLE_RECORDS)
 
 
+@pytest.mark.db
+@pytest.mark.parametrize('method', ['values', 'copy'])
+def test_load_records_reports_inserted_and_skipped(db_url, method):
+    """A second load of the same data inserts nothing and skips everything."""
+    from src.load_data import load_records
+    first = load_records(SAMPLE_RECORDS, db_url, method=method)
+    assert first['inserted'] == len(SAMPLE_RECORDS)
+    assert first['skipped'] == 0
+
+    second = load_records(SAMPLE_RECORDS, db_url, method=method)
+    assert second['inserted'] == 0
+    assert second['skipped'] == len(SAMPLE_RECORDS)
+
+
+@pytest.mark.db
+def test_load_records_per_batch_stats(db_url):
+    """Each batch reports its own counts and timing."""
+    from src.load_data import load_records
+    load_records(SAMPLE_RECORDS[:2], db_url)
+    stats = load_records(SAMPLE_RECORDS, db_url, batch_size=2)
+
+    assert [b['total'] for b in stats['batches']] == [2, 2, 1]
+    assert [b['inserted'] for b in stats['batches']] == [0, 2, 1]
+    assert all(b['seconds'] >= 0 for b in stats['batches'])
+    assert stats['total'] == 5 and stats['inserted'] == 3
+    assert stats['skipped'] == 2
+
+
+@pytest.mark.db
+@pytest.mark.parametrize('method', ['values', 'copy'])
+def test_load_records_accepts_generator(db_url, method):
+    """Any iterable works, split into batches (COPY reuses its staging table)."""
+    from src.load_data import load_records
+    stats = load_records(
+        (dict(r) for r in SAMPLE_RECORDS), db_url,
+        method=method, batch_size=2,
+    )
+    assert [b['total'] for b in stats['batches']] == [2, 2, 1]
+    assert stats['inserted'] == len(SAMPLE_RECORDS)
+    assert stats['rows_per_sec'] >= 0
+    assert all('rows_per_sec' in b for b in stats['batches'])
+
+
+@pytest.mark.db
+def test_iter_row_batches_is_lazy():
+    """Records are pulled from the source only as each batch is built."""
+    from src.load_data import iter_row_batches
+    pulled = []
+
+    def source():
+        for r in SAMPLE_RECORDS:
+            pulled.append(r['url'])
+            yield r
+
+    batches = iter_row_batches(source(), 2)
+    first = next(batches)
+    assert len(first) == 2 and len(pulled) == 2
+    assert [len(b) for b in batches] == [2, 1]
+
+
+@pytest.mark.db
+def test_load_records_rejects_bad_batch_size(db_url):
+    """batch_size must be a positive integer."""
+    from src.load_data import load_records
+    with pytest.raises(ValueError):
+        load_records(SAMPLE_RECORDS, db_url, batch_size=0)
+
+
+@pytest.mark.db
+def test_load_records_empty_input(db_url):
+    """Nothing to load reports zeros instead of dividing by zero."""
+    from src.load_data import load_records
+    stats = load_records(iter([]), db_url)
+    assert stats['total'] == 0 and stats['batches'] == []
+    assert stats['rows_per_sec'] == 0.0
+
+
+@pytest.mark.db
+def test_insert_records_copy(db_url):
+    """The COPY path should load every row and stay idempotent."""
+    from src.load_data import insert_records
+    insert_records(SAMPLE_RECORDS, db_url, method='copy')
+    insert_records(SAMPLE_RECORDS, db_url, method='copy')
+
+    conn = psycopg2.connect(db_url)
+    cur = conn.cursor()
+    cur.execute("SELECT COUNT(*) FROM applicants")
+    assert cur.fetchone()[0] == len(SAMPLE_RECORDS)
+    cur.close()
+    conn.close()
+
+
+@pytest.mark.db
+def test_insert_records_copy_round_trips_values(db_url):
+    """NULLs, empty strings, quotes, commas and newlines survive COPY."""
+    from src.load_data import insert_records
+    entry = {
+        'url': 'https://gradcafe.com/result/2001',
+        'program': 'CS, "Data" Track',
+        'university': 'MIT',
+        'comments': 'line one,\nline "two"',
+        'status': '',
+        'gpa': 3.9,
+        'gre': None,
+    }
+    insert_records([entry], db_url, method='copy')
+
+    conn = psycopg2.connect(db_url)
+    cur = conn.cursor()
+    cur.execute("SELECT program, comments, status, gpa, gre FROM applicants")
+    row = cur.fetchone()
+    cur.close()
+    conn.close()
+    assert row == ('CS, "Data" Track', 'line one,\nline "two"', '', 3.9, None)
+
+
+@pytest.mark.db
+def test_insert_records_unknown_method(db_url):
+    """An unsupported load method is rejected before touching the DB."""
+    from src.load_data import insert_records
+    with pytest.raises(ValueError):
+        insert_records(SAMPLE_RECORDS, db_url, method='bogus')
+
+
+@pytest.mark.db
+def test_copy_stream_read_all():
+    """read() with no size drains every remaining line at once."""
+    from src.load_data import _CopyStream
+    stream = _CopyStream([('a', None, 1.5), ('b', 'x', None)])
+    assert stream.read(3) == '"a"'
+    assert stream.read() == ',,1.5\n"b","x",\n'
+    assert stream.read(10) == ''
+
+
 @pytest.mark.db
 def test_create_table(db_url):
     """Calling create_table twice shouldn't raise (IF NOT EXISTS)."""
@@ -243,6 +408,87 @@ def test_query_data_run_all(client, db_url):
         assert key in r
 
 
+@pytest.mark.db
+def test_query_data_run_all_matches_individual_queries(client, db_url):
+    """The consolidated queries agree with the one-question functions."""
+    client.post('/pull_data')
+    from src import query_data as qd
+    r = qd.run_all_queries(db_url)
+    assert r == {
+        'q1': qd.query_fall_2026_count(db_url),
+        'q2': qd.query_international_percentage(db_url),
+        'q3': qd.query_average_scores(db_url),
+        'q4': qd.query_american_fall_2026_gpa(db_url),
+        'q5': qd.query_fall_2025_acceptance_rate(db_url),
+        'q6': qd.query_fall_2026_acceptance_gpa(db_url),
+        'q7': qd.query_jhu_masters_cs(db_url),
+        'q8': qd.query_top_schools_phd_cs(db_url),
+        'q9': qd.query_top_schools_phd_cs_llm(db_url),
+        'custom_1': qd.query_top_programs(db_url),
+        'custom_2': qd.query_acceptance_by_degree(db_url),
+    }
+    assert r['q1'] > 0 and r['q7'] > 0
+
+
+@pytest.mark.db
+def test_query_data_run_all_sequential_matches_concurrent(client, db_url):
+    """One connection or a thread pool, the answers are the same."""
+    client.post('/pull_data')
+    from src.query_data import run_all_queries
+    seq_timings, par_timings = {}, {}
+    seq = run_all_queries(db_url, max_workers=1, timings=seq_timings)
+    par = run_all_queries(db_url, max_workers=3, timings=par_timings)
+    assert seq == par
+    assert set(seq_timings) == {'scalars', 'custom_1', 'custom_2', 'total'}
+    assert set(par_timings) == {
+        'summary', 'q7', 'q8', 'q9', 'custom_1', 'custom_2', 'total',
+    }
+    assert all(t >= 0 for t in par_timings.values())
+
+
+@pytest.mark.db
+def test_run_queries_runs_concurrently(db_url):
+    """Independent queries overlap: wall time is near the slowest one."""
+    import time
+    from src.query_data import run_queries
+
+    sleepy = {f's{i}': 'SELECT pg_sleep(0.3) AS slept' for i in range(3)}
+    started = time.perf_counter()
+    results, timings = run_queries(sleepy, db_url, max_workers=3)
+    elapsed = time.perf_counter() - started
+    assert set(results) == set(sleepy)
+    assert results['s0'][0] == ['slept']
+    assert min(timings.values()) >= 0.3
+    assert elapsed < 0.8
+
+
+@pytest.mark.db
+def test_run_queries_propagates_errors(db_url):
+    """A failing query surfaces from the runner."""
+    from src.query_data import run_queries
+    with pytest.raises(psycopg2.Error):
+        run_queries({'bad': 'SELECT * FROM no_such_table'}, db_url, 2)
+
+
+@pytest.mark.db
+def test_query_data_run_all_empty_table(db_url):
+    """On an empty table counts are 0 and percentages do not divide by 0."""
+    from src.query_data import run_all_queries
+    r = run_all_queries(db_url)
+    assert r['q1'] == 0
+    assert r['q2']['percentage'] == 0.00
+    assert r['q5']['percentage'] == 0.00
+    assert r['q3']['avg_gpa'] is None
+
+
+@pytest.mark.db
+def test_analysis_uses_three_round_trips(client, db_url, monkeypatch):
+    """The dashboard issues one scalar query plus the two row-set queries."""
+    client.post('/pull_data')
+    from tests.test_schema import _dashboard_sql
+    assert len(_dashboard_sql(db_url, monkeypatch)) == 3
+
+
 @pytest.mark.db
 def test_query_data_individual_functions(client, db_url):
     """Smoke test: every single query function runs and returns something."""
@@ -261,6 +507,46 @@ def test_query_data_individual_functions(client, db_url):
     assert isinstance(qd.query_acceptance_by_degree(db_url), list)
 
 
+@pytest.mark.db
+def test_q9_matches_llm_university_substrings(db_url):
+    """Q9 matches the LLM university by substring, as it always has."""
+    from src import query_data as qd
+    from tests.conftest import _fake_loader
+
+    _fake_loader(SAMPLE_RECORDS, db_url)
+    before = qd.query_top_schools_phd_cs_llm(db_url)
+    _fake_loader([dict(SAMPLE_RECORDS[1],
+                       url='https://gradcafe.com/result/2001',
+                       llm_generated_university='Stanford University, '
+                                                'School of Engineering')],
+                 db_url)
+    assert qd.query_top_schools_phd_cs_llm(db_url) == before + 1
+
+@pytest.mark.db
+def test_acceptance_by_degree_skips_blank_degrees(db_url):
+    """Blank degrees, once their own group, are now left out like NULLs."""
+    from src import query_data as qd
+    from tests.conftest import _fake_loader
+
+    blank = dict(SAMPLE_RECORDS[0], url='https://gradcafe.com/result/2002',
+                 degree='')
+    missing = dict(SAMPLE_RECORDS[0], url='https://gradcafe.com/result/2003',
+                   degree=None)
+    _fake_loader(list(SAMPLE_RECORDS) + [blank, missing], db_url)
+
+    # The original query over ``applicants`` kept '' as a group
+    conn = psycopg2.connect(db_url)
+    cur = conn.cursor()
+    cur.execute("SELECT degree, COUNT(*) FROM applicants "
+                "WHERE degree IS NOT NULL GROUP BY degree")
+    old = dict(cur.fetchall())
+    cur.close()
+    conn.close()
+    new = {degree: total
+           for degree, total, _, _ in qd.query_acceptance_by_degree(db_url)}
+    assert old.pop('') == 1
+    assert new == old
+
 @pytest.mark.db
 def test_query_data_get_database_url(monkeypatch):
     """query_data.get_database_url reads from environment."""
@@ -286,17 +572,11 @@ def test_query_data_main(monkeypatch, db_url, capsys):
 
     # Seed data first
     from src.load_data import create_table
-    conn = psycopg2.connect(db_url)
-    cur = conn.cursor()
-    cur.execute("DROP TABLE IF EXISTS applicants")
-    from src.load_data import CREATE_TABLE_SQL
-    cur.execute(CREATE_TABLE_SQL)
-    conn.commit()
-    cur.close()
-    conn.close()
+    create_table(db_url)
     _fake_loader(_fake_scraper(), db_url)
 
     monkeypatch.setattr(qd, 'get_database_url', lambda: db_url)
-    qd.main()
+    qd.main([])
     out = capsys.readouterr().out
     assert 'GRAD CAFE DATA ANALYSIS' in out
+    assert 'Query timings (ms):' in out
@@ -0,0 +1,158 @@
+"""
+test_db_pool.py - Tests for the shared connection pool (src.db).
+
+Checks commit/rollback behavior, connection reuse, and that broken
+or stale connections are replaced instead of handed back out.
+
+Author: Jie Xu
+"""
+
+import pytest
+import psycopg2
+
+from src import db
+
+
+@pytest.fixture()
+def fresh_pools():
+    """Start and finish each test with no pools open."""
+    db.close_all()
+    yield
+    db.close_all()
+
+
+@pytest.mark.db
+def test_get_database_url_default(monkeypatch):
+    """db.get_database_url falls back to the local default."""
+    monkeypatch.delenv('DATABASE_URL', raising=False)
+    assert 'postgresql' in db.get_database_url()
+
+
+@pytest.mark.db
+def test_env_int_ignores_bad_values(monkeypatch):
+    """Non-numeric pool settings fall back to the default."""
+    monkeypatch.setenv('DB_POOL_MAX', 'lots')
+    assert db._env_int('DB_POOL_MAX', 10) == 10
+
+
+@pytest.mark.db
+def test_connection_commits_on_success(db_url, fresh_pools):
+    """Work done inside the block is committed on exit."""
+    with db.connection(db_url) as conn:
+        with conn.cursor() as cur:
+            cur.execute("INSERT INTO applicants (url) VALUES ('pool-1')")
+
+    conn = psycopg2.connect(db_url)
+    cur = conn.cursor()
+    cur.execute("SELECT COUNT(*) FROM applicants WHERE url = 'pool-1'")
+    assert cur.fetchone()[0] == 1
+    cur.close()
+    conn.close()
+
+
+@pytest.mark.db
+def test_connection_rolls_back_on_error(db_url, fresh_pools):
+    """An exception inside the block rolls the transaction back."""
+    with pytest.raises(RuntimeError):
+        with db.connection(db_url) as conn:
+            with conn.cursor() as cur:
+                cur.execute("INSERT INTO applicants (url) VALUES ('pool-2')")
+            raise RuntimeError('boom')
+
+    with db.connection(db_url) as conn:
+        with conn.cursor() as cur:
+            cur.execute("SELECT COUNT(*) FROM applicants")
+            assert cur.fetchone()[0] == 0
+
+
+@pytest.mark.db
+def test_connection_is_reused(db_url, fresh_pools):
+    """Sequential checkouts get the same underlying connection."""
+    with db.connection(db_url) as first:
+        pass
+    with db.connection(db_url) as second:
+        pass
+    assert first is second
+
+
+@pytest.mark.db
+def test_closed_connection_is_replaced(db_url, fresh_pools):
+    """A connection closed while checked out is discarded, not reused."""
+    with pytest.raises(psycopg2.InterfaceError):
+        with db.connection(db_url) as first:
+            first.close()
+    with db.connection(db_url) as second:
+        assert not second.closed
+    assert first is not second
+
+
+@pytest.mark.db
+def test_close_inside_block_with_error(db_url, fresh_pools):
+    """Rollback is skipped when the connection is already closed."""
+    with pytest.raises(RuntimeError):
+        with db.connection(db_url) as conn:
+            conn.close()
+            raise RuntimeError('boom')
+
+
+@pytest.mark.db
+def test_stale_connection_is_pinged_and_replaced(db_url, fresh_pools, monkeypatch):
+    """Idle connections are pinged; ones the server killed are dropped."""
+    monkeypatch.setenv('DB_POOL_PING_AFTER', '0')
+    with db.connection(db_url) as first:
+        with first.cursor() as cur:
+            cur.execute("SELECT pg_backend_pid()")
+            pid = cur.fetchone()[0]
+
+    # Still alive: the ping succeeds and the same connection comes back
+    with db.connection(db_url) as again:
+        assert again is first
+
+    admin = psycopg2.connect(db_url)
+    admin.autocommit = True
+    with admin.cursor() as cur:
+        cur.execute("SELECT pg_terminate_backend(%s)", (pid,))
+    admin.close()
+
+    with db.connection(db_url) as second:
+        assert second is not first
+        with second.cursor() as cur:
+            cur.execute("SELECT 1")
+
+
+@pytest.mark.db
+def test_checkout_gives_up_without_healthy_connection(db_url, fresh_pools, monkeypatch):
+    """If every connection fails the health check, checkout raises."""
+    monkeypatch.setattr(db, '_is_healthy', lambda entry, conn: False)
+    with pytest.raises(psycopg2.OperationalError):
+        with db.connection(db_url):
+            pass  # pragma: no cover
+
+
+@pytest.mark.db
+def test_connection_in_transaction_is_unhealthy(db_url, fresh_pools):
+    """A connection with an open transaction fails the health check."""
+    entry = db.get_pool(db_url)
+    conn = entry.pool.getconn()
+    with conn.cursor() as cur:
+        cur.execute("SELECT 1")
+    assert db._is_healthy(entry, conn) is False
+    conn.rollback()
+    assert db._is_healthy(entry, conn) is True
+    conn.close()
+    assert db._is_healthy(entry, conn) is False
+    entry.pool.putconn(conn, close=True)
+
+
+@pytest.mark.db
+def test_forked_process_gets_its_own_pool(db_url, fresh_pools, monkeypatch):
+    """A new pid builds a fresh pool and never closes the parent's."""
+    parent = db.get_pool(db_url)
+    monkeypatch.setattr(db.os, 'getpid', lambda: -1)
+    child = db.get_pool(db_url)
+    assert child is not parent
+
+    db.close_all()
+    assert not parent.pool.closed
+    monkeypatch.undo()
+    assert db.get_pool(db_url) is parent
@@ -0,0 +1,233 @@
+"""
+test_events.py - Tests for pull-job events (NOTIFY + Server-Sent Events).
+
+Covers JobManager.watch() on its own, the per-process LISTEN
+connection it shares, the /pull_data/events stream and its limit,
+and rate-limit waits reported by the scraper reaching the job row.
+
+Author: Jie Xu
+"""
+
+import json
+import threading
+import time
+
+import psycopg2
+import pytest
+
+from src import jobs as jobs_module
+from src.app import create_app
+from src.jobs import JobManager, get_listener
+from tests.conftest import SAMPLE_RECORDS, _fake_loader
+
+COUNTERS = {'pages': 1, 'fetched': 20, 'inserted': 15, 'batches': 1,
+            'waits': 2, 'wait_seconds': 1.5}
+
+
+def _events(body):
+    """Parse an SSE body into a list of (event, data) pairs."""
+    parsed = []
+    for block in body.split('\n\n'):
+        fields = dict(line.split(': ', 1) for line in block.splitlines()
+                      if line and not line.startswith(':'))
+        if 'event' in fields:
+            parsed.append((fields['event'], json.loads(fields['data'])))
+    return parsed
+
+
+# --- JobManager.watch ---
+
+@pytest.mark.db
+def test_watch_yields_job_changes(db_url):
+    """Snapshot first, then keepalives, progress and done events."""
+    jobs = JobManager(db_url)
+    watcher = jobs.watch(keepalive_seconds=0.05)
+    try:
+        assert next(watcher) == ('snapshot', None)
+        assert next(watcher) == ('keepalive', None)
+
+        job_id = jobs.start()
+        kind, job = next(watcher)
+        assert (kind, job['id'], job['status']) == ('progress', job_id,
+                                                     'running')
+
+        jobs.progress(job_id, COUNTERS)
+        kind, job = next(watcher)
+        assert kind == 'progress'
+        assert job['waits'] == 2
+        assert job['inserted'] == 15
+        assert job['rows_per_sec'] >= 0
+
+        jobs.finish(job_id, 'succeeded', COUNTERS)
+        kind, job = next(watcher)
+        assert (kind, job['status']) == ('done', 'succeeded')
+    finally:
+        watcher.close()
+
+
+@pytest.mark.db
+def test_watch_snapshot_is_latest_job(db_url):
+    """A new subscriber learns about the most recent job right away."""
+    jobs = JobManager(db_url)
+    job_id = jobs.start()
+    jobs.finish(job_id, 'failed', error='boom')
+    watcher = jobs.watch()
+    try:
+        kind, job = next(watcher)
+        assert kind == 'snapshot'
+        assert (job['id'], job['error']) == (job_id, 'boom')
+    finally:
+        watcher.close()
+
+
+# --- shared LISTEN connection ---
+
+def _wait_for(condition, timeout=5.0):
+    """Poll *condition* until it holds or *timeout* passes."""
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+@pytest.mark.db
+def test_watchers_share_one_listen_connection(db_url, monkeypatch):
+    """Every watch in a process reads one connection, closed when idle."""
+    opened = []
+    connect = psycopg2.connect
+    monkeypatch.setattr(jobs_module.psycopg2, 'connect',
+                        lambda url: opened.append(url) or connect(url))
+    listener = get_listener(db_url)
+    assert _wait_for(lambda: listener._conn is None)
+    monkeypatch.setattr(listener, 'poll_seconds', 0.02)
+
+    jobs = JobManager(db_url)
+    watchers = [jobs.watch(keepalive_seconds=0.05) for _ in range(3)]
+    try:
+        for watcher in watchers:
+            assert next(watcher) == ('snapshot', None)
+        job_id = jobs.start()
+        for watcher in watchers:
+            assert next(watcher)[1]['id'] == job_id
+        assert len(opened) == 1
+    finally:
+        for watcher in watchers:
+            watcher.close()
+    assert _wait_for(lambda: listener._conn is None)
+
+
+@pytest.mark.db
+def test_watch_ends_when_listen_connection_is_lost(db_url):
+    """Losing the shared connection ends every watch instead of hanging."""
+    jobs = JobManager(db_url)
+    watcher = jobs.watch(keepalive_seconds=0.05)
+    try:
+        next(watcher)
+        backend = get_listener(db_url)._conn.get_backend_pid()
+        conn = psycopg2.connect(db_url)
+        with conn, conn.cursor() as cur:
+            cur.execute('SELECT pg_terminate_backend(%s)', (backend,))
+        conn.close()
+        assert all(kind == 'keepalive' for kind, _ in watcher)
+    finally:
+        watcher.close()
+
+
+@pytest.mark.db
+def test_listen_failure_is_raised(db_url, monkeypatch):
+    """A LISTEN that fails surfaces from watch() and leaves no connection."""
+    listener = get_listener(db_url)
+    assert _wait_for(lambda: listener._conn is None)
+    monkeypatch.setattr(jobs_module, 'EVENTS_CHANNEL', '1 invalid')
+    with pytest.raises(psycopg2.Error):
+        next(JobManager(db_url).watch())
+    assert listener._conn is None
+
+
+# --- /pull_data/events ---
+
+@pytest.mark.web
+def test_events_stream_headers_and_snapshot(app, client):
+    """The stream is an uncached event-stream that starts with a snapshot."""
+    app.config['EVENTS_MAX_SECONDS'] = 0
+    resp = client.get('/pull_data/events')
+    assert resp.mimetype == 'text/event-stream'
+    assert resp.headers['Cache-Control'] == 'no-cache'
+    body = resp.get_data(as_text=True)
+    assert body.startswith('retry: 3000\n\n')
+    assert _events(body) == [('snapshot', {
+        'job': None, 'data_version': app.config['ANALYSIS_CACHE'].version,
+    })]
+
+
+@pytest.mark.web
+def test_events_stream_keepalive(app, client):
+    """Silence is broken by comment lines so proxies keep the connection."""
+    app.config['EVENTS_KEEPALIVE_SECONDS'] = 0.02
+    app.config['EVENTS_MAX_SECONDS'] = 0.1
+    body = client.get('/pull_data/events').get_data(as_text=True)
+    assert ': keepalive\n\n' in body
+
+
+@pytest.mark.buttons
+def test_events_stream_pushes_progress_and_done(app, client):
+    """A job running elsewhere shows up as progress, then done."""
+    app.config['EVENTS_KEEPALIVE_SECONDS'] = 0.05
+    app.config['EVENTS_MAX_SECONDS'] = 1.0
+    jobs = JobManager(app.config['DATABASE_URL'])
+    job_id = jobs.start()
+
+    def _work():
+        jobs.progress(job_id, COUNTERS)
+        jobs.finish(job_id, 'succeeded', COUNTERS)
+
+    timer = threading.Timer(0.2, _work)
+    timer.start()
+    body = client.get('/pull_data/events').get_data(as_text=True)
+    timer.join()
+
+    kinds = [kind for kind, _ in _events(body)]
+    assert kinds[0] == 'snapshot'
+    assert 'progress' in kinds
+    assert kinds[-1] == 'done'
+    done = _events(body)[-1][1]['job']
+    assert (done['id'], done['status'], done['waits']) == (
+        job_id, 'succeeded', 2)
+
+
+@pytest.mark.web
+def test_events_stream_limit(app, client):
+    """Streams past EVENTS_MAX_STREAMS are refused; closed ones free a slot."""
+    app.config['EVENTS_MAX_SECONDS'] = 0
+    app.config['EVENTS_MAX_STREAMS'] = 1
+    for _ in range(2):
+        resp = client.get('/pull_data/events')
+        assert resp.status_code == 200
+        resp.close()
+    app.config['EVENTS_MAX_STREAMS'] = 0
+    resp = client.get('/pull_data/events')
+    assert resp.status_code == 503
+    assert resp.headers['Retry-After'] == '3'
+
+
+# --- rate-limit waits ---
+
+@pytest.mark.buttons
+def test_pull_records_rate_limit_waits(db_url):
+    """Sleeps reported by the scraper are counted on the job."""
+    def waiting_scraper(on_wait):
+        on_wait(0.25)
+        on_wait(0.5)
+        return list(SAMPLE_RECORDS)
+
+    app = create_app({
+        'DATABASE_URL': db_url,
+        'TESTING': True,
+        'SCRAPER_FUNC': waiting_scraper,
+        'LOADER_FUNC': _fake_loader,
+    })
+    app.test_client().post('/pull_data')
+    last = app.config['JOBS'].latest_finished()
+    assert last['status'] == 'succeeded'
+    assert last['waits'] == 2
+    assert last['wait_seconds'] == pytest.approx(0.75)
@@ -132,24 +132,44 @@ def test_main_calls_run(monkeypatch):
         def run(self, **kw):
             called['run'] = kw
 
+    for name in ('HOST', 'PORT', 'FLASK_DEBUG'):
+        monkeypatch.delenv(name, raising=False)
     monkeypatch.setattr('src.app.create_app', lambda: FakeApp())
     main()
     assert 'run' in called
     assert called['run']['port'] == 5000
+    assert called['run']['debug'] is False
+
+
+@pytest.mark.web
+def test_main_reads_environment(monkeypatch):
+    """HOST, PORT and FLASK_DEBUG override the dev-server defaults."""
+    called = {}
+
+    class FakeApp:
+        def run(self, **kw):
+            called.update(kw)
+
+    monkeypatch.setenv('HOST', '0.0.0.0')
+    monkeypatch.setenv('PORT', '8080')
+    monkeypatch.setenv('FLASK_DEBUG', '1')
+    monkeypatch.setattr('src.app.create_app', lambda: FakeApp())
+    main()
+    assert called == {'host': '0.0.0.0', 'port': 8080, 'debug': True}
 
 
 # --- Default scraper / loader wrappers ---
 
 @pytest.mark.web
 def test_default_scraper_executes(monkeypatch):
-    """_default_scraper should delegate to scrape.scrape_data."""
+    """_default_scraper should delegate to scrape.fetch_pages."""
     from src.app import _default_scraper
     monkeypatch.setattr(
-        'src.scrape.scrape_data',
-        lambda **kw: [{'fake': True}]
+        'src.scrape.fetch_pages',
+        lambda **kw: iter(['<html></html>'])
     )
     result = _default_scraper()
-    assert result == [{'fake': True}]
+    assert list(result) == ['<html></html>']
 
 
 @pytest.mark.web
@@ -182,6 +202,11 @@ def test_pull_data_uses_thread_when_not_testing(db_url):
     client = app.test_client()
     resp = client.post('/pull_data')
     assert resp.status_code == 200
-    # Wait briefly for the background thread
-    time.sleep(1)
-    assert app.config['_busy'] is False
+    # Wait for the background job to finish
+    for _ in range(50):
+        if not client.get('/status').get_json()['is_running']:
+            break
+        time.sleep(0.1)
+    status = client.get('/status').get_json()
+    assert status['is_running'] is False
+    assert status['last_pull']['status'] == 'succeeded'
@@ -0,0 +1,232 @@
+"""
+test_jobs.py - Tests for the Postgres-backed pull job manager.
+
+Covers the single-job lease, stale-lease expiry, lease renewal,
+throttled progress heartbeats, cancellation, timeouts, and the
+/pull_data routes.
+
+Author: Jie Xu
+"""
+
+import time
+
+import psycopg2
+import pytest
+
+from src.app import create_app
+from src.jobs import JobCancelled, JobManager, JobTimedOut
+from tests.conftest import _fake_loader
+
+COUNTERS = {'pages': 2, 'fetched': 40, 'inserted': 30, 'batches': 1}
+
+
+@pytest.fixture()
+def jobs(db_url):
+    """A manager with a heartbeat interval long enough to test throttling."""
+    return JobManager(db_url, heartbeat_seconds=60)
+
+
+def _sql(db_url, sql):
+    """Run one statement against the test DB."""
+    conn = psycopg2.connect(db_url)
+    cur = conn.cursor()
+    cur.execute(sql)
+    conn.commit()
+    cur.close()
+    conn.close()
+
+
+# --- lease ---
+
+@pytest.mark.db
+def test_only_one_job_can_run(jobs, db_url):
+    """A second start(), even from another manager, gets None."""
+    job_id = jobs.start()
+    assert job_id is not None
+    assert jobs.start() is None
+    assert JobManager(db_url).start() is None
+
+    jobs.finish(job_id, 'succeeded', COUNTERS)
+    assert jobs.current() is None
+    assert jobs.start() is not None
+
+
+@pytest.mark.db
+def test_expired_lease_is_released(jobs, db_url):
+    """A job whose owner stopped heartbeating is failed and freed."""
+    job_id = jobs.start()
+    _sql(db_url, "UPDATE ingest_jobs SET lease_expires_at = now() - "
+                 "interval '1 second'")
+    assert jobs.current() is None
+    last = jobs.latest_finished()
+    assert last['id'] == job_id
+    assert last['status'] == 'failed'
+    assert last['error'] == 'lease expired'
+
+    # The original owner finds out at its next heartbeat
+    with pytest.raises(JobCancelled):
+        jobs.progress(job_id, COUNTERS, force=True)
+
+
+
+@pytest.mark.db
+def test_keep_alive_renews_lease(db_url):
+    """Work without progress reports keeps the job past lease_seconds."""
+    jobs = JobManager(db_url, lease_seconds=0.3)
+    job_id = jobs.start()
+    with jobs.keep_alive(job_id):
+        time.sleep(0.8)
+        assert JobManager(db_url).start() is None
+    assert jobs.finish(job_id, 'succeeded', COUNTERS) is True
+
+
+@pytest.mark.db
+def test_run_after_lost_lease_is_not_success(jobs, db_url):
+    """A job whose lease was expired elsewhere is not marked succeeded."""
+    job_id = jobs.start()
+
+    def work(progress):
+        _sql(db_url, "UPDATE ingest_jobs SET lease_expires_at = now() - "
+                     "interval '1 second'")
+        assert jobs.current() is None
+        return COUNTERS
+
+    assert jobs.run(job_id, work) is None
+    assert jobs.latest_finished()['error'] == 'lease expired'
+
+
+# --- progress ---
+
+@pytest.mark.db
+def test_progress_updates_counters_and_is_throttled(jobs):
+    """The first heartbeat is written; ones right after it are skipped."""
+    job_id = jobs.start()
+    jobs.progress(job_id, COUNTERS)
+    jobs.progress(job_id, dict(COUNTERS, pages=9))
+    job = jobs.current()
+    assert job['pages'] == 2
+    assert job['fetched'] == 40
+    assert job['inserted'] == 30
+    assert job['records_per_sec'] >= 0
+
+    jobs.progress(job_id, dict(COUNTERS, pages=9), force=True)
+    assert jobs.current()['pages'] == 9
+
+
+@pytest.mark.db
+def test_cancel_stops_running_job(jobs):
+    """cancel() flags the job; the next heartbeat raises JobCancelled."""
+    assert jobs.cancel() is False
+    job_id = jobs.start()
+    assert jobs.cancel() is True
+    with pytest.raises(JobCancelled):
+        jobs.progress(job_id, COUNTERS, force=True)
+
+
+@pytest.mark.db
+def test_deadline_raises_timed_out(db_url):
+    """A job past its deadline is told to stop at its next heartbeat."""
+    jobs = JobManager(db_url, timeout_seconds=0)
+    job_id = jobs.start()
+    with pytest.raises(JobTimedOut):
+        jobs.progress(job_id, COUNTERS)
+
+
+@pytest.mark.db
+def test_finish_rejects_unknown_status(jobs):
+    """Only terminal states are accepted."""
+    with pytest.raises(ValueError):
+        jobs.finish(1, 'running')
+
+
+# --- run ---
+
+@pytest.mark.db
+def test_run_records_success(jobs):
+    """run() stores the final counters and marks the job succeeded."""
+    job_id = jobs.start()
+
+    def work(progress):
+        progress(COUNTERS)
+        return dict(COUNTERS, seconds=0.1)
+
+    assert jobs.run(job_id, work)['inserted'] == 30
+    last = jobs.latest_finished()
+    assert last['status'] == 'succeeded'
+    assert last['fetched'] == 40
+
+
+@pytest.mark.db
+def test_run_records_cancellation(jobs):
+    """A cancelled job ends as 'cancelled' and run() returns None."""
+    job_id = jobs.start()
+    jobs.cancel()
+    assert jobs.run(job_id, lambda progress: progress(COUNTERS)) is None
+    assert jobs.latest_finished()['status'] == 'cancelled'
+
+
+@pytest.mark.db
+def test_run_records_timeout(db_url):
+    """A job past its deadline ends as 'timed_out'."""
+    jobs = JobManager(db_url, timeout_seconds=0)
+    job_id = jobs.start()
+    assert jobs.run(job_id, lambda progress: progress(COUNTERS)) is None
+    assert jobs.latest_finished()['status'] == 'timed_out'
+
+
+@pytest.mark.db
+def test_run_records_failure_and_reraises(jobs):
+    """Any other error marks the job failed and propagates."""
+    job_id = jobs.start()
+
+    def work(progress):
+        raise ConnectionError('network gone')
+
+    with pytest.raises(ConnectionError):
+        jobs.run(job_id, work)
+    last = jobs.latest_finished()
+    assert last['status'] == 'failed'
+    assert 'network gone' in last['error']
+    assert jobs.start() is not None
+
+
+# --- routes ---
+
+@pytest.mark.buttons
+def test_cancel_route(app, client):
+    """/pull_data/cancel flags the running job, or reports nothing to do."""
+    assert client.post('/pull_data/cancel').get_json()['cancelled'] is False
+    job_id = app.config['JOBS'].start()
+    resp = client.post('/pull_data/cancel')
+    assert resp.status_code == 200
+    assert resp.get_json()['cancelled'] is True
+    app.config['JOBS'].finish(job_id, 'cancelled')
+
+
+@pytest.mark.buttons
+def test_pull_data_reports_job_id(client):
+    """A started pull returns its job id, which /status then reports."""
+    job_id = client.post('/pull_data').get_json()['job_id']
+    assert client.get('/status').get_json()['last_pull']['status'] == \
+        'succeeded'
+    assert isinstance(job_id, int)
+
+
+@pytest.mark.buttons
+def test_pull_failure_is_not_masked_by_cleanup(db_url, monkeypatch):
+    """If the cube rebuild also fails, the job keeps the pipeline's error."""
+    def broken_scraper(on_wait):
+        raise ConnectionError('network gone')
+
+    def broken_refresh(url):
+        raise psycopg2.OperationalError('cube rebuild failed')
+
+    monkeypatch.setattr('src.app.refresh_cube', broken_refresh)
+    app = create_app({'DATABASE_URL': db_url, 'TESTING': True,
+                      'SCRAPER_FUNC': broken_scraper,
+                      'LOADER_FUNC': _fake_loader})
+    version = app.config['ANALYSIS_CACHE'].version
+    with pytest.raises(ConnectionError):
+        app.test_client().post('/pull_data')
+    assert 'network gone' in app.config['JOBS'].latest_finished()['error']
+    assert app.config['ANALYSIS_CACHE'].version != version
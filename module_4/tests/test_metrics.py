@@ -0,0 +1,145 @@
+"""
+test_metrics.py - Tests for query instrumentation and /metrics.
+
+Checks the QueryMetrics registry, the execute() wrapper (timings, row
+counts, optional EXPLAIN plans), both /metrics output formats and the
+query_data --profile flag.
+
+Author: Jie Xu
+"""
+
+import pytest
+import psycopg2
+
+from src import metrics
+
+
+@pytest.fixture()
+def registry():
+    """A clean global registry for each test."""
+    metrics.REGISTRY.reset()
+    metrics.REGISTRY.explain = False
+    yield metrics.REGISTRY
+    metrics.REGISTRY.reset()
+    metrics.REGISTRY.explain = False
+
+
+# --- QueryMetrics ---
+
+@pytest.mark.analysis
+def test_record_accumulates():
+    """Calls, totals, max and the latest values are tracked per name."""
+    reg = metrics.QueryMetrics()
+    reg.record('q1', 0.2, 1)
+    reg.record('q1', 0.1, 3, plan='Seq Scan')
+    reg.record('custom_1', 0.5, 10)
+    snap = reg.snapshot()
+
+    assert list(snap) == ['custom_1', 'q1']
+    q1 = snap['q1']
+    assert q1['calls'] == 2
+    assert q1['total_seconds'] == pytest.approx(0.3)
+    assert q1['avg_seconds'] == pytest.approx(0.15)
+    assert q1['max_seconds'] == 0.2
+    assert q1['last_seconds'] == 0.1
+    assert q1['last_rows'] == 3
+    assert q1['plan'] == 'Seq Scan'
+
+
+@pytest.mark.analysis
+def test_prometheus_format():
+    """Prometheus output has HELP/TYPE lines and labelled samples."""
+    reg = metrics.QueryMetrics()
+    reg.record('q7', 0.25, 1)
+    text = reg.prometheus()
+
+    assert '# TYPE gradcafe_query_duration_seconds summary' in text
+    assert 'gradcafe_query_duration_seconds_sum{query="q7"} 0.250000' in text
+    assert 'gradcafe_query_duration_seconds_count{query="q7"} 1' in text
+    assert '# TYPE gradcafe_query_last_rows gauge' in text
+    assert 'gradcafe_query_last_rows{query="q7"} 1' in text
+    assert text.endswith('\n')
+
+
+# --- execute() wrapper ---
+
+@pytest.mark.db
+def test_execute_records_timing_and_rows(db_url, registry):
+    """The wrapper runs the query and leaves rows on the cursor."""
+    conn = psycopg2.connect(db_url)
+    try:
+        cur = conn.cursor()
+        metrics.execute(cur, 'probe', 'SELECT generate_series(1, 4)')
+        assert len(cur.fetchall()) == 4
+    finally:
+        conn.close()
+    stats = registry.snapshot()['probe']
+    assert stats['calls'] == 1
+    assert stats['last_rows'] == 4
+    assert stats['plan'] is None
+
+
+@pytest.mark.db
+def test_execute_captures_explain_plan(db_url, registry):
+    """With explain on, the EXPLAIN (ANALYZE, BUFFERS) plan is kept."""
+    registry.explain = True
+    conn = psycopg2.connect(db_url)
+    try:
+        cur = conn.cursor()
+        metrics.execute(cur, 'probe', 'SELECT COUNT(*) FROM applicants')
+        assert cur.fetchone() == (0,)
+    finally:
+        conn.close()
+    plan = registry.snapshot()['probe']['plan']
+    assert 'actual time' in plan
+    assert 'applicants' in plan
+
+
+# --- /metrics endpoint ---
+
+@pytest.mark.web
+def test_metrics_json_after_page_load(client, registry):
+    """Rendering the dashboard records its named queries."""
+    client.post('/pull_data')
+    client.get('/')
+    data = client.get('/metrics').get_json()
+    assert data['explain'] is False
+    assert {'scalars', 'custom_1', 'custom_2'} <= set(data['queries'])
+    assert data['queries']['scalars']['calls'] == 1
+
+
+@pytest.mark.web
+def test_metrics_prometheus_by_param_and_accept(client, registry):
+    """?format=prometheus or a text/plain Accept header selects Prometheus."""
+    client.get('/')
+    resp = client.get('/metrics?format=prometheus')
+    assert resp.mimetype == 'text/plain'
+    assert 'gradcafe_query_duration_seconds_count{query="scalars"} 1' in (
+        resp.data.decode()
+    )
+
+    scraper_accept = (
+        'application/openmetrics-text;version=1.0.0;q=0.75,'
+        'text/plain;version=0.0.4;q=0.5,*/*;q=0.1'
+    )
+    resp = client.get('/metrics', headers={'Accept': scraper_accept})
+    assert resp.mimetype == 'text/plain'
+
+
+# --- query_data --profile ---
+
+@pytest.mark.db
+def test_query_data_main_profile(monkeypatch, client, db_url, capsys,
+                                 registry):
+    """--profile times and explains each of q1..custom_2."""
+    from src import query_data as qd
+    client.post('/pull_data')
+    monkeypatch.setattr(qd, 'get_database_url', lambda: db_url)
+    qd.main(['--profile'])
+    out = capsys.readouterr().out
+
+    assert 'QUERY PROFILE' in out
+    assert '--- q7 (last statement) ---' in out
+    assert 'actual time' in out
+    assert set(registry.snapshot()) == set(qd.PROFILED_QUERIES)
+    assert registry.explain is False
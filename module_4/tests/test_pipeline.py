@@ -0,0 +1,196 @@
+"""
+test_pipeline.py - Tests for the concurrent ingest pipeline.
+
+Runs fetch -> parse -> write with fake pages and loaders (no network,
+no database) and checks batching, early stop on an empty page, error
+propagation and cancellation of the other stages.
+
+Author: Jie Xu
+"""
+
+import itertools
+import time
+
+import pytest
+
+from src.pipeline import parse_item, run_pipeline
+from tests.test_scrape import FAKE_HTML, EMPTY_HTML
+
+
+def _records(n):
+    """n distinct fake applicant dicts."""
+    return [{'url': f'https://gradcafe.com/result/{i}'} for i in range(n)]
+
+
+class _Recorder:
+    """Loader that remembers every batch and claims all rows are new."""
+
+    def __init__(self, delay=0.0):
+        self.batches = []
+        self.delay = delay
+
+    def __call__(self, batch, database_url):
+        time.sleep(self.delay)
+        self.batches.append((list(batch), database_url))
+        return len(batch)
+
+
+@pytest.mark.integration
+def test_parse_item_html_and_passthrough():
+    """HTML pages are parsed; dicts pass through untouched."""
+    assert len(parse_item(FAKE_HTML)) == 1
+    assert parse_item(EMPTY_HTML) == []
+    assert parse_item({'url': 'x'}) == [{'url': 'x'}]
+
+
+@pytest.mark.integration
+def test_pipeline_batches_records():
+    """Records are handed to the loader in batches of batch_size."""
+    loader = _Recorder()
+    stats = run_pipeline(_records(5), loader, 'postgresql://x', batch_size=2)
+
+    assert sorted(len(b) for b, _ in loader.batches) == [1, 2, 2]
+    assert all(url == 'postgresql://x' for _, url in loader.batches)
+    assert stats['pages'] == 5
+    assert stats['fetched'] == 5
+    assert stats['inserted'] == 5
+    assert stats['batches'] == 3
+    assert stats['seconds'] >= 0
+
+
+@pytest.mark.integration
+def test_pipeline_stops_at_empty_page():
+    """An empty page ends the pull even if the source never ends."""
+    pages = itertools.chain([FAKE_HTML], itertools.repeat(EMPTY_HTML))
+    loader = _Recorder()
+    stats = run_pipeline(pages, loader, 'postgresql://x', parse_workers=1)
+    assert stats['fetched'] == 1
+    assert len(loader.batches) == 1
+
+
+@pytest.mark.integration
+def test_pipeline_closes_generator_source():
+    """Generator sources are closed once the pipeline is done with them."""
+    closed = []
+
+    def source():
+        try:
+            yield FAKE_HTML
+            while True:
+                yield EMPTY_HTML
+        finally:
+            closed.append(True)
+
+    run_pipeline(source(), _Recorder(), 'postgresql://x')
+    assert closed == [True]
+
+
+@pytest.mark.integration
+def test_pipeline_inserted_unknown_when_loader_returns_none():
+    """A loader that does not report counts makes 'inserted' None."""
+    stats = run_pipeline(_records(3), lambda b, u: None, 'postgresql://x')
+    assert stats['fetched'] == 3
+    assert stats['inserted'] is None
+
+
+@pytest.mark.integration
+def test_pipeline_many_workers_small_queues():
+    """Backpressure with tiny queues still delivers every record once."""
+    loader = _Recorder(delay=0.02)
+
+    def slow_parse(item):
+        time.sleep(0.15)
+        return [item]
+
+    stats = run_pipeline(
+        _records(12), loader, 'postgresql://x', parse_fn=slow_parse,
+        parse_workers=3, write_workers=2, queue_size=1, batch_size=1,
+    )
+    written = sorted(r['url'] for b, _ in loader.batches for r in b)
+    assert written == sorted(r['url'] for r in _records(12))
+    assert stats['inserted'] == 12
+
+
+@pytest.mark.integration
+def test_pipeline_loader_error_cancels_stages():
+    """A loader failure stops fetch/parse and is re-raised to the caller."""
+    def bad_loader(batch, url):
+        time.sleep(0.3)  # let upstream fill its queues first
+        raise RuntimeError('db down')
+
+    with pytest.raises(RuntimeError, match='db down'):
+        run_pipeline(_records(50), bad_loader, 'postgresql://x',
+                     queue_size=1, batch_size=1)
+
+
+@pytest.mark.integration
+def test_pipeline_parse_error_cancels_stages():
+    """A parse failure stops the writer and fetcher too."""
+    def bad_parse(item):
+        time.sleep(0.3)
+        raise ValueError('bad page')
+
+    with pytest.raises(ValueError, match='bad page'):
+        run_pipeline(_records(50), _Recorder(), 'postgresql://x',
+                     parse_fn=bad_parse, parse_workers=1, queue_size=1)
+
+
+@pytest.mark.integration
+def test_pipeline_fetch_error_is_raised():
+    """An exception from the page source surfaces from run_pipeline."""
+    def source():
+        yield {'url': 'a'}
+        raise ConnectionError('network gone')
+
+    with pytest.raises(ConnectionError):
+        run_pipeline(source(), _Recorder(), 'postgresql://x')
+
+
+@pytest.mark.integration
+def test_pipeline_reports_progress():
+    """on_progress sees the counters grow up to the final totals."""
+    seen = []
+    stats = run_pipeline(_records(5), _Recorder(), 'postgresql://x',
+                         batch_size=2, on_progress=seen.append)
+    assert seen
+    assert seen[-1]['inserted'] == stats['inserted'] == 5
+    assert max(s['pages'] for s in seen) == 5
+
+
+@pytest.mark.integration
+def test_pipeline_progress_error_cancels_stages():
+    """An exception from on_progress stops the pull and is re-raised."""
+    loader = _Recorder()
+
+    def stop_now(counters):
+        raise InterruptedError('cancelled')
+
+    with pytest.raises(InterruptedError):
+        run_pipeline(itertools.repeat({'url': 'x'}), loader, 'postgresql://x',
+                     on_progress=stop_now)
+    assert loader.batches == []
+
+
+@pytest.mark.integration
+def test_pull_data_runs_through_pipeline(db_url):
+    """/pull_data streams HTML pages through parse into the real loader."""
+    import psycopg2
+    from src.app import create_app
+
+    app = create_app({
+        'DATABASE_URL': db_url,
+        'TESTING': True,
+        'SCRAPER_FUNC': lambda on_wait: iter([FAKE_HTML, EMPTY_HTML]),
+    })
+    client = app.test_client()
+    assert client.post('/pull_data').status_code == 200
+    last = client.get('/status').get_json()['last_pull']
+    assert last['fetched'] == 1
+    assert last['inserted'] == 1
+
+    conn = psycopg2.connect(db_url)
+    cur = conn.cursor()
+    cur.execute("SELECT url FROM applicants")
+    assert cur.fetchall() == [('https://www.thegradcafe.com/result/123',)]
+    cur.close()
+    conn.close()
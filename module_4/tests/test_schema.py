@@ -0,0 +1,295 @@
+"""
+test_schema.py - Tests for schema migrations and index usage.
+
+Checks that migrations apply once, and uses EXPLAIN to confirm the
+dashboard's filtering queries are served by the new B-tree and
+trigram indexes instead of sequential scans.
+
+Author: Jie Xu
+"""
+
+import re
+from contextlib import contextmanager
+
+import pytest
+import psycopg2
+import psycopg2.extensions
+
+from src import app as app_module
+from src import db
+from src.load_data import MIGRATIONS, migrate
+
+
+# Columns whose filters the migrations are meant to index
+_INDEXED_FILTERS = (
+    "term = ",
+    "term_year = ",
+    "status_category = ",
+    "us_or_international = ",
+    "program ILIKE",
+    "llm_generated_program ILIKE",
+    "llm_generated_university ILIKE",
+    "lower(university)",
+)
+
+
+class _RecordingCursor(psycopg2.extensions.cursor):
+    """Cursor that remembers every SQL string it executes."""
+
+    seen: list = []
+
+    def execute(self, query, vars=None):  # pylint: disable=redefined-builtin
+        _RecordingCursor.seen.append(query)
+        return super().execute(query, vars)
+
+
+def _dashboard_sql(db_url, monkeypatch):
+    """Run run_analysis_queries and return the SQL it issued."""
+    real = db.connection
+
+    @contextmanager
+    def recording(url=None):
+        with real(url) as conn:
+            conn.cursor_factory = _RecordingCursor
+            try:
+                yield conn
+            finally:
+                conn.cursor_factory = psycopg2.extensions.cursor
+
+    _RecordingCursor.seen = []
+    monkeypatch.setattr(db, 'connection', recording)
+    app_module.run_analysis_queries(db_url)
+    return list(_RecordingCursor.seen)
+
+
+@pytest.mark.db
+def test_migrations_recorded_once(db_url):
+    """Every migration is recorded; re-running applies nothing."""
+    assert migrate(db_url) == []
+
+    conn = psycopg2.connect(db_url)
+    cur = conn.cursor()
+    cur.execute("SELECT name FROM schema_migrations ORDER BY name")
+    assert [r[0] for r in cur.fetchall()] == [m[0] for m in MIGRATIONS]
+    cur.close()
+    conn.close()
+
+
+@pytest.mark.db
+def test_indexes_exist(db_url):
+    """The B-tree and trigram indexes are present after migrating."""
+    conn = psycopg2.connect(db_url)
+    cur = conn.cursor()
+    cur.execute(
+        "SELECT indexname FROM pg_indexes WHERE tablename = 'applicants'"
+    )
+    names = {r[0] for r in cur.fetchall()}
+    cur.close()
+    conn.close()
+    assert {
+        'ix_applicants_term',
+        'ix_applicants_us_or_international',
+        'ix_applicants_program_trgm',
+        'ix_applicants_llm_program_trgm',
+        'ix_applicants_llm_university_trgm',
+        'ix_applicants_term_year_season_status',
+        'ix_applicants_status_category',
+        'ix_applicants_university_lower',
+    } <= names
+
+
+@pytest.mark.db
+def test_dashboard_filters_use_indexes(db_url, monkeypatch):
+    """EXPLAIN each filtering query on applicants: none may seq-scan.
+
+    (Queries against the small ``applicant_summary`` table are exempt.)
+    """
+    queries = [
+        q for q in _dashboard_sql(db_url, monkeypatch)
+        if re.search(r'FROM applicants\s', q) and 'WHERE' in q
+        and any(f in q.split('WHERE', 1)[1] for f in _INDEXED_FILTERS)
+    ]
+    assert queries, 'expected filtering queries from the dashboard'
+
+    plans = {}
+    conn = psycopg2.connect(db_url)
+    try:
+        cur = conn.cursor()
+        # An empty table is cheapest to seq-scan; make the planner show
+        # whether an index path exists at all.
+        cur.execute("SET enable_seqscan = off")
+        for query in queries:
+            cur.execute("EXPLAIN " + query)
+            plans[query] = '\n'.join(r[0] for r in cur.fetchall())
+    finally:
+        conn.close()
+
+    for query, plan in plans.items():
+        assert not re.search(r'Seq Scan on applicants\b', plan), \
+            f'{query}\n{plan}'
+        assert 'ix_applicants_' in plan, f'{query}\n{plan}'
+
+
+
+@pytest.mark.db
+def test_status_term_backfill_matches_python(db_url):
+    """The SQL backfill derives the same values as clean.py for old rows."""
+    from src.clean import parse_term, status_category
+
+    samples = [
+        ('Accepted via E-mail', 'Fall 2026'),
+        ('Rejected', 'Spring 2025'),
+        ('Wait listed', 'summer2024'),
+        ('Interview', 'Winter 2023'),
+        ('Pending', '2022'),
+        ('  ', 'TBD'),
+        (None, None),
+    ]
+    conn = psycopg2.connect(db_url)
+    cur = conn.cursor()
+    for i, (status, term) in enumerate(samples):
+        cur.execute(
+            "INSERT INTO applicants (url, status, term) VALUES (%s, %s, %s)",
+            (f'backfill-{i}', status, term),
+        )
+    # Pretend these rows predate the migration, then re-apply it
+    cur.execute(
+        "DELETE FROM schema_migrations WHERE name = '003_status_term_columns'"
+    )
+    conn.commit()
+    assert migrate(db_url) == ['003_status_term_columns']
+
+    cur.execute(
+        "SELECT status_category::text, term_season, term_year "
+        "FROM applicants ORDER BY url"
+    )
+    got = cur.fetchall()
+    cur.close()
+    conn.close()
+    expected = [
+        (status_category(status), *parse_term(term))
+        for status, term in samples
+    ]
+    assert got == expected
+
+
+@pytest.mark.db
+def test_split_university_backfill(db_url):
+    """Old combined program values are split into program + university."""
+    conn = psycopg2.connect(db_url)
+    cur = conn.cursor()
+    cur.execute(
+        "INSERT INTO applicants (url, program) VALUES "
+        "('split-1', 'Computer Science, Stanford University'), "
+        "('split-2', 'Physics at MIT'), "
+        "('split-3', 'Undeclared'), "
+        "('split-4', NULL), "
+        "('split-5', 'Computer Science, "
+        "University of North Carolina at Chapel Hill'), "
+        "('split-6', 'Data Science (MS), Stanford University')"
+    )
+    cur.execute(
+        "DELETE FROM schema_migrations WHERE name = '005_split_university'"
+    )
+    conn.commit()
+    assert migrate(db_url) == ['005_split_university']
+
+    cur.execute("SELECT program, university FROM applicants ORDER BY url")
+    rows = cur.fetchall()
+    cur.close()
+    conn.close()
+    assert rows == [
+        ('Computer Science', 'Stanford University'),
+        ('Physics', 'MIT'),
+        ('Undeclared', None),
+        (None, None),
+        ('Computer Science', 'University of North Carolina at Chapel Hill'),
+        ('Data Science (MS)', 'Stanford University'),
+    ]
+
+
+@pytest.mark.db
+def test_split_university_backfill_in_batches(db_url, monkeypatch):
+    """The backfill flushes updates every DEFAULT_BATCH_SIZE rows."""
+    from src import load_data
+    monkeypatch.setattr(load_data, 'DEFAULT_BATCH_SIZE', 2)
+    conn = psycopg2.connect(db_url)
+    cur = conn.cursor()
+    for i in range(5):
+        cur.execute(
+            "INSERT INTO applicants (url, program) VALUES (%s, %s)",
+            (f'batch-{i}', f'Program {i}, School {i}'),
+        )
+    cur.execute(
+        "DELETE FROM schema_migrations WHERE name = '005_split_university'"
+    )
+    conn.commit()
+    migrate(db_url)
+
+    cur.execute("SELECT COUNT(*) FROM applicants WHERE university LIKE 'School %'")
+    assert cur.fetchone()[0] == 5
+    cur.close()
+    conn.close()
+
+
+# --- applicant_summary ---
+
+_SUMMARY_CHECK_SQL = """
+SELECT coalesce(term_year, 0), coalesce(term_season, 0),
+       coalesce(status_category::text, ''),
+       coalesce(us_or_international, ''), coalesce(degree, ''),
+       COUNT(*), COUNT(gpa), COUNT(gre_aw)
+FROM applicants GROUP BY 1, 2, 3, 4, 5 ORDER BY 1, 2, 3, 4, 5
+"""
+
+
+def _summary_rows(db_url):
+    """(summary table rows, same aggregates recomputed from applicants)."""
+    conn = psycopg2.connect(db_url)
+    cur = conn.cursor()
+    cur.execute(
+        "SELECT term_year, term_season, status_category, "
+        "us_or_international, degree, applicants, gpa_n, gre_aw_n "
+        "FROM applicant_summary ORDER BY 1, 2, 3, 4, 5"
+    )
+    summary = cur.fetchall()
+    cur.execute(_SUMMARY_CHECK_SQL)
+    expected = cur.fetchall()
+    cur.close()
+    conn.close()
+    return summary, expected
+
+
+@pytest.mark.db
+@pytest.mark.parametrize('method', ['values', 'copy'])
+def test_summary_tracks_inserts(db_url, method):
+    """Each load batch is folded into the summary; duplicates are not."""
+    from src.load_data import load_records
+    from tests.conftest import SAMPLE_RECORDS
+
+    load_records(SAMPLE_RECORDS[:2], db_url, method=method)
+    load_records(SAMPLE_RECORDS, db_url, method=method, batch_size=2)
+    summary, expected = _summary_rows(db_url)
+    assert summary == expected
+    assert sum(r[5] for r in summary) == len(SAMPLE_RECORDS)
+
+
+@pytest.mark.db
+def test_refresh_summary_repairs_drift(db_url):
+    """refresh_summary rebuilds the table after untracked UPDATEs."""
+    from src.load_data import insert_records, refresh_summary
+    from tests.conftest import SAMPLE_RECORDS
+
+    insert_records(SAMPLE_RECORDS, db_url)
+    conn = psycopg2.connect(db_url)
+    cur = conn.cursor()
+    cur.execute("UPDATE applicants SET degree = 'Masters'")
+    conn.commit()
+    cur.close()
+    conn.close()
+    summary, expected = _summary_rows(db_url)
+    assert summary != expected
+
+    refresh_summary(db_url)
+    summary, expected = _summary_rows(db_url)
+    assert summary == expected
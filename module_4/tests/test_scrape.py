@@ -351,3 +351,32 @@ def test_scrape_data_with_decision_filter(monkeypatch):
     )
     data = scrape_data(result_type='accepted', num_pages=1, delay=0)
     assert data == []
+
+
+@pytest.mark.web
+def test_fetch_pages_reports_waits(monkeypatch):
+    """on_wait hears about the politeness delay and error back-offs."""
+    from src.scrape import fetch_pages
+    monkeypatch.setattr('src.scrape.time.sleep', lambda _: None)
+
+    class FakeResp:
+        def read(self):
+            return FAKE_HTML.encode()
+        def __enter__(self):
+            return self
+        def __exit__(self, *a):
+            pass
+
+    calls = {'n': 0}
+
+    def flaky_urlopen(req, timeout=15):
+        calls['n'] += 1
+        if calls['n'] == 1:
+            raise URLError('reset')
+        return FakeResp()
+
+    monkeypatch.setattr('src.scrape.urlopen', flaky_urlopen)
+    waits = []
+    pages = list(fetch_pages(num_pages=2, delay=0, on_wait=waits.append))
+    assert len(pages) == 1
+    assert waits == [5, 0]